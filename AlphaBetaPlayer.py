@@ -0,0 +1,336 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : A computer player for Scalable Pentago.  It searches every move (node x sub-board x direction) with
+#               alpha-beta pruning and deepens the search one turn at a time until its time for the move runs
+#               out.  Moves are ordered with killer moves and a history table so that the best moves are tried
+#               first and more of the tree is pruned.  Games with more than 2 players are searched with the
+#               paranoid assumption: every other player is treated as working together against the computer.
+#               Positions that were already searched are remembered in a transposition table, and positions in an
+#               opening book are played straight from the book without being searched.  Positions are scored by
+#               the threats (sequences only one player has marbles in) of each player, which are counted
+#               incrementally, and the last level of the search scores all of a position's moves in one pass.
+
+# Importing time so that the search can stop when its time for the move runs out.
+import time
+
+# Importing random so that each player the computer searches for gets its own transposition table keys.
+import random
+
+# Importing the transposition table so that positions reached through different move orders are only searched once.
+import TranspositionTable
+
+# Importing the symmetries so that mirrored and rotated copies of a position can share transposition table entries.
+import Symmetry
+
+# Importing the threat counts that positions are scored with.
+import ThreatEvaluator
+
+
+# The score of a won position.  The number of turns it takes to win is subtracted so that quicker wins are preferred.
+WIN_SCORE = 10 ** 12
+
+# How many nodes are searched between checks of the clock.
+NODES_PER_CLOCK_CHECK = 256
+
+# How many killer moves are remembered for each depth of the search.
+KILLERS_PER_PLY = 2
+
+
+class SearchTimeout(Exception):
+    """Raised inside of the search when the time for the move has run out."""
+
+
+class AlphaBetaPlayer:
+    """Chooses moves for whichever player's turn it is in a PentagoEngine.  The engine is searched in place with
+    apply and undo, and it is always returned in the same position it was passed in."""
+
+    def __init__(self, time_limit=5.0, max_depth=None, table_megabytes=TranspositionTable.DEFAULT_MEGABYTES,
+                 use_symmetry=False, book=None, weights=None):
+        """Creates a player that thinks for at most time_limit seconds per move.  A max_depth stops the deepening
+        early, which is useful for tests and for weaker opponents.  The transposition table takes up about
+        table_megabytes of memory.  With use_symmetry, positions are stored under their canonical form so that
+        symmetric positions share entries; it costs more per position, so it pays off on smaller boards.  A book is
+        an OpeningBook whose moves are played instead of searching whenever it holds the position.  The weights are
+        the ThreatEvaluator table that positions are scored with, or None for its default."""
+        self.__time_limit = time_limit
+        self.__max_depth = max_depth
+        self.__table = TranspositionTable.TranspositionTable(table_megabytes)
+        self.__use_symmetry = use_symmetry
+        self.__book = book
+        self.__weights = weights
+        self.__evaluator = None
+        self.__evaluator_configuration = None
+
+        # Search state that is reset for every move.
+        self.__deadline = 0.0
+        self.__root_player = 0
+        self.__root_keys = []
+        self.__nodes = 0
+        self.__killers = []
+        self.__history_scores = {}
+
+        # Statistics of the last search, for anyone tuning the player.
+        self.__last_depth = 0
+        self.__last_nodes = 0
+        self.__last_score = 0
+
+    def get_last_depth(self):
+        """Gets the deepest search that was completed for the last move."""
+        return self.__last_depth
+
+    def get_last_nodes(self):
+        """Gets the number of positions that were searched for the last move."""
+        return self.__last_nodes
+
+    def get_last_score(self):
+        """Gets the score of the last chosen move from the point of view of the player that chose it."""
+        return self.__last_score
+
+    def choose_move(self, engine):
+        """Returns the best move the player can find for the player whose turn it is.  Raises a ValueError if the
+        game is already over."""
+        if engine.is_terminal():
+            raise ValueError("The game is over.  No more moves can be made.")
+
+        # Playing the opening book's move if it holds the position.  The book's depth and score are reported as if
+        # the move had been searched just now.  This comes before the moves are listed, since the book's positions
+        # are the early ones where there are the most of them.
+        if self.__book is not None:
+            entry = self.__book.lookup(engine)
+            if entry is not None:
+                move, self.__last_score, self.__last_depth = entry
+                self.__last_nodes = 0
+                return move
+        moves = list(engine.distinct_moves())
+
+        # Resetting the search state.  The history table is kept small by starting fresh each move.
+        self.__deadline = time.perf_counter() + self.__time_limit
+        self.__root_player = engine.get_current_player()
+        self.__nodes = 0
+        self.__killers = []
+        self.__history_scores = {}
+        self.__table.new_search()
+
+        # The evaluator is kept from move to move, since it only has to catch up on the marbles that changed.
+        if self.__evaluator_configuration != engine.get_configuration():
+            self.__evaluator = ThreatEvaluator.ThreatEvaluator(engine, self.__weights)
+            self.__evaluator_configuration = engine.get_configuration()
+
+        # Scores are stored from the point of view of the player the search is for, so a random number for how many
+        # turns away that player is gets mixed into the position's hash.
+        self.__root_keys = [random.Random(offset).getrandbits(64) for offset in range(engine.get_player_count())]
+
+        # Deepening the search one turn at a time.  The best move of the last completed depth is searched first in
+        # the next depth, so a search that runs out of time part way through can still use what it found.
+        best_move = moves[0]
+        best_score = 0
+        depth = 0
+        maximum_depth = engine.get_board_length() ** 2 - engine.get_marble_count()
+        if self.__max_depth is not None:
+            maximum_depth = min(maximum_depth, self.__max_depth)
+        while depth < maximum_depth:
+            depth += 1
+            moves.sort(key=lambda move: move != best_move)
+            move, score, complete = self.search_root(engine, moves, depth)
+            if move is not None:
+                best_move, best_score = move, score
+            if not complete:
+                break
+            self.__last_depth = depth
+
+            # A proven win or loss can't be changed by searching deeper.
+            if abs(best_score) > WIN_SCORE - maximum_depth - 1:
+                break
+
+        self.__last_nodes = self.__nodes
+        self.__last_score = best_score
+        return best_move
+
+    def search_root(self, engine, moves, depth):
+        """Searches every move at the top of the tree.  Returns the best move, its score, and whether every move
+        was searched.  When the clock runs out part way through, the best move found so far is still returned since
+        the first move searched is always the best move of the last depth; if not even that move finished, the
+        returned move is None."""
+        best_move = None
+        best_score = -WIN_SCORE - 1
+        alpha = -WIN_SCORE - 1
+        beta = WIN_SCORE + 1
+        for move in moves:
+            engine.apply(move)
+            try:
+                score = self.search(engine, depth - 1, alpha, beta, 1)
+            except SearchTimeout:
+                return best_move, best_score, False
+            finally:
+                engine.undo()
+            if score > best_score:
+                best_score = score
+                best_move = move
+                alpha = max(alpha, score)
+        return best_move, best_score, True
+
+    def search(self, engine, depth, alpha, beta, ply):
+        """RECURSIVE METHOD : Returns the score of the position from the point of view of the player that the
+        search started for.  That player picks the highest score; every other player picks the lowest."""
+
+        # Checking the clock every so often.
+        self.__nodes += 1
+        if (self.__nodes % NODES_PER_CLOCK_CHECK == 0) and (time.perf_counter() > self.__deadline):
+            raise SearchTimeout()
+
+        # BASE CASE : The game is over or the search has gone deep enough.
+        if engine.is_terminal():
+            return self.terminal_score(engine.winners(), ply)
+        if depth == 0:
+            return self.evaluate(engine)
+
+        # Working out the position's key.  With symmetry, the key and the stored moves belong to the canonical form.
+        current_player = engine.get_current_player()
+        if self.__use_symmetry:
+            position_hash, symmetry = Symmetry.canonical_hash(engine)
+            board_symmetry = Symmetry.get_board_symmetry(engine.get_board_length(), engine.get_sub_board_length())
+        else:
+            position_hash, symmetry = engine.get_hash(), 0
+        key = position_hash ^ self.__root_keys[(self.__root_player - current_player) % engine.get_player_count()]
+
+        # BASE CASE : The transposition table already holds a result that is deep enough to settle this position.
+        entry = self.__table.probe(key)
+        table_move = None
+        if entry is not None:
+            entry_depth, entry_score, entry_kind, entry_move = entry
+            entry_score = score_from_table(entry_score, ply)
+            if entry_depth >= depth:
+                if entry_kind == TranspositionTable.EXACT:
+                    return entry_score
+                if (entry_kind == TranspositionTable.LOWER_BOUND) and (entry_score >= beta):
+                    return entry_score
+                if (entry_kind == TranspositionTable.UPPER_BOUND) and (entry_score <= alpha):
+                    return entry_score
+            if entry_move != TranspositionTable.NO_MOVE:
+                table_move = engine.decode_move(entry_move)
+                if symmetry:
+                    table_move = board_symmetry.transform_move(table_move, Symmetry.INVERSES[symmetry])
+
+        # Ordering the moves so that the ones most likely to cause a cutoff are searched first.  Moves that lead to
+        # the same position as an earlier move are left out.
+        moves = self.order_moves(list(engine.distinct_moves()), ply, table_move)
+        maximizing = current_player == self.__root_player
+
+        # One turn from the bottom of the search, the moves are scored by the evaluator instead of being applied.
+        scores = self.child_scores(engine, moves, ply + 1) if depth == 1 else None
+
+        original_alpha = alpha
+        original_beta = beta
+        best_score = -WIN_SCORE - 1 if maximizing else WIN_SCORE + 1
+        best_move = moves[0]
+        for move in moves:
+            if scores is not None:
+                score = next(scores)
+            else:
+                engine.apply(move)
+                try:
+                    score = self.search(engine, depth - 1, alpha, beta, ply + 1)
+                finally:
+                    engine.undo()
+
+            # Keeping the best score for whoever is moving and narrowing the window.
+            if maximizing:
+                if score > best_score:
+                    best_score = score
+                    best_move = move
+                alpha = max(alpha, score)
+            else:
+                if score < best_score:
+                    best_score = score
+                    best_move = move
+                beta = min(beta, score)
+
+            # Cutting off the rest of the moves when the other side already has a better option elsewhere.
+            if alpha >= beta:
+                self.record_cutoff(move, depth, ply)
+                break
+
+        # Remembering the result.  A score outside of the window that the search started with is only a bound.
+        if best_score <= original_alpha:
+            kind = TranspositionTable.UPPER_BOUND
+        elif best_score >= original_beta:
+            kind = TranspositionTable.LOWER_BOUND
+        else:
+            kind = TranspositionTable.EXACT
+        if symmetry:
+            best_move = board_symmetry.transform_move(best_move, symmetry)
+        self.__table.store(key, depth, score_to_table(best_score, ply), kind, engine.encode_move(best_move))
+
+        return best_score
+
+    def order_moves(self, moves, ply, table_move=None):
+        """Returns the moves sorted so that the transposition table's move comes first, then the killer moves,
+        followed by the moves with the highest history scores."""
+        while len(self.__killers) <= ply:
+            self.__killers.append([])
+        killers = self.__killers[ply]
+        history_scores = self.__history_scores
+
+        def priority(move):
+            if move == table_move:
+                return -2 << 40
+            if move in killers:
+                return -1 << 40
+            return -history_scores.get(move, 0)
+
+        moves.sort(key=priority)
+        return moves
+
+    def record_cutoff(self, move, depth, ply):
+        """Remembers a move that caused a cutoff as a killer for its depth and raises its history score.  Cutoffs
+        that happen higher up in the tree are worth more since they prune more positions."""
+        killers = self.__killers[ply]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[KILLERS_PER_PLY:]
+        self.__history_scores[move] = self.__history_scores.get(move, 0) + depth * depth
+
+    def terminal_score(self, winners, ply):
+        """Returns the score of a finished game from its list of winners.  Winning alone is a win, sharing the win is
+        a draw, and the board filling up without a winner is also a draw."""
+        if not winners:
+            return 0
+        if self.__root_player in winners:
+            return 0 if len(winners) > 1 else WIN_SCORE - ply
+        return -(WIN_SCORE - ply)
+
+    def evaluate(self, engine):
+        """Returns a score for an unfinished position.  Every winning sequence that holds marbles of only one
+        player is a threat worth points to that player; the computer's points count for it and everyone else's
+        count against it."""
+        return self.__evaluator.evaluate(engine, self.__root_player)
+
+    def child_scores(self, engine, moves, ply):
+        """Yields the scores of the positions the moves lead to, the same as searching each of them to a depth of 0
+        would, but worked out by the evaluator without applying the moves.  The scores are worked out as they're
+        asked for, so the moves after a cutoff are never scored."""
+        fills_board = engine.get_marble_count() + 1 == engine.get_board_length() ** 2
+        for score, winners in self.__evaluator.child_scores(engine, moves, self.__root_player):
+            self.__nodes += 1
+            if (self.__nodes % NODES_PER_CLOCK_CHECK == 0) and (time.perf_counter() > self.__deadline):
+                raise SearchTimeout()
+            yield self.terminal_score(winners, ply) if (winners or fills_board) else score
+
+
+def score_to_table(score, ply):
+    """Returns a score ready to be stored in the transposition table.  Win and loss scores count the turns from the
+    top of the search, so they are changed to count the turns from the stored position instead."""
+    if score > WIN_SCORE // 2:
+        return score + ply
+    if score < -WIN_SCORE // 2:
+        return score - ply
+    return score
+
+
+def score_from_table(score, ply):
+    """Returns a score from the transposition table counted from the top of the current search again."""
+    if score > WIN_SCORE // 2:
+        return score - ply
+    if score < -WIN_SCORE // 2:
+        return score + ply
+    return score
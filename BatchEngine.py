@@ -0,0 +1,260 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : A batch of independent Scalable Pentago games that are all advanced at once with NumPy.  The games
+#               share one configuration and are stored as one array of shape (games, board_length, board_length),
+#               kept flat as (games, nodes) so that a node is indexed the same way as the engine's bits.
+#               A step places one marble and rotates one sub-board in every game, and the winners of every game
+#               are found with array operations over the winning sequences.  This is meant for self-play and
+#               random rollouts where thousands of games are played with the same rules as PentagoEngine.
+#               NumPy is only needed by this module; the rest of the game runs without it.
+
+# Importing time so that the batch's speed can be measured.
+import time
+
+# Importing NumPy for the arrays that hold every game.
+import numpy
+
+# Importing the engine for its configuration rules.
+import PentagoEngine
+
+# Importing the winning sequences so that every sequence can be checked in every game at once.
+import WinningLines
+
+
+# The value of an empty node in the batch's array.  Players are stored as their number plus 1 so that the array can
+# be filled with zeroes for an empty board.
+EMPTY = 0
+
+# How many times random_moves picks a random node again for games whose node was already filled before falling back
+# to scoring every empty node.
+RANDOM_NODE_ATTEMPTS = 4
+
+
+class BatchEngine:
+    """Holds a number of games with one configuration and advances them together.  Every game takes its turns in the
+    same order as PentagoEngine, so move M of every game is made by player M modulo the player count."""
+
+    def __init__(self, game_count, sub_board_length, sub_board_number, winning_length, player_count):
+        """Creates game_count empty games with the passed configuration.  Raises a ValueError for an invalid
+        configuration, just like PentagoEngine."""
+        board_length = PentagoEngine.validate_configuration(sub_board_length, sub_board_number, winning_length,
+                                                            player_count)
+        self.__game_count = game_count
+        self.__sub_board_length = sub_board_length
+        self.__sub_board_number = sub_board_number
+        self.__board_length = board_length
+        self.__winning_length = winning_length
+        self.__player_count = player_count
+        node_count = board_length * board_length
+
+        # The boards are stored flat so that a node's index is row * board_length + column, the same as the engine's
+        # bits.  The smallest integer type that fits every player number is used to keep the array small.
+        cell_type = numpy.int8 if player_count < 127 else numpy.int16
+        self.__cells = numpy.zeros((game_count, node_count), dtype=cell_type)
+        self.__move_count = 0
+
+        # Every game has its own winners, and a finished game stops changing.  winners[G, P] is true if player P has
+        # won game G, and finished[G] is true once game G has a winner or a full board.
+        self.__winners = numpy.zeros((game_count, player_count), dtype=bool)
+        self.__finished = numpy.zeros(game_count, dtype=bool)
+
+        # The rotations.  Row R of the tables is sub-board R // 2 + 1 turned clockwise (even rows) or anti-clockwise
+        # (odd rows).  A rotation writes the marble from each source node onto the target node in the same column.
+        self.__rotation_targets, self.__rotation_sources = build_rotation_tables(sub_board_length, board_length)
+
+        # The run finders, one for each direction of a winning sequence.  They use the same doubling shifts as the
+        # engine: every shift keeps the nodes whose run of marbles is twice as long, so after the shifts a node is
+        # left only if a whole winning sequence starts on it.  Shifts are done by slicing the stacked boards.
+        lines = WinningLines.get_winning_lines(board_length, winning_length)
+        extensions = lines.get_run_shifts(0)
+        self.__run_finders = tuple(make_run_finder(direction, extensions) for direction in WinningLines.DIRECTIONS)
+
+    def get_game_count(self):
+        """Gets the number of games in the batch."""
+        return self.__game_count
+
+    def get_board_length(self):
+        """Gets the length of the game board's sides."""
+        return self.__board_length
+
+    def get_move_count(self):
+        """Gets the number of steps that have been applied to the batch."""
+        return self.__move_count
+
+    def get_current_player(self):
+        """Gets the number of the player whose turn it is in every unfinished game."""
+        return self.__move_count % self.__player_count
+
+    def get_cells(self):
+        """Gets a read-only view of the boards with shape (games, board_length, board_length).  Empty nodes hold
+        -1 and other nodes hold a player number, the same values PentagoEngine.get_cell returns."""
+        view = (self.__cells.astype(numpy.int16) - 1).reshape(self.__game_count, self.__board_length,
+                                                              self.__board_length)
+        view.flags.writeable = False
+        return view
+
+    def get_winners(self):
+        """Gets a copy of the (games, players) array of booleans marking the players that won each game."""
+        return self.__winners.copy()
+
+    def get_finished(self):
+        """Gets a copy of the array of booleans marking the games that are over."""
+        return self.__finished.copy()
+
+    def all_finished(self):
+        """Returns true if every game in the batch is over."""
+        return bool(self.__finished.all())
+
+    def empty_mask(self):
+        """Returns a (games, nodes) array of booleans marking the empty nodes of every game."""
+        return self.__cells == EMPTY
+
+    def apply(self, nodes, sub_boards, rotations):
+        """Makes one move in every unfinished game.  The arguments are arrays with one value per game: the node
+        (row * board_length + column) to place a marble on, the sub-board to rotate (starting at 1), and the
+        rotation as 0 for clockwise or 1 for anti-clockwise.  Finished games ignore their values.  Raises a
+        ValueError if an unfinished game is given a node, sub-board, or rotation that's out of range or is asked to
+        place a marble on a filled node."""
+        nodes = numpy.asarray(nodes, dtype=numpy.intp)
+        sub_boards = numpy.asarray(sub_boards, dtype=numpy.intp)
+        rotations = numpy.asarray(rotations, dtype=numpy.intp)
+        playing = ~self.__finished
+        games = numpy.arange(self.__game_count)
+
+        # Checking every unfinished game's values are in range before anything changes, since numpy would quietly wrap
+        # an index that's out of range around to another node or rotation table.
+        if ((nodes[playing] < 0) | (nodes[playing] >= self.__board_length * self.__board_length)).any():
+            raise ValueError("The node is out of range in at least one unfinished game.")
+        if ((sub_boards[playing] < 1) | (sub_boards[playing] > self.__sub_board_number)).any():
+            raise ValueError("The sub-board must be from 1 to %d in every unfinished game." % self.__sub_board_number)
+        if ((rotations[playing] != 0) & (rotations[playing] != 1)).any():
+            raise ValueError("The rotation must be 0 or 1 in every unfinished game.")
+
+        # Checking every unfinished game's node is empty before anything changes.
+        if (self.__cells[games[playing], nodes[playing]] != EMPTY).any():
+            raise ValueError("The position is already filled in at least one unfinished game.")
+
+        # Placing the marbles of the unfinished games.
+        player = self.__move_count % self.__player_count
+        self.__cells[games[playing], nodes[playing]] = player + 1
+
+        # Rotating the sub-board of every unfinished game at once.  The sources are read before anything is written.
+        rows = (sub_boards[playing] - 1) * 2 + rotations[playing]
+        playing_games = games[playing][:, numpy.newaxis]
+        self.__cells[playing_games, self.__rotation_targets[rows]] = \
+            self.__cells[playing_games, self.__rotation_sources[rows]]
+        self.__move_count += 1
+
+        # Finding the winners of the unfinished games.
+        self.update_winners(playing)
+
+    def update_winners(self, playing):
+        """Works out the winners of the games marked by the playing array and marks the games that are now over."""
+        cells = self.__cells[playing].reshape(-1, self.__board_length, self.__board_length)
+        winners = numpy.zeros((len(cells), self.__player_count), dtype=bool)
+        for player in range(self.__player_count):
+            owned = cells == player + 1
+            for find_runs in self.__run_finders:
+                winners[:, player] |= find_runs(owned).any(axis=(1, 2))
+        self.__winners[playing] = winners
+
+        # A game is over when someone has won or when its board is full.
+        full = (cells != EMPTY).all(axis=(1, 2))
+        self.__finished[playing] = winners.any(axis=1) | full
+
+    def random_moves(self, generator):
+        """Returns (nodes, sub_boards, rotations) arrays holding a random legal move for every game.  Finished
+        games get a move too, but apply ignores it.  The generator is a numpy.random.Generator."""
+
+        # Picking a random node for every game and picking again for the games whose node is filled.  Most
+        # nodes are empty for most of a game, so this settles nearly every game in a few tries.
+        game_count, node_count = self.__cells.shape
+        games = numpy.arange(game_count)
+        nodes = generator.integers(0, node_count, size=game_count)
+        filled = games[self.__cells[games, nodes] != EMPTY]
+        for attempt in range(RANDOM_NODE_ATTEMPTS):
+            if not len(filled):
+                break
+            nodes[filled] = generator.integers(0, node_count, size=len(filled))
+            filled = filled[self.__cells[filled, nodes[filled]] != EMPTY]
+
+        # Games that are still left over (nearly full boards) give every empty node a random score and take the
+        # highest one.  Full boards are finished, so whatever node they get is ignored.
+        if len(filled):
+            scores = generator.random((len(filled), node_count), dtype=numpy.float32)
+            scores[self.__cells[filled] != EMPTY] = -1.0
+            nodes[filled] = scores.argmax(axis=1)
+        sub_boards = generator.integers(1, self.__sub_board_number + 1, size=self.__game_count)
+        rotations = generator.integers(0, 2, size=self.__game_count)
+        return nodes, sub_boards, rotations
+
+    def play_random(self, generator):
+        """Plays every game to the end with random moves.  Returns the number of moves that were made."""
+        moves_made = 0
+        while not self.all_finished():
+            moves_made += int((~self.__finished).sum())
+            self.apply(*self.random_moves(generator))
+        return moves_made
+
+
+def build_rotation_tables(sub_board_length, board_length):
+    """Returns a tuple of (targets, sources) arrays with one row per (sub-board, direction).  Each row lists the
+    nodes of the sub-board and, in the same columns, the nodes their marbles come from after the rotation."""
+    sub_boards_per_side = board_length // sub_board_length
+    row_count = sub_boards_per_side ** 2 * 2
+    targets = numpy.zeros((row_count, sub_board_length ** 2), dtype=numpy.intp)
+    sources = numpy.zeros((row_count, sub_board_length ** 2), dtype=numpy.intp)
+    last = sub_board_length - 1
+    for sub_board in range(sub_boards_per_side ** 2):
+        corner_row = (sub_board // sub_boards_per_side) * sub_board_length
+        corner_column = (sub_board % sub_boards_per_side) * sub_board_length
+        for row in range(sub_board_length):
+            for column in range(sub_board_length):
+                local = row * sub_board_length + column
+                source = (corner_row + row) * board_length + corner_column + column
+
+                # A clockwise rotation moves a node at (row, column) to (column, last - row), and an anti-clockwise
+                # rotation moves it to (last - column, row).
+                targets[sub_board * 2, local] = (corner_row + column) * board_length + corner_column + last - row
+                targets[sub_board * 2 + 1, local] = (corner_row + last - column) * board_length + corner_column + row
+                sources[sub_board * 2, local] = source
+                sources[sub_board * 2 + 1, local] = source
+    return targets, sources
+
+
+def make_run_finder(direction, extensions):
+    """Returns a function that takes a (games, rows, columns) array of booleans and returns an array that is true
+    where a run covering every extension starts in the passed direction.  The first direction in
+    WinningLines.DIRECTIONS has a step of 1, so its shifts are the lengths the runs are extended by."""
+    row_step, column_step = direction
+
+    def find_runs(runs):
+        for extension in extensions:
+            rows = runs.shape[1] - row_step * extension
+            columns = runs.shape[2] - abs(column_step) * extension
+
+            # The node a run starts on and the node the run is extended from, as two slices of the same array.
+            first_column = extension if column_step < 0 else 0
+            start = runs[:, :rows, first_column:first_column + columns]
+            extended = runs[:, row_step * extension:row_step * extension + rows,
+                            first_column + column_step * extension:first_column + column_step * extension + columns]
+            runs = start & extended
+        return runs
+
+    return find_runs
+
+
+def measure_throughput(game_count, sub_board_length, sub_board_number, winning_length, player_count, seed=0):
+    """Plays game_count random games to the end in one batch and returns the number of moves made per second."""
+    batch = BatchEngine(game_count, sub_board_length, sub_board_number, winning_length, player_count)
+    generator = numpy.random.default_rng(seed)
+    start = time.perf_counter()
+    moves_made = batch.play_random(generator)
+    return moves_made / (time.perf_counter() - start)
+
+
+# Measuring the batch's speed on a few boards if this script is the file that's designated as "main".
+if __name__ == "__main__":
+    for configuration in ((3, 4, 5, 2), (3, 16, 5, 2), (6, 16, 5, 2), (13, 4, 5, 4)):
+        print("Sub-board length %d, %d sub-boards, winning length %d, %d players : %.0f moves per second." %
+              (configuration + (measure_throughput(4096, *configuration),)))
@@ -0,0 +1,331 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : A benchmark suite for the hot paths of Scalable Pentago across board sizes.  Every benchmark is
+#               timed on every configuration of a matrix of sub-board lengths, sub-board counts, winning lengths,
+#               and player counts.  The positions are made by random moves from a fixed seed, so every run times
+#               the same work.  Results are written as JSON with the median and 95th percentile time of one
+#               operation and the operations per second, and a saved result file can be used as a baseline that
+#               later runs are compared against to flag regressions.
+#
+#               Example : python Benchmark.py --output baseline.json
+#                         python Benchmark.py --output changed.json --compare baseline.json
+
+# Importing argparse so that the benchmarks can be set up from the command line.
+import argparse
+
+# Importing contextlib and io so that the console game can be set up without a person typing the answers.
+import contextlib
+import io
+
+# Importing json so that results can be saved and compared.
+import json
+
+# Importing platform and sys so that results record the machine and Python version they came from.
+import platform
+import sys
+
+# Importing random so that the benchmark positions are the same on every run.
+import random
+
+# Importing time for the timers.
+import time
+
+# Importing the engine whose speed is being measured.
+import PentagoEngine
+
+# Importing the console game so that its board printing is measured too.
+import ScalablePentago
+
+# Importing the threat counts that the computer player scores positions with.
+import ThreatEvaluator
+
+
+# The sub-board lengths and sub-board counts of the full matrix.  Boards longer than MATRIX_BOARD_LENGTH are left
+# out, so the matrix stays the same size as the board's length limit grows.
+SUB_BOARD_LENGTHS = tuple(range(2, 14))
+SUB_BOARD_NUMBERS = (4, 16)
+MATRIX_BOARD_LENGTH = 26
+
+# Large boards that are timed on top of the matrix: 48x48 and 64x64 boards split into 64 sub-boards (4^3).
+LARGE_CONFIGURATIONS = ((6, 64, 5, 2), (6, 64, 5, 4), (8, 64, 5, 2), (8, 64, 5, 4))
+
+# The winning lengths and player counts tried on every board.  Winning lengths longer than the board are left out
+# and so are player counts the board can't hold.
+WINNING_LENGTHS = (3, 5, 8)
+PLAYER_COUNTS = (2, 4)
+
+# The fraction of the board that is filled in before a position is timed.
+FILL_FRACTION = 0.5
+
+# How many samples are taken of each benchmark and how long each sample runs for at the least.  Operations that are
+# quicker than the sample time are repeated within the sample.
+SAMPLE_COUNT = 9
+MIN_SAMPLE_SECONDS = 0.01
+
+# How much slower a benchmark has to be than the baseline before it's flagged as a regression.  It's measured from the
+# baseline's 95th percentile to the new run's fastest sample rather than median to median, so a benchmark is only
+# flagged when the two runs' samples don't overlap even after the threshold, which noise alone rarely does.  Faster
+# benchmarks are flagged the same way, from the baseline's fastest sample to the new run's 95th percentile.
+REGRESSION_THRESHOLD = 0.10
+
+
+def benchmark_configurations(sub_board_lengths=SUB_BOARD_LENGTHS, sub_board_numbers=SUB_BOARD_NUMBERS,
+                             winning_lengths=WINNING_LENGTHS, player_counts=PLAYER_COUNTS,
+                             max_board_length=MATRIX_BOARD_LENGTH):
+    """Returns the list of configurations in the matrix that the game allows, with boards no longer than
+    max_board_length."""
+    configurations = []
+    for sub_board_number in sub_board_numbers:
+        for sub_board_length in sub_board_lengths:
+            for winning_length in winning_lengths:
+                for player_count in player_counts:
+                    try:
+                        board_length = PentagoEngine.validate_configuration(sub_board_length, sub_board_number,
+                                                                            winning_length, player_count)
+                    except ValueError:
+                        continue
+                    if board_length > max_board_length:
+                        continue
+                    configurations.append((sub_board_length, sub_board_number, winning_length, player_count))
+    return configurations
+
+
+def random_position(configuration, seed):
+    """Returns an engine with random moves made until FILL_FRACTION of the board is filled in or the game ends one
+    move before.  A move that would end the game is replaced by another, so the position is still being played."""
+    generator = random.Random(seed)
+    engine = PentagoEngine.PentagoEngine(*configuration)
+    target = int(engine.get_board_length() ** 2 * FILL_FRACTION)
+    attempts = 0
+    while (engine.get_marble_count() < target) and (attempts < target * 20):
+        attempts += 1
+        row, column = generator.choice(list(engine.empty_cells()))
+        engine.apply((row, column, generator.randint(1, engine.get_sub_board_number()),
+                      generator.choice(PentagoEngine.ROTATIONS)))
+        if engine.is_terminal():
+            engine.undo()
+    return engine
+
+
+def make_console(configuration):
+    """Returns a ScalablePentago console game set up with the configuration, answering its questions from a string
+    instead of the keyboard and hiding what it prints."""
+    sub_board_length, sub_board_number, winning_length, player_count = configuration
+    power = 0
+    while 4 ** power < sub_board_number:
+        power += 1
+    answers = "%d\n%d\n%d\n%d\n\n" % (sub_board_length, power, winning_length, player_count)
+    keyboard = sys.stdin
+    sys.stdin = io.StringIO(answers)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            console = ScalablePentago.ScalablePentago()
+    finally:
+        sys.stdin = keyboard
+    return console
+
+
+def benchmark_operations(configuration, seed):
+    """Returns a list of (name, operation) tuples for a configuration.  Every operation is a function with no
+    arguments that does one unit of the work being timed and leaves the position exactly as it found it, so every
+    sample times the same position."""
+    engine = random_position(configuration, seed)
+    generator = random.Random(seed)
+    sub_board_number = engine.get_sub_board_number()
+    moves = [move for move in engine.legal_moves()]
+    generator.shuffle(moves)
+    moves = moves[:256]
+    sub_boards = [generator.randint(1, sub_board_number) for index in range(256)]
+    boards = engine.get_boards()
+    lines = engine.get_winning_lines()
+    evaluator = ThreatEvaluator.ThreatEvaluator(engine)
+
+    # The console game gets the same position by replaying the engine's moves.
+    console = make_console(configuration)
+    for move in engine.get_history():
+        console.get_engine().apply(move)
+    placed_marbles = [(board, 1 << node) for board in boards
+                      for node in range(board.bit_length()) if (board >> node) & 1]
+    counter = [0]
+
+    def apply_and_undo():
+        counter[0] += 1
+        engine.apply(moves[counter[0] % len(moves)])
+        engine.undo()
+
+    # Every rotation is turned straight back, since a position that's left rotated would drift from sample to sample.
+    def rotate_and_back():
+        counter[0] += 1
+        sub_board = sub_boards[counter[0] % len(sub_boards)]
+        engine.rotate(sub_board, 'C')
+        engine.rotate(sub_board, 'A')
+
+    def sequence_touching_sub_board():
+        counter[0] += 1
+        sub_board = sub_boards[counter[0] % len(sub_boards)]
+        for board in boards:
+            engine.has_sequence_touching(board, sub_board)
+
+    def sequence_anywhere():
+        for board in boards:
+            lines.has_sequence(board)
+
+    def sequence_through_every_marble():
+        for board, bit in placed_marbles:
+            engine.has_sequence_through(board, bit)
+
+    def random_playout():
+        playout = PentagoEngine.PentagoEngine(*configuration)
+        playout_generator = random.Random(counter[0])
+        counter[0] += 1
+        while not playout.is_terminal():
+            row, column = playout_generator.choice(list(playout.empty_cells()))
+            playout.apply((row, column, playout_generator.randint(1, sub_board_number),
+                           playout_generator.choice(PentagoEngine.ROTATIONS)))
+
+    return [
+        ('apply_undo', apply_and_undo),
+        ('rotate_and_back', rotate_and_back),
+        ('win_check_sub_board', sequence_touching_sub_board),
+        ('win_check_node', sequence_through_every_marble),
+        ('win_check_board', sequence_anywhere),
+        ('render_board', console.render_board),
+        ('is_board_full', engine.is_board_full),
+        ('legal_moves', engine.legal_moves),
+        ('distinct_moves', lambda: list(engine.distinct_moves())),
+        ('score_children', lambda: evaluator.score_children(engine, moves, 0)),
+        ('random_playout', random_playout),
+    ]
+
+
+def sample_calls(operation, min_sample_seconds=MIN_SAMPLE_SECONDS):
+    """Returns how many calls of the operation one sample makes.  The number of calls is doubled until they take at
+    least min_sample_seconds, so quick operations aren't lost in the timer's noise."""
+    calls = 1
+    while True:
+        if time_sample(operation, calls) * calls >= min_sample_seconds:
+            return calls
+        calls *= 2
+
+
+def time_sample(operation, calls):
+    """Returns the seconds one call of the operation took, averaged over the number of calls."""
+    start = time.perf_counter()
+    for call in range(calls):
+        operation()
+    return (time.perf_counter() - start) / calls
+
+
+def summarize(samples):
+    """Returns a dictionary of the fastest sample, median, 95th percentile, and operations per second of a list of
+    samples."""
+    ordered = sorted(samples)
+    middle = len(ordered) // 2
+    median = ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+    # The 95th percentile uses the nearest rank, so it's always one of the samples.
+    p95 = ordered[min(len(ordered) - 1, max(0, -(-95 * len(ordered) // 100) - 1))]
+    return {'fastest': ordered[0], 'median': median, 'p95': p95,
+            'ops_per_second': 1.0 / median if median else 0.0, 'samples': len(ordered)}
+
+
+def run_benchmarks(configurations, names=None, seed=0, sample_count=SAMPLE_COUNT, report=print):
+    """Runs every benchmark (or only the named ones) on every configuration and returns the results as a dictionary
+    ready to be saved as JSON.  The samples are taken in rounds of one sample of every benchmark, so each benchmark's
+    samples are spread across the whole run and a machine that speeds up or slows down partway through shows up as
+    noise in every benchmark instead of as a change in the ones that happened to run at the time."""
+    benchmarks = [(configuration, name, operation) for configuration in configurations
+                  for name, operation in benchmark_operations(configuration, seed)
+                  if (names is None) or (name in names)]
+    calls = [sample_calls(operation) for configuration, name, operation in benchmarks]
+    samples = [[] for benchmark in benchmarks]
+    for sample in range(sample_count):
+        for index, (configuration, name, operation) in enumerate(benchmarks):
+            samples[index].append(time_sample(operation, calls[index]))
+
+    results = []
+    for (configuration, name, operation), benchmark_samples in zip(benchmarks, samples):
+        result = {'configuration': list(configuration), 'benchmark': name}
+        result.update(summarize(benchmark_samples))
+        results.append(result)
+        report("%-16s %-22s median %12.3f us   p95 %12.3f us   %14.1f ops/sec" %
+               (configuration, name, result['median'] * 1e6, result['p95'] * 1e6, result['ops_per_second']))
+    return {'python': sys.version.split()[0], 'platform': platform.platform(), 'seed': seed,
+            'sample_count': sample_count, 'results': results}
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """Returns a list of (configuration, benchmark, baseline median, new median, change, flag) tuples for every
+    benchmark in both result sets, where change is the fraction the median grew by, and a list of the regressions.
+    A benchmark's flag is 'REGRESSION' when its fastest new sample is slower than the baseline's 95th percentile by
+    more than the threshold, 'faster' when its new 95th percentile is faster than the baseline's fastest sample by
+    more than the threshold, and '' otherwise."""
+    baseline_results = {(tuple(result['configuration']), result['benchmark']): result
+                        for result in baseline['results']}
+    changes = []
+    for result in results['results']:
+        key = (tuple(result['configuration']), result['benchmark'])
+        if key in baseline_results and baseline_results[key]['median']:
+            old = baseline_results[key]
+            change = result['median'] / old['median'] - 1.0
+            if result['fastest'] > old['p95'] * (1.0 + threshold):
+                flag = 'REGRESSION'
+            elif result['p95'] < old['fastest'] * (1.0 - threshold):
+                flag = 'faster'
+            else:
+                flag = ''
+            changes.append(key + (old['median'], result['median'], change, flag))
+    return changes, [change for change in changes if change[5] == 'REGRESSION']
+
+
+def main(arguments=None):
+    """Runs the benchmarks as set up by command line arguments.  Returns 1 when a comparison finds regressions."""
+    parser = argparse.ArgumentParser(description="Times the hot paths of Scalable Pentago across board sizes.")
+    parser.add_argument('--sub-board-lengths', type=lambda text: [int(value) for value in text.split(',')],
+                        default=list(SUB_BOARD_LENGTHS), help="comma separated sub-board lengths (default : 2 to 13)")
+    parser.add_argument('--sub-board-numbers', type=lambda text: [int(value) for value in text.split(',')],
+                        default=list(SUB_BOARD_NUMBERS), help="comma separated sub-board counts (default : 4,16)")
+    parser.add_argument('--winning-lengths', type=lambda text: [int(value) for value in text.split(',')],
+                        default=list(WINNING_LENGTHS), help="comma separated winning lengths (default : 3,5,8)")
+    parser.add_argument('--players', type=lambda text: [int(value) for value in text.split(',')],
+                        default=list(PLAYER_COUNTS), help="comma separated player counts (default : 2,4)")
+    parser.add_argument('--max-board-length', type=int, default=MATRIX_BOARD_LENGTH,
+                        help="the longest board in the matrix (default : 26)")
+    parser.add_argument('--no-large', action='store_true', help="leave out the 48x48 and 64x64 configurations")
+    parser.add_argument('--benchmarks', type=lambda text: text.split(','),
+                        help="comma separated benchmark names to run (default : all of them)")
+    parser.add_argument('--samples', type=int, default=SAMPLE_COUNT, help="samples per benchmark")
+    parser.add_argument('--seed', type=int, default=0, help="the seed of the benchmark positions")
+    parser.add_argument('--output', help="the JSON file to write the results to")
+    parser.add_argument('--compare', metavar='BASELINE', help="a saved JSON result file to compare against")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help="the fraction the fastest new sample has to be slower than the baseline's 95th "
+                             "percentile by to count as a regression (default : 0.10)")
+    options = parser.parse_args(arguments)
+
+    configurations = benchmark_configurations(options.sub_board_lengths, options.sub_board_numbers,
+                                              options.winning_lengths, options.players, options.max_board_length)
+    if not options.no_large:
+        configurations += [configuration for configuration in LARGE_CONFIGURATIONS
+                           if configuration not in configurations]
+    results = run_benchmarks(configurations, options.benchmarks, options.seed, options.samples)
+    if options.output:
+        with open(options.output, 'w') as output_file:
+            json.dump(results, output_file, indent=1)
+
+    if options.compare:
+        with open(options.compare) as baseline_file:
+            changes, regressions = compare(results, json.load(baseline_file), options.threshold)
+        print()
+        for configuration, name, old_median, new_median, change, flag in changes:
+            print("%-16s %-22s %12.3f us -> %12.3f us  %+7.1f%%  %s" %
+                  (configuration, name, old_median * 1e6, new_median * 1e6, change * 100, flag))
+        print('\n' + "%d of %d benchmarks regressed by more than %.0f%% beyond their noise." %
+              (len(regressions), len(changes), options.threshold * 100))
+        return 1 if regressions else 0
+    return 0
+
+
+# Running the benchmarks if this script is the file that's designated as "main".
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : A bit permutation moves the bits of a bitboard to new positions using lookup tables that are built
+#               once.  The source bits are split into chunks of neighbouring bits, and every chunk has a table
+#               that maps each pattern of its bits to the same marbles at their new positions.  Applying the
+#               permutation is then one shift, one mask, and one table lookup per chunk instead of a loop over
+#               every node.  The engine uses these for rotations; anything else that moves whole groups of
+#               nodes (like board symmetries) can use them too.
+
+
+# The number of neighbouring bits covered by one lookup table.  Each table holds 2 to the power of this many values.
+CHUNK_WIDTH = 8
+
+
+class BitPermutation:
+    """Moves bits according to a mapping of source bit positions to destination bit positions.  Bits that are not in
+    the mapping are dropped, so callers should clear the destination area themselves when they combine the result
+    with the rest of a bitboard."""
+
+    def __init__(self, mapping, chunk_width=CHUNK_WIDTH):
+        """Builds the lookup tables for a dictionary that maps source bit positions to destination bit positions."""
+
+        # The chunks are tuples of (shift, mask, table).  A chunk reads the bits starting at its shift, keeps the
+        # ones selected by its mask, and looks the pattern up in its table.
+        self.__chunks = []
+        self.__source_mask = 0
+
+        # Walking the source bits from lowest to highest.  A chunk starts at the lowest source bit that hasn't been
+        # covered yet and covers the next chunk_width bits; any of those bits that aren't sources are masked out.
+        sources = sorted(mapping)
+        index = 0
+        while index < len(sources):
+            shift = sources[index]
+            chunk_mask = 0
+            destinations = []
+            while (index < len(sources)) and (sources[index] - shift < chunk_width):
+                offset = sources[index] - shift
+                chunk_mask |= 1 << offset
+                destinations.append((offset, mapping[sources[index]]))
+                index += 1
+
+            # Building the table one pattern at a time.  Every pattern is the pattern without its lowest bit (which
+            # has already been built) plus the destination of its lowest bit.
+            destination_of_offset = dict(destinations)
+            table = [0] * (1 << (max(destination_of_offset) + 1))
+            for pattern in range(1, len(table)):
+                if pattern & ~chunk_mask:
+                    continue
+                lowest_bit = pattern & -pattern
+                destination = destination_of_offset[lowest_bit.bit_length() - 1]
+                table[pattern] = table[pattern ^ lowest_bit] | (1 << destination)
+
+            self.__chunks.append((shift, chunk_mask, table))
+            self.__source_mask |= chunk_mask << shift
+
+    def get_source_mask(self):
+        """Gets the bitboard of every bit that the permutation moves."""
+        return self.__source_mask
+
+    def apply(self, board):
+        """Returns the bits of the passed bitboard moved to their destinations."""
+        result = 0
+        for shift, chunk_mask, table in self.__chunks:
+            result |= table[(board >> shift) & chunk_mask]
+        return result
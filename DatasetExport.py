@@ -0,0 +1,290 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Exports recorded games as a dataset of positions for training.  Every game in one or more game
+#               record files is replayed through the engine, and every position where a player was about to move
+#               becomes one row: the position, the player to move, the outcome for that player, and the number of
+#               the move.  Rows are fixed-size NumPy records appended to shard files, so training code can open a
+#               shard with numpy.memmap and read slices of it without copying or decoding anything.  Positions can
+#               be stored one-hot (one 0 or 1 per player per node) or bit-packed (one bit per player per node), and
+#               the same position reached in different games, or as a rotated or mirrored copy, is only stored
+#               once.  A JSON index next to the shards describes the row layout and how many rows each shard has.
+#               Rows are written in small batches, so memory use doesn't grow with the size of the dataset; only
+#               the 8-byte keys of the positions already stored are kept.
+#
+#               Example : python DatasetExport.py games.spgr --output dataset --encoding packed
+#
+#               Reading : index = json.load(open('dataset.json'))
+#                         rows = numpy.memmap(shard['path'], dtype=DatasetExport.row_dtype(index), mode='r')
+
+# Importing argparse so that datasets can be exported from the command line.
+import argparse
+
+# Importing json to write the sidecar index.
+import json
+
+# Importing os for the paths of the shards.
+import os
+
+# Importing NumPy for the fixed-size rows.
+import numpy
+
+# Importing the game records that positions are taken from.
+import GameRecord
+
+# Importing the engine to replay the recorded games.
+import PentagoEngine
+
+# Importing the symmetries to find each position's canonical form.
+import Symmetry
+
+
+# The ways a position can be stored.  "onehot" stores a byte for every (player, row, column) and "packed" stores the
+# same bits 8 to a byte, with node row * board_length + column at bit (node % 8) of byte (node // 8).
+ENCODINGS = ('onehot', 'packed')
+
+# The outcomes stored for the player to move.
+OUTCOME_WIN = 1
+OUTCOME_DRAW = 0
+OUTCOME_LOSS = -1
+
+# How many rows are gathered in memory before they are written to the shard.
+BATCH_ROWS = 4096
+
+# How many rows a shard holds before the next one is started.
+SHARD_ROWS = 1000000
+
+# The number of slots the set of stored keys starts with.  It doubles whenever it gets half full.
+KEY_SET_SLOTS = 1 << 16
+
+
+class KeySet:
+    """A set of 64-bit keys stored in a NumPy array, which takes 16 bytes per key instead of the ~80 bytes a
+    Python set of integers would.  Keys are placed with linear probing; the key 0 marks an empty slot, so it's
+    stored as 1 instead (it only means one in 2^64 keys shares its slot with another)."""
+
+    def __init__(self, slots=KEY_SET_SLOTS):
+        """Creates an empty set with the passed number of slots, which must be a power of 2."""
+        self.__slots = numpy.zeros(slots, dtype=numpy.uint64)
+        self.__count = 0
+
+    def __len__(self):
+        return self.__count
+
+    def add(self, key):
+        """Adds the key to the set.  Returns true if it wasn't in the set already."""
+        key = key or 1
+        slots = self.__slots
+        mask = len(slots) - 1
+        slot = key & mask
+        while True:
+            held = int(slots[slot])
+            if held == key:
+                return False
+            if not held:
+                break
+            slot = (slot + 1) & mask
+        slots[slot] = key
+        self.__count += 1
+        if self.__count * 2 > len(slots):
+            self.grow()
+        return True
+
+    def grow(self):
+        """Doubles the number of slots and places every key again."""
+        keys = self.__slots[self.__slots != 0]
+        self.__slots = numpy.zeros(len(self.__slots) * 2, dtype=numpy.uint64)
+        self.__count = 0
+        for key in keys.tolist():
+            self.add(key)
+
+
+class ShardWriter:
+    """Appends rows to a series of shard files, starting a new shard whenever one is full."""
+
+    def __init__(self, prefix, dtype, shard_rows=SHARD_ROWS, batch_rows=BATCH_ROWS):
+        """Creates a writer whose shards are named prefix-00000.bin, prefix-00001.bin, and so on."""
+        self.__prefix = prefix
+        self.__dtype = dtype
+        self.__shard_rows = shard_rows
+        self.__batch = numpy.zeros(batch_rows, dtype=dtype)
+        self.__batch_count = 0
+        self.__shards = []
+        self.__file = None
+        self.__shard_count = 0
+
+    def get_shards(self):
+        """Gets a list of dictionaries holding the path and the row count of every shard written so far."""
+        return [dict(shard) for shard in self.__shards]
+
+    def next_row(self):
+        """Returns the next empty row of the batch to be filled in.  The batch is written out when it fills up."""
+        if self.__batch_count == len(self.__batch):
+            self.flush()
+        row = self.__batch[self.__batch_count]
+        self.__batch_count += 1
+        return row
+
+    def flush(self):
+        """Writes the rows of the batch to the shards."""
+        written = 0
+        while written < self.__batch_count:
+
+            # Starting a new shard when there isn't one yet or the last one is full.
+            if (self.__file is None) or (self.__shard_count == self.__shard_rows):
+                if self.__file is not None:
+                    self.__file.close()
+                path = "%s-%05d.bin" % (self.__prefix, len(self.__shards))
+                self.__file = open(path, 'wb')
+                self.__shards.append({'path': os.path.basename(path), 'rows': 0})
+                self.__shard_count = 0
+
+            rows = min(self.__batch_count - written, self.__shard_rows - self.__shard_count)
+            self.__file.write(self.__batch[written:written + rows].tobytes())
+            written += rows
+            self.__shard_count += rows
+            self.__shards[-1]['rows'] += rows
+        self.__batch_count = 0
+
+    def close(self):
+        """Writes any rows left in the batch and closes the last shard."""
+        self.flush()
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+
+def row_dtype(index):
+    """Returns the NumPy record type of a row, built from an index dictionary (or anything with the same
+    "encoding" and "configuration" keys)."""
+    return make_row_dtype(index['configuration'], index['encoding'])
+
+
+def make_row_dtype(configuration, encoding):
+    """Returns the NumPy record type of the rows of a configuration in an encoding."""
+    sub_board_length, sub_board_number, winning_length, player_count = configuration
+    board_length = sub_board_length * int(round(sub_board_number ** 0.5))
+    if encoding == 'onehot':
+        position = (numpy.uint8, (player_count, board_length, board_length))
+    elif encoding == 'packed':
+        position = (numpy.uint8, (player_count, (board_length * board_length + 7) // 8))
+    else:
+        raise ValueError("The encoding must be one of : " + ", ".join(ENCODINGS))
+
+    # The player and move number fields are widened for games with more players or nodes than a small type holds.
+    player_type = numpy.int8 if player_count < 128 else numpy.int16
+    move_type = numpy.uint16 if board_length * board_length < 65536 else numpy.uint32
+    return numpy.dtype([('position', ) + position, ('side_to_move', player_type), ('outcome', numpy.int8),
+                        ('move_number', move_type)])
+
+
+def outcome_for(player, winners):
+    """Returns the outcome of a finished game for a player.  Winning alone is a win, sharing the win or a full board
+    is a draw, and anyone else winning is a loss."""
+    if not winners:
+        return OUTCOME_DRAW
+    if player in winners:
+        return OUTCOME_WIN if len(winners) == 1 else OUTCOME_DRAW
+    return OUTCOME_LOSS
+
+
+def fill_position(field, boards, board_length, encoding):
+    """Writes a tuple of bitboards into a row's position field."""
+    byte_count = (board_length * board_length + 7) // 8
+    for player, board in enumerate(boards):
+        packed = numpy.frombuffer(board.to_bytes(byte_count, 'little'), dtype=numpy.uint8)
+        if encoding == 'packed':
+            field[player] = packed
+        else:
+            bits = numpy.unpackbits(packed, bitorder='little')[:board_length * board_length]
+            field[player] = bits.reshape(board_length, board_length)
+
+
+def export(record_paths, output_prefix, encoding='onehot', deduplicate=True, canonical=True,
+           shard_rows=SHARD_ROWS, report=print):
+    """Exports every position of the games in the record files and writes the index to output_prefix.json.
+    With canonical, positions are stored in their canonical form (rotated or mirrored, and with the players
+    renumbered so the player to move is player 0, which is also the side to move that is stored); otherwise they
+    are stored as they were played.  With deduplicate, a position whose canonical form was already stored is
+    skipped, so a repeated position keeps the outcome of the first game it came up in and the outcomes of the rest
+    are lost; that biases positions whose games ended differently toward the earlier records.  Returns the index."""
+    configuration = None
+    writer = None
+    seen = KeySet()
+    rows = 0
+    skipped = 0
+    games = 0
+    for path in record_paths:
+        file_games, file_rows, file_skipped = games, rows, skipped
+        with GameRecord.GameRecordReader(path) as reader:
+
+            # Every record file has to hold games of the same configuration, since the rows have a fixed size.
+            if configuration is None:
+                configuration = reader.get_configuration()
+                writer = ShardWriter(output_prefix, make_row_dtype(configuration, encoding), shard_rows)
+            elif reader.get_configuration() != configuration:
+                raise ValueError("The record file " + path + " holds games of configuration " +
+                                 str(reader.get_configuration()) + ", not " + str(configuration) + ".")
+
+            for moves, winners in reader:
+                games += 1
+                engine = PentagoEngine.PentagoEngine(*configuration)
+                board_length = engine.get_board_length()
+                for move in moves:
+                    player = engine.get_current_player()
+
+                    # The canonical form is only worked out when it's stored or checked for duplicates.
+                    boards = Symmetry.canonical_form(engine)[0] if deduplicate or canonical else None
+                    if deduplicate and not seen.add(Symmetry.hash_boards(configuration, boards)):
+                        skipped += 1
+                    else:
+                        row = writer.next_row()
+                        fill_position(row['position'], boards if canonical else engine.get_boards(), board_length,
+                                      encoding)
+
+                        # The canonical form renumbers the players from the player to move, who is always player 0
+                        # in its planes.  The outcome is for the player to move either way.
+                        row['side_to_move'] = 0 if canonical else player
+                        row['outcome'] = outcome_for(player, winners)
+                        row['move_number'] = engine.get_move_count()
+                        rows += 1
+                    engine.apply(move)
+        report("%s : %d games, %d rows, %d duplicate positions skipped." %
+               (path, games - file_games, rows - file_rows, skipped - file_skipped))
+
+    if writer is None:
+        raise ValueError("There were no record files to export.")
+    writer.close()
+
+    index = {'configuration': list(configuration), 'encoding': encoding, 'canonical': canonical,
+             'deduplicated': deduplicate, 'games': games, 'rows': rows, 'duplicates_skipped': skipped,
+             'dtype': make_row_dtype(configuration, encoding).descr,
+             'shards': writer.get_shards()}
+    with open(output_prefix + '.json', 'w') as index_file:
+        json.dump(index, index_file, indent=1)
+    return index
+
+
+def open_shards(index_path):
+    """Returns a list of read-only memory-mapped row arrays, one for every shard listed in an index file."""
+    with open(index_path) as index_file:
+        index = json.load(index_file)
+    dtype = row_dtype(index)
+    directory = os.path.dirname(index_path)
+    return [numpy.memmap(os.path.join(directory, shard['path']), dtype=dtype, mode='r', shape=(shard['rows'],))
+            for shard in index['shards'] if shard['rows']]
+
+
+# Exporting a dataset if this script is the file that's designated as "main".
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exports recorded Scalable Pentago games as training positions.")
+    parser.add_argument('records', nargs='+', help="game record files to export")
+    parser.add_argument('--output', default='dataset', help="the prefix of the shards and the index")
+    parser.add_argument('--encoding', choices=ENCODINGS, default='onehot', help="how positions are stored")
+    parser.add_argument('--keep-duplicates', action='store_true',
+                        help="store every position, even repeated ones (otherwise a repeated position only keeps the "
+                             "outcome of the first game it came up in)")
+    parser.add_argument('--as-played', action='store_true', help="store positions as played, not in canonical form")
+    parser.add_argument('--shard-rows', type=int, default=SHARD_ROWS, help="the most rows in one shard")
+    options = parser.parse_args()
+    export(options.records, options.output, options.encoding, not options.keep_duplicates, not options.as_played,
+           options.shard_rows)
@@ -0,0 +1,317 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : A compact binary file format for finished games of Scalable Pentago.  Every file holds games of one
+#               configuration, which is written once in the file's header.  A game is stored as its number of
+#               moves, its winners, and its moves, where every move is the engine's move code (node, sub-board,
+#               and direction packed into one integer) written in the fewest whole bytes that fit the largest code
+#               of the configuration; a standard 6x6 game takes 2 bytes per move.  Games are only ever appended,
+#               and a sidecar index file holds the offset of every game so any game can be read without reading
+#               the games before it.
+#
+#               File layout (numbers are little-endian) :
+#                   header : MAGIC, VERSION (1 byte), then sub-board length, sub-board number, winning length,
+#                            and player count (4 bytes each)
+#                   game   : move count (varint), winner count (varint), each winner (varint),
+#                            then every move code (move_bytes of the configuration, in bytes, each)
+#               Index layout : the offset of every game in the file, 8 bytes each.
+
+# Importing os to find out whether a record file already exists.
+import os
+
+# Importing struct to pack and unpack the header and the index.
+import struct
+
+# Importing array to hold the offsets of a file's games compactly in memory.
+from array import array
+
+# Importing the engine for its move codes and to replay recorded games.
+import PentagoEngine
+
+
+# The bytes every record file starts with, and the version of the layout it uses.
+MAGIC = b'SPGR'
+VERSION = 1
+
+# The header after the magic bytes: the version and the 4 numbers of the configuration.
+HEADER_FORMAT = '<BIIII'
+HEADER_SIZE = len(MAGIC) + struct.calcsize(HEADER_FORMAT)
+
+# Every offset in the index, which is little-endian on every machine like the rest of the format.
+OFFSET_FORMAT = '<Q'
+OFFSET_SIZE = struct.calcsize(OFFSET_FORMAT)
+
+# The ending of the index file that goes with a record file.
+INDEX_SUFFIX = '.idx'
+
+
+class GameRecordWriter:
+    """Appends finished games to a record file and its index.  A new file is created with the configuration in its
+    header; an existing file is appended to, as long as its configuration is the same."""
+
+    def __init__(self, path, configuration):
+        """Opens the record file at path for appending games of the configuration.  Raises a ValueError if the file
+        already holds games of a different configuration."""
+        self.__path = path
+        self.__configuration = tuple(configuration)
+        self.__engine = PentagoEngine.PentagoEngine(*self.__configuration)
+        self.__move_bytes = move_bytes(self.__engine)
+
+        # Checking an existing file's header before anything is written to it.
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, 'rb') as record_file:
+                existing = read_header(record_file)
+            if existing != self.__configuration:
+                raise ValueError("The record file holds games of configuration " + str(existing) +
+                                 ", not " + str(self.__configuration) + ".")
+            self.__file = open(path, 'ab')
+        else:
+            self.__file = open(path, 'wb')
+            self.__file.write(MAGIC + struct.pack(HEADER_FORMAT, VERSION, *self.__configuration))
+            self.__file.flush()
+
+        # Rebuilding the index if it's missing or doesn't match the games in the file, like after a crash.  A game
+        # that was cut off part way through is removed so that new games start right after the last whole one.
+        end = repair_index(path)
+        if end != os.path.getsize(path):
+            self.__file.truncate(end)
+            self.__file.seek(end)
+        self.__index_file = open(path + INDEX_SUFFIX, 'ab')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+    def write_game(self, moves, winners):
+        """Appends a game made of the list of moves and the list of winning players."""
+        encode_move = self.__engine.encode_move
+        data = bytearray()
+        write_varint(data, len(moves))
+        write_varint(data, len(winners))
+        for winner in winners:
+            write_varint(data, winner)
+        for move in moves:
+            data += encode_move(move).to_bytes(self.__move_bytes, 'little')
+
+        # The game is written before its offset, so the index never points at a game that isn't all there.  Both are
+        # flushed so that a reader opened in the meantime finds the game in the index.
+        offset = self.__file.tell()
+        self.__file.write(data)
+        self.__file.flush()
+        self.__index_file.write(struct.pack(OFFSET_FORMAT, offset))
+        self.__index_file.flush()
+
+    def write_engine(self, engine):
+        """Appends the game that was played on an engine, using its history and winners."""
+        if engine.get_configuration() != self.__configuration:
+            raise ValueError("The engine's configuration doesn't match the record file's.")
+        self.write_game(engine.get_history(), engine.winners())
+
+    def flush(self):
+        """Writes everything that is buffered to the disk."""
+        self.__file.flush()
+        self.__index_file.flush()
+
+    def close(self):
+        """Closes the record file and its index."""
+        self.__file.close()
+        self.__index_file.close()
+
+
+class GameRecordReader:
+    """Reads the games of a record file, either one after another or by their index."""
+
+    def __init__(self, path):
+        """Opens the record file at path.  Raises a ValueError if it isn't a record file.  The games that a missing
+        or outdated index doesn't hold are found by reading through them; the index itself is never written, so a
+        file can be read while it is being written to, or from read-only media."""
+        self.__path = path
+        self.__file = open(path, 'rb')
+        self.__configuration = read_header(self.__file)
+        self.__engine = PentagoEngine.PentagoEngine(*self.__configuration)
+        self.__move_bytes = move_bytes(self.__engine)
+        self.__offsets = load_offsets(path)[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+    def __len__(self):
+        return self.get_game_count()
+
+    def __iter__(self):
+        return self.games()
+
+    def get_configuration(self):
+        """Gets the configuration of the games in the file."""
+        return self.__configuration
+
+    def get_game_count(self):
+        """Gets the number of complete games that were in the file when it was opened."""
+        return len(self.__offsets)
+
+    def games(self):
+        """Yields a tuple of (moves, winners) for every game in the file, in the order they were written.  Only one
+        game is held in memory at a time."""
+        position = HEADER_SIZE
+        while True:
+
+            # Going back to where the last game ended, in case a game was read by its index in the meantime.
+            self.__file.seek(position)
+            game = self.read_next()
+            if game is None:
+                return
+            position = self.__file.tell()
+            yield game
+
+    def read_game(self, index):
+        """Returns a tuple of (moves, winners) for the game at the index.  Raises an IndexError if there isn't one."""
+        if (index < 0) or (index >= self.get_game_count()):
+            raise IndexError("There is no game " + str(index) + " in the record file.")
+        self.__file.seek(self.__offsets[index])
+        return self.read_next()
+
+    def replay(self, index):
+        """Returns a new engine that the game at the index has been played on."""
+        moves, winners = self.read_game(index)
+        engine = PentagoEngine.PentagoEngine(*self.__configuration)
+        for move in moves:
+            engine.apply(move)
+        return engine
+
+    def read_next(self):
+        """Returns a tuple of (moves, winners) for the game at the file's position and moves past it, or None at the
+        end of the file (or at a game that was cut off part way through)."""
+        record_file = self.__file
+        move_count = read_varint(record_file)
+        if move_count is None:
+            return None
+        winner_count = read_varint(record_file)
+        winners = [read_varint(record_file) for winner in range(winner_count or 0)]
+        data = record_file.read(move_count * self.__move_bytes)
+        if (winner_count is None) or (None in winners) or (len(data) != move_count * self.__move_bytes):
+            return None
+        decode_move = self.__engine.decode_move
+        size = self.__move_bytes
+        moves = [decode_move(int.from_bytes(data[start:start + size], 'little'))
+                 for start in range(0, len(data), size)]
+        return moves, winners
+
+    def close(self):
+        """Closes the record file."""
+        self.__file.close()
+
+
+def move_bytes(engine):
+    """Returns the number of bytes that fit every move code of the engine's configuration."""
+    largest_code = engine.get_board_length() ** 2 * engine.get_sub_board_number() * 2 - 1
+    return max(1, (largest_code.bit_length() + 7) // 8)
+
+
+def read_header(record_file):
+    """Returns the configuration in a record file's header and leaves the file at its first game.  Raises a
+    ValueError if the file doesn't start with a record header."""
+    header = record_file.read(HEADER_SIZE)
+    if (len(header) != HEADER_SIZE) or (header[:len(MAGIC)] != MAGIC):
+        raise ValueError("The file is not a Scalable Pentago game record.")
+    version, *configuration = struct.unpack(HEADER_FORMAT, header[len(MAGIC):])
+    if version != VERSION:
+        raise ValueError("The game record's version (" + str(version) + ") is not supported.")
+    return tuple(configuration)
+
+
+def write_varint(data, value):
+    """Appends a non-negative integer to a bytearray, 7 bits per byte with the high bit set on every byte but the
+    last."""
+    while value >= 0x80:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    data.append(value)
+
+
+def read_varint(record_file):
+    """Returns the next integer written by write_varint, or None if the file ends before it does."""
+    value = 0
+    shift = 0
+    while True:
+        byte = record_file.read(1)
+        if not byte:
+            return None
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+def game_end(record_file, offset, move_size, size):
+    """Returns the offset where the game that starts at offset ends, or None if a file of the size ends before it
+    does."""
+    record_file.seek(offset)
+    move_count = read_varint(record_file)
+    winner_count = read_varint(record_file)
+    if (move_count is None) or (winner_count is None):
+        return None
+    if None in [read_varint(record_file) for winner in range(winner_count)]:
+        return None
+    end = record_file.tell() + move_count * move_size
+    return end if end <= size else None
+
+
+def load_offsets(path):
+    """Returns a tuple of (an array of the offset of every complete game, the offset where the last complete game
+    ends) for a record file, without writing anything.  The index is trusted as long as its last game is whole; only
+    the games after it are read through, or every game when there is no index or it doesn't fit the file."""
+    size = os.path.getsize(path)
+    offsets = read_index(path)
+    with open(path, 'rb') as record_file:
+        configuration = read_header(record_file)
+        move_size = move_bytes(PentagoEngine.PentagoEngine(*configuration))
+        end = HEADER_SIZE
+        if offsets:
+            last_end = game_end(record_file, offsets[-1], move_size, size) if HEADER_SIZE <= offsets[-1] else None
+            if last_end is None:
+                offsets = array('Q')
+            else:
+                end = last_end
+
+        # LOOPING METHOD: reading through the games the index doesn't hold, up to the first one that was cut off.
+        while True:
+            next_end = game_end(record_file, end, move_size, size)
+            if next_end is None:
+                break
+            offsets.append(end)
+            end = next_end
+    return offsets, end
+
+
+def repair_index(path):
+    """Makes sure a record file's index holds the offset of every complete game and returns the offset where the
+    last complete game ends.  The index is only written when it doesn't already hold exactly those offsets."""
+    offsets, end = load_offsets(path)
+    index_path = path + INDEX_SUFFIX
+    if (not os.path.exists(index_path)) or (os.path.getsize(index_path) != len(offsets) * OFFSET_SIZE) or \
+            (offsets != read_index(path)):
+        write_index(path, offsets)
+    return end
+
+
+def read_index(path):
+    """Returns an array of the offsets in a record file's index, or an empty array if it has no index.  A partly
+    written last offset is left out."""
+    offsets = array('Q')
+    index_path = path + INDEX_SUFFIX
+    if os.path.exists(index_path):
+        with open(index_path, 'rb') as index_file:
+            data = index_file.read()
+        count = len(data) // OFFSET_SIZE
+        offsets.extend(struct.unpack('<%dQ' % count, data[:count * OFFSET_SIZE]))
+    return offsets
+
+
+def write_index(path, offsets):
+    """Replaces a record file's index with the passed offsets."""
+    with open(path + INDEX_SUFFIX, 'wb') as index_file:
+        index_file.write(struct.pack('<%dQ' % len(offsets), *offsets))
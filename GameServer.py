@@ -0,0 +1,492 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : A server that hosts many games of Scalable Pentago at once for bots and people.  Every game is an
+#               engine inside of one asyncio process, and clients talk to the server over TCP or a Unix socket with
+#               one JSON object per line.  A client can create a game, take a seat in it, watch it, and send moves;
+#               moves are checked with the same rules the console game uses, and every change to a game is pushed
+#               to everyone in it.  Seats can also be given to bots (written the same way as in Tournament.py), whose
+#               moves are worked out in a pool of processes so that a long search never holds up the other games.
+#               A connection that is only waiting costs a coroutine and its buffers, so thousands of idle clients
+#               are cheap.  Every game keeps track of how long its moves take, from the moment a move arrives (or a
+#               bot's turn starts) to the moment its update has been sent out.
+#
+#               Example : python GameServer.py --port 7777
+#                         python GameServer.py --unix /tmp/pentago.sock --workers 4
+#
+#               Messages from a client (every one can carry an "id" that is copied into the reply) :
+#                   {"type": "create", "config": [3, 4, 5, 2], "bots": {"1": "alphabeta:depth=2"}}
+#                   {"type": "join", "game": 1, "seat": 0}          (the seat can be left out for any open seat)
+#                   {"type": "watch", "game": 1}
+#                   {"type": "move", "game": 1, "move": [2, "B", 3, "C"]}   (the column can be a label or a number)
+#                   {"type": "leave", "game": 1}
+#                   {"type": "list"}
+#                   {"type": "stats", "game": 1}
+#               Messages from the server : "created", "joined", "watching", "left", "games", "stats", "error", and
+#               "state", which is sent to everyone in a game whenever it changes.
+
+# Importing argparse so that the server can be started from the command line.
+import argparse
+
+# Importing asyncio for the event loop that every connection and game runs on.
+import asyncio
+
+# Importing json for the messages.
+import json
+
+# Importing multiprocessing so that the bot processes are started fresh instead of forked.
+import multiprocessing
+
+# Importing os for the number of cores and to clear out an old Unix socket.
+import os
+
+# Importing time for the latency timers.
+import time
+
+# Importing deque so that every game only keeps its most recent latency samples.
+from collections import deque
+
+# Importing the process pool that bots think in, and the error it raises when one of its processes dies.
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Importing the engine for the rules of the game.
+import PentagoEngine
+
+# Importing the console game for its column labels.
+import ScalablePentago
+
+# Importing the tournament runner for the bots it knows how to make.
+import Tournament
+
+
+# The longest line a client can send, in bytes.
+LINE_LIMIT = 1 << 16
+
+# How many bytes can be waiting to be sent to one client before it's dropped for not reading its updates.
+WRITE_BUFFER_LIMIT = 1 << 20
+
+# How many latency samples every game keeps for its percentiles.
+LATENCY_SAMPLES = 1024
+
+# How many times a bot's move is tried when the process pool breaks under it.  A new pool is started every time.
+BOT_ATTEMPTS = 2
+
+# The most bots each worker process keeps.  Bots with tables take a lot of memory (an alpha-beta bot's table is
+# 16 MB by default), so the bot used longest ago is let go when another one is needed.
+WORKER_BOTS = 4
+
+# The bots made in each worker process, by specification, so that bots with tables keep them between moves and
+# games.  The dictionary is kept in the order the bots were last used.
+worker_bot_cache = {}
+
+
+class LatencyStats:
+    """The timings of one kind of move in a game.  The count, total, and maximum cover every move; the percentiles
+    come from the most recent LATENCY_SAMPLES moves."""
+
+    __slots__ = ('count', 'total', 'maximum', 'samples')
+
+    def __init__(self):
+        """Creates empty timings."""
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.samples = deque(maxlen=LATENCY_SAMPLES)
+
+    def add(self, seconds):
+        """Adds the time one move took."""
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+        self.samples.append(seconds)
+
+    def summary(self):
+        """Returns a dictionary of the count and the mean, median, 95th percentile, and maximum in milliseconds."""
+        if not self.count:
+            return {'count': 0}
+        ordered = sorted(self.samples)
+        return {'count': self.count, 'mean_ms': round(self.total / self.count * 1000, 3),
+                'p50_ms': round(ordered[len(ordered) // 2] * 1000, 3),
+                'p95_ms': round(ordered[min(len(ordered) - 1, -(-95 * len(ordered) // 100) - 1)] * 1000, 3),
+                'max_ms': round(self.maximum * 1000, 3)}
+
+
+class Game:
+    """One game being hosted: its engine, who sits in every seat, and who gets its updates."""
+
+    __slots__ = ('game_id', 'engine', 'bots', 'seats', 'subscribers', 'bot_thinking', 'latency', 'aborted')
+
+    def __init__(self, game_id, configuration, bots):
+        """Creates a game of the configuration.  Bots is a dictionary of {seat : bot specification}; every other
+        seat is left open for a person."""
+        self.game_id = game_id
+        self.engine = PentagoEngine.PentagoEngine(*configuration)
+        self.bots = dict(bots)
+        self.seats = [None] * self.engine.get_player_count()
+        self.subscribers = set()
+        self.bot_thinking = False
+        self.latency = {'human': LatencyStats(), 'bot': LatencyStats()}
+
+        # The reason the game was stopped before it finished, like a bot that failed, or None.
+        self.aborted = None
+
+    def is_over(self):
+        """Returns true once the game has finished or was stopped."""
+        return (self.aborted is not None) or self.engine.is_terminal()
+
+    def is_started(self):
+        """Returns true once every seat that isn't a bot has been taken."""
+        return all((seat in self.bots) or (self.seats[seat] is not None) for seat in range(len(self.seats)))
+
+    def open_seats(self):
+        """Returns a list of the seats nobody has taken and that aren't bots."""
+        return [seat for seat in range(len(self.seats)) if (seat not in self.bots) and (self.seats[seat] is None)]
+
+    def state(self):
+        """Returns the "state" message of the game."""
+        engine = self.engine
+        board_length = engine.get_board_length()
+        history = engine.get_history()
+        return {'type': 'state', 'game': self.game_id, 'config': list(engine.get_configuration()),
+                'board': [[engine.get_cell(row, column) for column in range(board_length)]
+                          for row in range(board_length)],
+                'to_move': engine.get_current_player(), 'moves': len(history),
+                'last_move': list(history[-1]) if history else None, 'winners': engine.winners(),
+                'over': self.is_over(), 'aborted': self.aborted, 'started': self.is_started(),
+                'open_seats': self.open_seats()}
+
+
+class Connection:
+    """One client.  Messages are written without waiting for the client to read them; a client that falls too far
+    behind is dropped instead of holding up everyone else."""
+
+    __slots__ = ('reader', 'writer', 'games')
+
+    def __init__(self, reader, writer):
+        """Wraps the streams of a new client."""
+        self.reader = reader
+        self.writer = writer
+        self.games = set()
+
+    def send(self, message):
+        """Queues a message for the client."""
+        self.send_line(encode_message(message))
+
+    def send_line(self, line):
+        """Queues a message that was already encoded by encode_message, so a message going to many clients is only
+        encoded once."""
+        if self.writer.is_closing():
+            return
+        if self.writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+            self.writer.close()
+            return
+        self.writer.write(line)
+
+
+class GameServer:
+    """Hosts games and the connections that play and watch them."""
+
+    def __init__(self, workers=None):
+        """Creates a server whose bots think in a pool of workers processes."""
+        self.__games = {}
+        self.__next_game_id = 1
+        self.__workers = workers or os.cpu_count() or 1
+        self.__pool = None
+        self.__handlers = {'create': self.create_game, 'join': self.join_game, 'watch': self.watch_game,
+                           'move': self.human_move, 'leave': self.leave_game, 'list': self.list_games,
+                           'stats': self.game_stats}
+
+    def get_games(self):
+        """Gets the dictionary of the games being hosted, by their ids."""
+        return self.__games
+
+    def get_pool(self):
+        """Gets the process pool that bots think in, starting it the first time a bot needs it.  The processes are
+        spawned rather than forked, since a forked process would hold on to copies of every open connection and a
+        closed connection would never reach its client."""
+        if self.__pool is None:
+            self.__pool = ProcessPoolExecutor(self.__workers, mp_context=multiprocessing.get_context('spawn'))
+        return self.__pool
+
+    def close(self):
+        """Shuts down the process pool."""
+        if self.__pool is not None:
+            self.__pool.shutdown(cancel_futures=True)
+            self.__pool = None
+
+    def drop_pool(self, pool):
+        """Lets go of a process pool that broke, so the next bot starts a new one.  A pool that was already
+        replaced (by another game that saw it break first) is left alone."""
+        if self.__pool is pool:
+            self.__pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def handle_connection(self, reader, writer):
+        """Reads one message per line from a client until it disconnects, and answers each of them."""
+        connection = Connection(reader, writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break
+                if not line:
+                    break
+                received = time.perf_counter()
+                message = None
+                try:
+                    message = json.loads(line)
+                    if not isinstance(message, dict):
+                        raise ValueError("A message must be a JSON object.")
+                    handler = self.__handlers.get(message.get('type'))
+                    if handler is None:
+                        raise ValueError("Unknown message type.  Types : " + ", ".join(sorted(self.__handlers)))
+                    reply = handler(connection, message, received)
+                except (ValueError, TypeError, KeyError) as error:
+                    reply = {'type': 'error', 'message': str(error)}
+                if reply is not None:
+                    if isinstance(message, dict) and ('id' in message):
+                        reply['id'] = message['id']
+                    connection.send(reply)
+        finally:
+            for game_id in list(connection.games):
+                if game_id in self.__games:
+                    self.remove_from_game(connection, self.__games[game_id])
+            writer.close()
+
+    def find_game(self, message):
+        """Returns the game named in a message.  Raises a ValueError if there isn't one."""
+        game = self.__games.get(message.get('game'))
+        if game is None:
+            raise ValueError("There is no game " + str(message.get('game')) + ".")
+        return game
+
+    def create_game(self, connection, message, received):
+        """Creates a game and makes the client watch it.  A game whose seats are all bots starts playing at once."""
+        configuration = tuple(int(value) for value in message['config'])
+        if len(configuration) != 4:
+            raise ValueError("A configuration needs 4 numbers.")
+        PentagoEngine.validate_configuration(*configuration)
+        bots = {}
+        for seat, specification in message.get('bots', {}).items():
+            seat = int(seat)
+            if not 0 <= seat < configuration[3]:
+                raise ValueError("There is no seat " + str(seat) + " in this game.")
+            Tournament.parse_bot(specification)
+            bots[seat] = specification
+
+        game = Game(self.__next_game_id, configuration, bots)
+        self.__games[game.game_id] = game
+        self.__next_game_id += 1
+        game.subscribers.add(connection)
+        connection.games.add(game.game_id)
+        connection.send({'type': 'created', 'game': game.game_id})
+        self.broadcast(game)
+        self.start_bot_turn(game)
+        return None
+
+    def join_game(self, connection, message, received):
+        """Seats the client in a game, in the seat it asked for or the first open one."""
+        game = self.find_game(message)
+        open_seats = game.open_seats()
+        seat = message.get('seat', open_seats[0] if open_seats else None)
+        if seat not in open_seats:
+            raise ValueError("That seat isn't open.  Open seats : " + str(open_seats))
+        game.seats[seat] = connection
+        game.subscribers.add(connection)
+        connection.games.add(game.game_id)
+        connection.send({'type': 'joined', 'game': game.game_id, 'seat': seat})
+        self.broadcast(game)
+        self.start_bot_turn(game)
+        return None
+
+    def watch_game(self, connection, message, received):
+        """Sends the client every update of a game without giving it a seat."""
+        game = self.find_game(message)
+        game.subscribers.add(connection)
+        connection.games.add(game.game_id)
+        connection.send({'type': 'watching', 'game': game.game_id})
+        connection.send(game.state())
+        return None
+
+    def leave_game(self, connection, message, received):
+        """Takes the client out of a game."""
+        game = self.find_game(message)
+        self.remove_from_game(connection, game)
+        return {'type': 'left', 'game': game.game_id}
+
+    def remove_from_game(self, connection, game):
+        """Takes a client out of a game, either because it left or because it disconnected.  Its seat opens up
+        again.  A game nobody is in is removed unless bots are still playing it."""
+        game.subscribers.discard(connection)
+        connection.games.discard(game.game_id)
+        for seat in range(len(game.seats)):
+            if game.seats[seat] is connection:
+                game.seats[seat] = None
+        if not game.subscribers and (game.is_over() or not game.is_started()):
+            del self.__games[game.game_id]
+        else:
+            self.broadcast(game)
+
+    def list_games(self, connection, message, received):
+        """Returns a summary of every game being hosted."""
+        return {'type': 'games', 'games': [
+            {'game': game.game_id, 'config': list(game.engine.get_configuration()), 'moves': game.engine.get_move_count(),
+             'open_seats': game.open_seats(), 'over': game.is_over()} for game in self.__games.values()]}
+
+    def game_stats(self, connection, message, received):
+        """Returns the latency of the moves of a game."""
+        game = self.find_game(message)
+        return {'type': 'stats', 'game': game.game_id,
+                'latency': {kind: stats.summary() for kind, stats in game.latency.items()}}
+
+    def human_move(self, connection, message, received):
+        """Applies a move sent by the client in the seat whose turn it is."""
+        game = self.find_game(message)
+        engine = game.engine
+        if game.aborted is not None:
+            raise ValueError("The game was stopped : " + game.aborted)
+        if not game.is_started():
+            raise ValueError("The game is waiting for players.  Open seats : " + str(game.open_seats()))
+        player = engine.get_current_player()
+        if game.seats[player] is not connection:
+            raise ValueError("It isn't your turn.")
+        move = parse_move(message.get('move'))
+        problem = engine.check_move(move)
+        if problem is not None:
+            raise ValueError(problem)
+        engine.apply(move)
+        self.broadcast(game)
+        game.latency['human'].add(time.perf_counter() - received)
+        self.start_bot_turn(game)
+        return None
+
+    def broadcast(self, game):
+        """Sends the game's state to everyone in it."""
+        line = encode_message(game.state())
+        for subscriber in game.subscribers:
+            subscriber.send_line(line)
+
+    def start_bot_turn(self, game):
+        """Starts working out a bot's move if it's a bot's turn in a game that has started."""
+        engine = game.engine
+        if game.bot_thinking or game.is_over() or not game.is_started():
+            return
+        if engine.get_current_player() not in game.bots:
+            return
+        game.bot_thinking = True
+        asyncio.get_running_loop().create_task(self.play_bot_turn(game))
+
+    async def play_bot_turn(self, game):
+        """Asks the process pool for the bot's move, applies it, and carries on with the next bot's turn.  If the
+        pool breaks, the move is tried again on a new pool; if the bot itself fails, the game is stopped, since
+        nobody else can take its turn."""
+        engine = game.engine
+        player = engine.get_current_player()
+        started = time.perf_counter()
+        try:
+            for attempt in range(BOT_ATTEMPTS):
+                pool = self.get_pool()
+                try:
+                    move = await asyncio.get_running_loop().run_in_executor(
+                        pool, choose_bot_move, game.bots[player], game.game_id * 1000 + player,
+                        engine.get_configuration(), engine.get_history())
+                    break
+                except BrokenProcessPool:
+                    self.drop_pool(pool)
+                    if attempt == BOT_ATTEMPTS - 1:
+                        raise
+            engine.apply(move)
+        except Exception as error:
+            game.aborted = "The bot in seat " + str(player) + " failed : " + (str(error) or type(error).__name__)
+            for subscriber in game.subscribers:
+                subscriber.send({'type': 'error', 'game': game.game_id, 'message': game.aborted})
+        finally:
+            game.bot_thinking = False
+        self.broadcast(game)
+        if game.aborted is None:
+            game.latency['bot'].add(time.perf_counter() - started)
+
+        # A game of bots that nobody is watching any more is removed when it ends.
+        if game.is_over() and not game.subscribers:
+            self.__games.pop(game.game_id, None)
+        self.start_bot_turn(game)
+
+
+def encode_message(message):
+    """Returns a message as one line of compact JSON."""
+    return json.dumps(message, separators=(',', ':')).encode() + b'\n'
+
+
+def parse_move(move):
+    """Returns a move tuple from a move message's [row, column, sub-board, rotation].  The column can be a label like
+    "B" or a number.  Raises a ValueError if the move isn't written that way; whether it's legal is up to the
+    engine."""
+    if (not isinstance(move, list)) or (len(move) != 4):
+        raise ValueError("A move must be [row, column, sub-board, rotation].")
+    row, column, sub_board, rotation = move
+    if isinstance(column, str):
+        column = ScalablePentago.column_number(column)
+        if column < 0:
+            raise ValueError("Your input for column is not alphabetic.  Please input its letters.")
+    if (not isinstance(rotation, str)) or (rotation.upper() not in PentagoEngine.ROTATIONS):
+        raise ValueError("Your input was neither 'c', 'C', 'a', or 'A' for the rotation's direction.")
+    return row, column, sub_board, rotation.upper()
+
+
+def choose_bot_move(specification, seed, configuration, history):
+    """Returns the move a bot makes after the moves of history.  This runs inside of the worker processes, so it
+    only takes and returns plain data.  Bots are kept between calls by their specification, so ones with tables or
+    trees can reuse them; the seed is only used when a bot is made."""
+    bot = worker_bot_cache.pop(specification, None)
+    if bot is None:
+        bot = Tournament.make_bot(specification, seed)
+        while len(worker_bot_cache) >= WORKER_BOTS:
+            evicted = worker_bot_cache.pop(next(iter(worker_bot_cache)))
+            if hasattr(evicted, 'close'):
+                evicted.close()
+    worker_bot_cache[specification] = bot
+    engine = PentagoEngine.PentagoEngine(*configuration)
+    for move in history:
+        engine.apply(move)
+    return bot.choose_move(engine)
+
+
+async def serve(host=None, port=None, unix_path=None, workers=None):
+    """Runs a server on a TCP port, a Unix socket, or both, until it's stopped."""
+    server = GameServer(workers)
+    listeners = []
+    if port is not None:
+        listeners.append(await asyncio.start_server(server.handle_connection, host, port, limit=LINE_LIMIT))
+        print("Listening on " + str(host or '*') + ":" + str(port) + ".")
+    if unix_path is not None:
+        if os.path.exists(unix_path):
+            os.remove(unix_path)
+        listeners.append(await asyncio.start_unix_server(server.handle_connection, unix_path, limit=LINE_LIMIT))
+        print("Listening on " + unix_path + ".")
+    try:
+        await asyncio.gather(*(listener.serve_forever() for listener in listeners))
+    finally:
+        server.close()
+
+
+def main(arguments=None):
+    """Starts a server as set up by command line arguments."""
+    parser = argparse.ArgumentParser(description="Hosts games of Scalable Pentago over TCP and Unix sockets.")
+    parser.add_argument('--host', default='127.0.0.1', help="the address to listen on (default : 127.0.0.1)")
+    parser.add_argument('--port', type=int, help="the TCP port to listen on")
+    parser.add_argument('--unix', metavar='PATH', help="the Unix socket to listen on")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="the number of bot processes")
+    options = parser.parse_args(arguments)
+    if (options.port is None) and (options.unix is None):
+        parser.error("Give a --port, a --unix socket, or both.")
+    try:
+        asyncio.run(serve(options.host, options.port, options.unix, options.workers))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+# Running the server if this script is the file that's designated as "main".
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,237 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Optional counters and timers for the hot paths of Scalable Pentago.  Instrumentation works by
+#               putting a wrapper in front of the methods of one object (an engine, a console game, or a computer
+#               player) that counts every call, times it, and keeps track of how deep recursive calls go.  Nothing
+#               is changed on the classes themselves, so games that aren't instrumented run exactly the code they
+#               always did and pay nothing for it.  A console game can be played with a summary printed after every
+#               turn and for the whole game, and one game can be run under cProfile to write a profile that tools
+#               like snakeviz or flameprof can turn into a flame graph.
+#
+#               Example : python Instrumentation.py
+#                         python Instrumentation.py --profile game.prof
+
+# Importing argparse so that an instrumented game can be started from the command line.
+import argparse
+
+# Importing cProfile and pstats for the optional profile of a whole game.
+import cProfile
+import pstats
+
+# Importing functools so that wrappers keep the names and docstrings of the methods they wrap.
+import functools
+
+# Importing time for the timers.
+import time
+
+# Importing the console game so that it can be instrumented and played.
+import ScalablePentago
+
+
+# The methods of each object that a game's instrumentation wraps.  Input handling is included so that time spent
+# waiting on players can be told apart from time spent on the rules.  Wins are found by the engine's sequence checks,
+# which apply calls, so they're wrapped on their own to split the time of win detection out of apply's.
+ENGINE_METHODS = ('apply', 'undo', 'rotate', 'legal_moves', 'has_sequence_touching', 'has_sequence_through')
+CONSOLE_METHODS = ('get_game_state', 'is_board_full', 'print_board', 'obtain_row_and_column', 'obtain_sub_board',
+                   'obtain_rotation_direction')
+COMPUTER_METHODS = ('choose_move',)
+
+
+class CallStats:
+    """The counts for one wrapped method.  Time is only added up for the outermost call of a recursion, so a method
+    that calls itself isn't counted more than once for the same stretch of time."""
+
+    __slots__ = ('calls', 'seconds', 'depth', 'max_depth')
+
+    def __init__(self):
+        """Creates empty counts."""
+        self.calls = 0
+        self.seconds = 0.0
+        self.depth = 0
+        self.max_depth = 0
+
+
+class Instrumentation:
+    """Counts and times the calls of the methods it wraps, and splits them up into turns.  Every wrapped method is
+    reported by a label, like "engine.rotate"."""
+
+    def __init__(self):
+        """Creates instrumentation that hasn't wrapped anything yet."""
+        self.__stats = {}
+        self.__wrapped = []
+
+        # Search nodes reported by computer players, which are counted inside of the search itself.
+        self.__search_nodes = 0
+
+        # The counts at the start of the current turn, and the summary of every finished turn.
+        self.__turn_label = None
+        self.__turn_start = None
+        self.__turn_started_at = 0.0
+        self.__turns = []
+
+    def get_turns(self):
+        """Gets the list of summaries of every finished turn, in order."""
+        return self.__turns
+
+    def attach(self, target, method_names, prefix):
+        """Wraps the named methods of the target object.  The wrappers are stored on the object itself, so other
+        objects of the same class are left alone.  Methods that the object doesn't have are skipped."""
+        for name in method_names:
+            if not hasattr(target, name):
+                continue
+            label = prefix + "." + name
+            self.__stats.setdefault(label, CallStats())
+            setattr(target, name, self.wrap(label, getattr(target, name)))
+            self.__wrapped.append((target, name))
+
+    def detach(self):
+        """Removes every wrapper, so the objects go back to calling their own methods."""
+        for target, name in reversed(self.__wrapped):
+            if name in vars(target):
+                delattr(target, name)
+        self.__wrapped = []
+
+    def wrap(self, label, method):
+        """Returns a function that calls the method and adds the call to the counts of the label."""
+        stats = self.__stats[label]
+        clock = time.perf_counter
+
+        @functools.wraps(method)
+        def wrapper(*arguments, **keywords):
+            stats.calls += 1
+            stats.depth += 1
+            if stats.depth > stats.max_depth:
+                stats.max_depth = stats.depth
+            if stats.depth > 1:
+                try:
+                    return method(*arguments, **keywords)
+                finally:
+                    stats.depth -= 1
+            start = clock()
+            try:
+                return method(*arguments, **keywords)
+            finally:
+                stats.seconds += clock() - start
+                stats.depth -= 1
+
+        return wrapper
+
+    def attach_search_counter(self, player, prefix="computer"):
+        """Wraps a computer player's choose_move so that the positions it searched are added to the search nodes.
+        Alpha-beta players report positions and Monte Carlo players report rollouts."""
+        self.attach(player, COMPUTER_METHODS, prefix)
+        choose_move = player.choose_move
+
+        @functools.wraps(choose_move)
+        def counted_choose_move(engine):
+            move = choose_move(engine)
+            if hasattr(player, 'get_last_nodes'):
+                self.__search_nodes += player.get_last_nodes()
+            elif hasattr(player, 'get_last_visits'):
+                self.__search_nodes += player.get_last_visits()
+            return move
+
+        player.choose_move = counted_choose_move
+
+    def attach_game(self, console, report=print):
+        """Wraps the console game, its engine, and its computer player, and makes every turn print a summary of the
+        calls that were made during it."""
+        self.attach(console.get_engine(), ENGINE_METHODS, "engine")
+        self.attach(console, CONSOLE_METHODS, "console")
+        self.attach_search_counter(console.get_computer())
+
+        # Splitting the counts up by turn.  The turn's number is worked out before the move is made.
+        take_turn = console.take_turn
+
+        @functools.wraps(take_turn)
+        def counted_take_turn():
+            engine = console.get_engine()
+            self.begin_turn("Turn %d (player %d)" % (engine.get_move_count() + 1, engine.get_current_player()))
+            try:
+                take_turn()
+            finally:
+                report(format_summary(self.end_turn()))
+
+        console.take_turn = counted_take_turn
+        self.__wrapped.append((console, 'take_turn'))
+
+    def snapshot(self):
+        """Returns a dictionary of the current counts: (calls, seconds, max_depth) for every label, plus the search
+        nodes under "search.nodes"."""
+        counts = {label: (stats.calls, stats.seconds, stats.max_depth) for label, stats in self.__stats.items()}
+        counts['search.nodes'] = (self.__search_nodes, 0.0, 0)
+        return counts
+
+    def begin_turn(self, label):
+        """Marks the start of a turn."""
+        self.__turn_label = label
+        self.__turn_start = self.snapshot()
+        self.__turn_started_at = time.perf_counter()
+
+    def end_turn(self):
+        """Marks the end of the turn and returns its summary: a dictionary with the turn's label, its length in
+        seconds, and the counts of the calls made during it."""
+        seconds = time.perf_counter() - self.__turn_started_at
+        summary = {'label': self.__turn_label, 'seconds': seconds,
+                   'counts': difference(self.snapshot(), self.__turn_start)}
+        self.__turns.append(summary)
+        return summary
+
+    def game_summary(self):
+        """Returns the summary of every call made while the instrumentation was attached, in the same form as a
+        turn's summary."""
+        return {'label': "Game (%d turns)" % len(self.__turns),
+                'seconds': sum(turn['seconds'] for turn in self.__turns), 'counts': self.snapshot()}
+
+
+def difference(counts, earlier_counts):
+    """Returns the counts made between two snapshots.  The deepest recursion can't be split up, so the later
+    snapshot's value is kept."""
+    result = {}
+    for label, (calls, seconds, max_depth) in counts.items():
+        earlier_calls, earlier_seconds, earlier_depth = earlier_counts.get(label, (0, 0.0, 0))
+        result[label] = (calls - earlier_calls, seconds - earlier_seconds, max_depth)
+    return result
+
+
+def format_summary(summary):
+    """Returns a summary as printable text, with one line for every label that was called, slowest first."""
+    lines = ["%s : %.3f ms" % (summary['label'], summary['seconds'] * 1000)]
+    counts = sorted(summary['counts'].items(), key=lambda item: -item[1][1])
+    for label, (calls, seconds, max_depth) in counts:
+        if not calls:
+            continue
+        if label == 'search.nodes':
+            lines.append("    %-34s %10d" % (label, calls))
+            continue
+        depth = "   deepest %d" % max_depth if max_depth > 1 else ""
+        lines.append("    %-34s %10d calls %12.3f ms%s" % (label, calls, seconds * 1000, depth))
+    return '\n'.join(lines)
+
+
+def play_instrumented_game(profile_path=None):
+    """Sets up a console game, instruments it, and plays it.  A summary is printed after every turn and for the
+    whole game.  With a profile path, the game is also run under cProfile and its stats are written there."""
+    console = ScalablePentago.ScalablePentago()
+    instrumentation = Instrumentation()
+    instrumentation.attach_game(console)
+
+    if profile_path is None:
+        console.gameplay_start()
+    else:
+        profiler = cProfile.Profile()
+        profiler.runcall(console.gameplay_start)
+        profiler.dump_stats(profile_path)
+        print('\n' + "The profile was written to " + profile_path + ".")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+
+    print()
+    print(format_summary(instrumentation.game_summary()))
+    instrumentation.detach()
+
+
+# Playing an instrumented game if this script is the file that's designated as "main".
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plays a console game of Scalable Pentago with call counters.")
+    parser.add_argument('--profile', metavar='PATH', help="also run the game under cProfile and write its stats here")
+    play_instrumented_game(parser.parse_args().profile)
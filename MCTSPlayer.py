@@ -0,0 +1,319 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : A Monte Carlo tree search player for Scalable Pentago.  Instead of searching every move like the
+#               alpha-beta player, it plays a large number of quick random games (rollouts) from the position and
+#               grows a tree towards the moves that win the most often, using UCT to balance trying moves that
+#               look good against trying moves that haven't been tried much.  Its cost doesn't depend on the number
+#               of moves, so it keeps playing sensibly on big boards where alpha-beta can't finish one turn.
+#               Searches can be spread over several processes (root parallelism): every process grows its own tree
+#               and the visits of the top moves are added up.  The tree of the last search is kept, so the part of
+#               it under the moves that were actually played is reused on the next turn.
+
+# Importing math for the UCT formula.
+import math
+
+# Importing random for the rollouts.
+import random
+
+# Importing time so that the search can stop when its time for the move runs out.
+import time
+
+# Importing the process pool that runs the extra trees.
+from concurrent.futures import ProcessPoolExecutor
+
+# Importing the engine so that worker processes can rebuild the position.
+import PentagoEngine
+
+
+# How strongly UCT favours moves that haven't been visited much.  The square root of 2 is the usual value.
+EXPLORATION = math.sqrt(2)
+
+# The chance that a rollout move places its marble next to one of the mover's own marbles instead of on any empty
+# node.  Random games where marbles gather together are a little closer to real games.
+ROLLOUT_BIAS = 0.5
+
+# How many random nodes are tried before a random move falls back to listing the empty nodes.
+RANDOM_NODE_ATTEMPTS = 8
+
+# The masks of every node that isn't in the first column and every node that isn't in the last column, shared by every
+# game with the same board length.  The keys are board lengths.
+column_mask_cache = {}
+
+
+class TreeNode:
+    """A position in the search tree.  The attributes are plain rather than private since the tree is walked millions
+    of times per move; only MCTSPlayer touches them."""
+
+    __slots__ = ('move', 'player', 'children', 'visits', 'reward', 'move_total')
+
+    def __init__(self, move, player):
+        """Creates an unvisited node for the position reached by move, which was made by player."""
+        self.move = move
+        self.player = player
+        self.children = {}
+        self.visits = 0
+
+        # The total reward of the player that made the move into this node, over every rollout that passed through it.
+        self.reward = 0.0
+
+        # The number of legal moves from this node, worked out the first time the node is expanded.
+        self.move_total = None
+
+
+class MCTSPlayer:
+    """Chooses moves for whichever player's turn it is in a PentagoEngine.  The engine is searched in place with
+    apply and undo, and it is always returned in the same position it was passed in."""
+
+    def __init__(self, time_limit=5.0, workers=1, seed=None, max_visits=None, exploration=EXPLORATION,
+                 rollout_bias=ROLLOUT_BIAS):
+        """Creates a player that thinks for at most time_limit seconds per move.  With more than 1 worker, extra trees
+        are grown in that many - 1 other processes while this process grows its own.  A max_visits stops the search
+        early, which is useful for tests and for weaker opponents."""
+        self.__time_limit = time_limit
+        self.__workers = workers
+        self.__random = random.Random(seed)
+        self.__max_visits = max_visits
+        self.__exploration = exploration
+        self.__rollout_bias = rollout_bias
+        self.__pool = None
+
+        # The tree of the last search and the moves that led to its root, so that it can be reused.
+        self.__root = None
+        self.__root_history = None
+
+        # Statistics of the last search, for anyone tuning the player.
+        self.__last_visits = 0
+        self.__last_seconds = 0.0
+        self.__last_reused = 0
+
+    def get_last_visits(self):
+        """Gets the number of rollouts that were played for the last move, in every process."""
+        return self.__last_visits
+
+    def get_last_visits_per_second(self):
+        """Gets the number of rollouts played per second for the last move, in every process."""
+        return self.__last_visits / self.__last_seconds if self.__last_seconds else 0.0
+
+    def get_last_reused(self):
+        """Gets the number of visits the last search started with from the tree of the search before it."""
+        return self.__last_reused
+
+    def close(self):
+        """Shuts down the worker processes, if there are any."""
+        if self.__pool is not None:
+            self.__pool.shutdown()
+            self.__pool = None
+
+    def choose_move(self, engine):
+        """Returns the move that was visited the most for the player whose turn it is.  Raises a ValueError if the
+        game is already over."""
+        if engine.is_terminal():
+            raise ValueError("The game is over.  No more moves can be made.")
+        start = time.perf_counter()
+        deadline = start + self.__time_limit
+        # The workers get the deadline on the wall clock, since it reads the same in every process, so the time they
+        # spend starting up and waiting in the pool's queue comes out of their share instead of being added on.
+        shared_deadline = time.time() + self.__time_limit
+        history = engine.get_history()
+
+        # Starting the extra trees first so that they search while this process does.
+        futures = []
+        if self.__workers > 1:
+            if self.__pool is None:
+                self.__pool = ProcessPoolExecutor(max_workers=self.__workers - 1)
+            futures = [self.__pool.submit(search_worker, engine.get_configuration(), history, shared_deadline,
+                                          self.__random.getrandbits(64), self.__max_visits, self.__exploration,
+                                          self.__rollout_bias)
+                       for worker in range(self.__workers - 1)]
+
+        # Growing this process's tree, starting from what is left of the last one.
+        root = self.reuse_tree(history)
+        self.__last_reused = root.visits
+        visits = search_tree(engine, root, deadline, self.__max_visits, self.__random, self.__exploration,
+                             self.__rollout_bias)
+
+        # Adding up the visits of the top moves in every tree.
+        totals = {move: child.visits for move, child in root.children.items()}
+        for future in futures:
+            worker_totals, worker_visits = future.result()
+            visits += worker_visits
+            for move, move_visits in worker_totals.items():
+                totals[move] = totals.get(move, 0) + move_visits
+
+        self.__root = root
+        self.__root_history = history
+        self.__last_visits = visits
+        self.__last_seconds = time.perf_counter() - start
+        return max(totals, key=totals.get)
+
+    def reuse_tree(self, history):
+        """Returns the node of the last search's tree that matches the position, or a new root if the tree can't be
+        reused.  The tree can be reused when the moves played since the last search all lead down from its root."""
+        root = self.__root
+        if (root is not None) and (history[:len(self.__root_history)] == self.__root_history):
+            for move in history[len(self.__root_history):]:
+                root = root.children.get(move)
+                if root is None:
+                    break
+            else:
+                return root
+        return TreeNode(None, None)
+
+
+def search_tree(engine, root, deadline, max_visits, generator, exploration, rollout_bias):
+    """LOOPING METHOD : Grows a tree from the engine's position until the deadline passes or max_visits rollouts
+    have been played.  Every loop selects a path down the tree with UCT, adds one new node at its end, plays a random
+    game from there, and adds the result to every node on the path.  Returns the number of rollouts played."""
+    sub_board_number = engine.get_sub_board_number()
+    visits = 0
+    while True:
+
+        # EXIT : Stopping when the time or the number of visits runs out.  At least one rollout is always played so
+        # that there is a move to return.
+        if visits and ((time.perf_counter() > deadline) or ((max_visits is not None) and (visits >= max_visits))):
+            return visits
+
+        # Selecting a path down the tree.  A node is only left behind once every one of its moves has a child.
+        node = root
+        path = [root]
+        while not engine.is_terminal():
+            if node.move_total is None:
+                node.move_total = (engine.get_board_length() ** 2 - engine.get_marble_count()) * sub_board_number * 2
+            if len(node.children) < node.move_total:
+
+                # Expanding a random move that doesn't have a child yet.
+                move = random_untried_move(engine, node, generator)
+                child = TreeNode(move, engine.get_current_player())
+                node.children[move] = child
+                engine.apply(move)
+                path.append(child)
+                break
+            node = select_child(node, exploration)
+            engine.apply(node.move)
+            path.append(node)
+
+        # Playing the rest of the game at random and taking back every move afterwards.
+        rewards = rollout(engine, generator, rollout_bias)
+        for step in range(len(path) - 1):
+            engine.undo()
+
+        # Adding the result to the path.
+        for node in path:
+            node.visits += 1
+            if node.player is not None:
+                node.reward += rewards[node.player]
+        visits += 1
+
+
+def select_child(node, exploration):
+    """Returns the child with the highest UCT value: its average reward plus a bonus that shrinks the more it has
+    been visited compared to its parent."""
+    log_visits = math.log(node.visits) if node.visits else 0.0
+    best_child = None
+    best_value = -1.0
+    for child in node.children.values():
+        value = child.reward / child.visits + exploration * math.sqrt(log_visits / child.visits)
+        if value > best_value:
+            best_value = value
+            best_child = child
+    return best_child
+
+
+def random_untried_move(engine, node, generator):
+    """Returns a random legal move that node doesn't have a child for yet.  Random moves are drawn until one is new;
+    once most moves have children, the untried moves are listed instead."""
+    if len(node.children) * 2 < node.move_total:
+        while True:
+            move = random_move(engine, generator, 0.0)
+            if move not in node.children:
+                return move
+    return generator.choice([move for move in engine.legal_moves() if move not in node.children])
+
+
+def random_move(engine, generator, bias):
+    """Returns a random legal move.  With a chance of bias, the marble goes next to one of the mover's own marbles
+    when any of those nodes are empty."""
+    board_length = engine.get_board_length()
+    empty = engine.get_empty_mask()
+    node = None
+    if bias and (generator.random() < bias):
+        node = random_bit(neighbours(engine.get_boards()[engine.get_current_player()], board_length) & empty,
+                          generator)
+    if node is None:
+        node_count = board_length * board_length
+        for attempt in range(RANDOM_NODE_ATTEMPTS):
+            candidate = generator.randrange(node_count)
+            if empty >> candidate & 1:
+                node = candidate
+                break
+        else:
+            node = random_bit(empty, generator)
+    row, column = divmod(node, board_length)
+    return (row, column, generator.randint(1, engine.get_sub_board_number()),
+            PentagoEngine.ROTATIONS[generator.getrandbits(1)])
+
+
+def random_bit(bits, generator):
+    """Returns the index of a random set bit of an integer, or None if no bits are set."""
+    count = bits.bit_count()
+    if not count:
+        return None
+    for skip in range(generator.randrange(count)):
+        bits &= bits - 1
+    return (bits & -bits).bit_length() - 1
+
+
+def neighbours(board, board_length):
+    """Returns the bitboard of every node next to (or diagonal to) a node of the passed bitboard."""
+    full, not_first_column, not_last_column = get_column_masks(board_length)
+
+    # Shifting right by 1 column moves nodes off of the last column onto the first column of the next row, so those
+    # bits are cleared; shifting left does the same the other way around.
+    right = (board << 1) & not_first_column
+    left = (board >> 1) & not_last_column
+    sideways = board | right | left
+    return (sideways | (sideways << board_length) | (sideways >> board_length)) & full
+
+
+def rollout(engine, generator, bias):
+    """Plays random moves until the game is over, takes them all back, and returns the list of every player's
+    reward.  A sole winner gets 1, winners that share a win split 1 between them, and a full board without a winner
+    splits 1 between every player."""
+    moves_made = 0
+    while not engine.is_terminal():
+        engine.apply(random_move(engine, generator, bias))
+        moves_made += 1
+    winners = engine.winners() or range(engine.get_player_count())
+    rewards = [0.0] * engine.get_player_count()
+    for winner in winners:
+        rewards[winner] = 1.0 / len(winners)
+    for move in range(moves_made):
+        engine.undo()
+    return rewards
+
+
+def search_worker(configuration, history, shared_deadline, seed, max_visits, exploration, rollout_bias):
+    """Grows a fresh tree for the position reached by playing history on a new game with the configuration, until
+    shared_deadline passes on the wall clock.  This runs inside of the worker processes, so it only takes and returns
+    plain data: a tuple of (visits of every top move, total number of rollouts)."""
+    deadline = time.perf_counter() + (shared_deadline - time.time())
+    engine = PentagoEngine.PentagoEngine(*configuration)
+    for move in history:
+        engine.apply(move)
+    root = TreeNode(None, None)
+    visits = search_tree(engine, root, deadline, max_visits, random.Random(seed), exploration, rollout_bias)
+    return {move: child.visits for move, child in root.children.items()}, visits
+
+
+def get_column_masks(board_length):
+    """Returns a tuple of (every node, every node but the first column, every node but the last column) bitmasks for
+    the board length, building them the first time they're asked for."""
+    if board_length not in column_mask_cache:
+        full = (1 << (board_length * board_length)) - 1
+        not_first_column = full
+        not_last_column = full
+        for row in range(board_length):
+            not_first_column ^= 1 << (row * board_length)
+            not_last_column ^= 1 << (row * board_length + board_length - 1)
+        column_mask_cache[board_length] = (full, not_first_column, not_last_column)
+    return column_mask_cache[board_length]
@@ -0,0 +1,332 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : An opening book for Scalable Pentago.  The first turns of a game are the slowest to search since the
+#               board is nearly empty and almost every (node, sub-board, direction) is a move, yet they come up in
+#               every game.  The book is built once by playing games against itself with the alpha-beta player (and
+#               optionally by following the openings of recorded games), and it stores the move the search chose for
+#               every position it saw.  Positions are stored by the hash of their canonical form, so rotated and
+#               mirrored copies of a position share one entry, and the move is stored as it is played in the
+#               canonical form and turned back with the inverse symmetry when it's looked up.
+#
+#               The book is one file per configuration with its entries sorted by key.  It's opened with mmap, so
+#               opening a book doesn't read it, and a lookup is a binary search straight over the mapped keys.
+#
+#               Example : python OpeningBook.py book.spob --config 3,4,5,2 --plies 4 --games 40 --depth 2
+#                         python OpeningBook.py book.spob --show
+#
+#               File layout (numbers are little-endian) :
+#                   header  : MAGIC, then version, sub-board length, sub-board number, winning length, player
+#                             count, and a reserved 0 (2 bytes each), then the entry count (8 bytes)
+#                   entries : every key (8 bytes each, sorted), then every move code (4 bytes each), then every
+#                             score (4 bytes each), then every search depth (2 bytes each), all in the same order
+#               Configurations whose numbers or move codes don't fit their fields can't have a book.  The sections
+#               are written and mapped in the machine's own byte order, so books can only be used on little-endian
+#               machines.
+
+# Importing argparse so that books can be built from the command line.
+import argparse
+
+# Importing array so that the sections of the book can be written as packed numbers.
+from array import array
+
+# Importing bisect for the binary search over the mapped keys.
+import bisect
+
+# Importing mmap so that books are read straight from the disk instead of being loaded.
+import mmap
+
+# Importing os so that a rebuilt book replaces the old one in a single step.
+import os
+
+# Importing random so that the games that build the book can stray from the searched moves.
+import random
+
+# Importing struct to pack and unpack the header.
+import struct
+
+# Importing sys to check the machine's byte order.
+import sys
+
+# Importing the computer player whose searches fill the book.
+import AlphaBetaPlayer
+
+# Importing the game records so that the openings of recorded games can be added.
+import GameRecord
+
+# Importing the engine for its move codes and to play the games that build the book.
+import PentagoEngine
+
+# Importing the symmetries for the canonical form that entries are stored under.
+import Symmetry
+
+
+# The bytes every book starts with, and the version of the layout it uses.
+MAGIC = b'SPOB'
+VERSION = 1
+
+# The header after the magic bytes.  It's 24 bytes long in all so that the keys after it are 8-byte aligned.
+HEADER_FORMAT = '<HHHHHHQ'
+HEADER_SIZE = len(MAGIC) + struct.calcsize(HEADER_FORMAT)
+
+# The largest number a configuration field of the header holds.
+FIELD_LIMIT = 2 ** 16 - 1
+
+# The sizes of one entry in each section of the book.
+KEY_SIZE = 8
+MOVE_SIZE = 4
+SCORE_SIZE = 4
+DEPTH_SIZE = 2
+
+# Scores are stored in 4 bytes, so the search's win scores are clipped to the largest that fits.
+SCORE_LIMIT = 2 ** 31 - 1
+
+# The defaults of the games that build a book.  Every position in the first PLIES turns is searched, and
+# EXPLORATION is the chance that a move is picked at random instead of the searched move, so the games spread out.
+PLIES = 4
+GAMES = 20
+EXPLORATION = 0.3
+
+
+class OpeningBook:
+    """A book file opened for lookups.  The file is memory-mapped and searched in place."""
+
+    def __init__(self, path):
+        """Opens the book at path.  Raises a ValueError if it isn't a book, it's been cut short, or the machine is
+        big-endian."""
+        check_byte_order()
+        self.__sections = []
+        self.__file = open(path, 'rb')
+        try:
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__file.close()
+            raise ValueError("The file is not a Scalable Pentago opening book.")
+
+        # Checking the header and that the file holds every entry it says it does.
+        header = self.__map[:HEADER_SIZE]
+        if (len(header) != HEADER_SIZE) or (header[:len(MAGIC)] != MAGIC):
+            self.close()
+            raise ValueError("The file is not a Scalable Pentago opening book.")
+        version, *configuration, reserved, count = struct.unpack(HEADER_FORMAT, header[len(MAGIC):])
+        if version != VERSION:
+            self.close()
+            raise ValueError("The opening book's version (" + str(version) + ") is not supported.")
+        if len(self.__map) != HEADER_SIZE + count * (KEY_SIZE + MOVE_SIZE + SCORE_SIZE + DEPTH_SIZE):
+            self.close()
+            raise ValueError("The opening book's size doesn't match its number of entries.")
+        self.__configuration = tuple(configuration)
+        self.__engine = PentagoEngine.PentagoEngine(*self.__configuration)
+        self.__symmetry = Symmetry.get_board_symmetry(self.__engine.get_board_length(),
+                                                      self.__engine.get_sub_board_length())
+
+        # Viewing each section of the mapped file as an array of numbers.  Nothing is copied.
+        view = memoryview(self.__map)
+        start = HEADER_SIZE
+        for code, size in (('Q', KEY_SIZE), ('I', MOVE_SIZE), ('i', SCORE_SIZE), ('H', DEPTH_SIZE)):
+            self.__sections.append(view[start:start + count * size].cast(code))
+            start += count * size
+        view.release()
+        self.__keys, self.__moves, self.__scores, self.__depths = self.__sections
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def get_configuration(self):
+        """Gets the configuration of the positions in the book."""
+        return self.__configuration
+
+    def probe(self, key):
+        """Returns a tuple of (move code, score, depth) for the canonical hash key, or None if the book doesn't hold
+        it.  The move code is for the canonical form of the position."""
+        keys = self.__keys
+        index = bisect.bisect_left(keys, key)
+        if (index == len(keys)) or (keys[index] != key):
+            return None
+        return self.__moves[index], self.__scores[index], self.__depths[index]
+
+    def lookup(self, engine):
+        """Returns a tuple of (move, score, depth) for the engine's position, with the move turned to fit the
+        position as it is on the engine, or None if the book doesn't hold the position or is for another
+        configuration."""
+        if engine.get_configuration() != self.__configuration:
+            return None
+        key, symmetry = Symmetry.canonical_hash(engine)
+        entry = self.probe(key)
+        if entry is None:
+            return None
+        code, score, depth = entry
+        move = self.__engine.decode_move(code)
+        if symmetry:
+            move = self.__symmetry.transform_move(move, Symmetry.INVERSES[symmetry])
+
+        # A different position with the same hash would give a move that might not fit; it's safer to search.
+        if engine.check_move(move) is not None:
+            return None
+        return move, score, depth
+
+    def entries(self):
+        """Yields a tuple of (key, move code, score, depth) for every entry, in key order."""
+        for index in range(len(self.__keys)):
+            yield self.__keys[index], self.__moves[index], self.__scores[index], self.__depths[index]
+
+    def close(self):
+        """Closes the book.  The views of the mapped file are released first, since a map can't be closed while
+        they're held."""
+        for section in self.__sections:
+            section.release()
+        self.__sections = []
+        self.__map.close()
+        self.__file.close()
+
+
+def check_byte_order():
+    """Raises a ValueError if the machine isn't little-endian, since the sections of a book are little-endian and
+    are read and written without being swapped."""
+    if sys.byteorder != 'little':
+        raise ValueError("Opening books can only be used on little-endian machines.")
+
+
+def check_configuration(configuration):
+    """Raises a ValueError if a book can't be written for the configuration, because one of its numbers doesn't fit in
+    the header or its largest move code doesn't fit in the moves section."""
+    board_length = PentagoEngine.validate_configuration(*configuration)
+    if max(configuration) > FIELD_LIMIT:
+        raise ValueError("A book's configuration numbers can NOT be more than " + str(FIELD_LIMIT) + ".")
+    if board_length ** 2 * configuration[1] * 2 > 2 ** (MOVE_SIZE * 8):
+        raise ValueError("The configuration's move codes are too large to be stored in a book.")
+
+
+def write_book(path, configuration, entries):
+    """Writes a book for the configuration from a dictionary of {key : (move code, score, depth)}.  The book is
+    written next to path first and then moved over it, so a book that is open elsewhere is never half written.
+    Raises a ValueError if the configuration can't have a book or the machine is big-endian."""
+    check_byte_order()
+    check_configuration(configuration)
+    keys = sorted(entries)
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'wb') as book_file:
+        book_file.write(MAGIC + struct.pack(HEADER_FORMAT, VERSION, *configuration, 0, len(keys)))
+        book_file.write(array('Q', keys).tobytes())
+        book_file.write(array('I', [entries[key][0] for key in keys]).tobytes())
+        book_file.write(array('i', [entries[key][1] for key in keys]).tobytes())
+        book_file.write(array('H', [entries[key][2] for key in keys]).tobytes())
+    os.replace(temporary_path, path)
+
+
+def read_entries(path):
+    """Returns the entries of an existing book as a dictionary of {key : (move code, score, depth)} and its
+    configuration, or an empty dictionary and None if there's no book at path."""
+    if not os.path.exists(path):
+        return {}, None
+    with OpeningBook(path) as book:
+        return {key: (code, score, depth) for key, code, score, depth in book.entries()}, book.get_configuration()
+
+
+def add_position(entries, engine, player):
+    """Returns the book's move for the engine's position, searching the position with the player and adding it to
+    the entries first if it isn't there already.  The returned move fits the position as it is on the engine."""
+    key, symmetry = Symmetry.canonical_hash(engine)
+    board_symmetry = Symmetry.get_board_symmetry(engine.get_board_length(), engine.get_sub_board_length())
+    if key in entries:
+        move = engine.decode_move(entries[key][0])
+        return board_symmetry.transform_move(move, Symmetry.INVERSES[symmetry]) if symmetry else move
+
+    # Storing the searched move as it is played in the canonical form.
+    move = player.choose_move(engine)
+    score = max(-SCORE_LIMIT, min(SCORE_LIMIT, player.get_last_score()))
+    canonical_move = board_symmetry.transform_move(move, symmetry) if symmetry else move
+    entries[key] = (engine.encode_move(canonical_move), score, player.get_last_depth())
+    return move
+
+
+def build_entries(configuration, entries, plies=PLIES, games=GAMES, player=None, exploration=EXPLORATION, seed=0,
+                  record_paths=(), report=print):
+    """Adds to the entries every position in the first plies turns of games the player plays against itself, and of
+    the games in any record files.  In the player's own games, each move is the book's move except with the chance
+    of exploration, where a random move is played instead.  Returns the entries."""
+    if player is None:
+        player = AlphaBetaPlayer.AlphaBetaPlayer(1.0)
+    generator = random.Random(seed)
+
+    # Playing the games.  The first game always follows the book, so the main line is in it.
+    for game in range(games):
+        engine = PentagoEngine.PentagoEngine(*configuration)
+        for ply in range(plies):
+            if engine.is_terminal():
+                break
+            move = add_position(entries, engine, player)
+            if game and (generator.random() < exploration):
+                move = generator.choice(list(engine.distinct_moves()))
+            engine.apply(move)
+        report("Game %d of %d : %d positions in the book." % (game + 1, games, len(entries)))
+
+    # Following the openings of recorded games.
+    for path in record_paths:
+        with GameRecord.GameRecordReader(path) as reader:
+            if reader.get_configuration() != tuple(configuration):
+                raise ValueError("The record file " + path + " holds games of another configuration.")
+            for moves, winners in reader:
+                engine = PentagoEngine.PentagoEngine(*configuration)
+                for move in moves[:plies]:
+                    if engine.is_terminal():
+                        break
+                    add_position(entries, engine, player)
+                    engine.apply(move)
+        report("%s : %d positions in the book." % (path, len(entries)))
+    return entries
+
+
+def main(arguments=None):
+    """Builds, extends, or shows a book as set up by command line arguments."""
+    parser = argparse.ArgumentParser(description="Builds an opening book for Scalable Pentago.")
+    parser.add_argument('book', help="the book file to build, extend, or show")
+    parser.add_argument('--config', default='3,4,5,2',
+                        help="sub_board_length,sub_board_number,winning_length,players (default : standard Pentago)")
+    parser.add_argument('--plies', type=int, default=PLIES, help="how many turns of every game go into the book")
+    parser.add_argument('--games', type=int, default=GAMES, help="how many games to play")
+    parser.add_argument('--time', type=float, default=1.0, help="seconds of search for every position")
+    parser.add_argument('--depth', type=int, help="the deepest search for every position")
+    parser.add_argument('--exploration', type=float, default=EXPLORATION,
+                        help="the chance a move is played at random instead of from the book")
+    parser.add_argument('--seed', type=int, default=0, help="the seed of the random moves")
+    parser.add_argument('--records', nargs='*', default=[], help="game record files whose openings are added")
+    parser.add_argument('--show', action='store_true', help="print what the book holds instead of building it")
+    options = parser.parse_args(arguments)
+
+    if options.show:
+        with OpeningBook(options.book) as book:
+            print("Configuration : " + str(book.get_configuration()))
+            print("Entries : " + str(len(book)))
+            depths = {}
+            for key, code, score, depth in book.entries():
+                depths[depth] = depths.get(depth, 0) + 1
+            for depth in sorted(depths):
+                print("    searched to depth %d : %d" % (depth, depths[depth]))
+        return 0
+
+    try:
+        configuration = tuple(int(value) for value in options.config.split(','))
+        check_configuration(configuration)
+        entries, existing = read_entries(options.book)
+    except ValueError as error:
+        parser.error(str(error))
+    if (existing is not None) and (existing != configuration):
+        parser.error("The book holds positions of configuration " + str(existing) + ".")
+
+    player = AlphaBetaPlayer.AlphaBetaPlayer(options.time if options.depth is None else float('inf'), options.depth)
+    build_entries(configuration, entries, options.plies, options.games, player, options.exploration, options.seed,
+                  options.records)
+    write_book(options.book, configuration, entries)
+    print("The book was written to " + options.book + " with " + str(len(entries)) + " positions.")
+    return 0
+
+
+# Building the book if this script is the file that's designated as "main".
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,540 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : The headless engine behind Scalable Pentago.  It holds the board and the rules of the game,
+#               but it never prints anything or asks for input.  This allows bots, simulations, and any other
+#               frontend (like the console game in ScalablePentago.py) to share one code path for the rules.
+#               Moves are tuples of (row, column, sub_board, rotation) where the sub_board is numbered from 1
+#               exactly like the console game and the rotation is 'C' (clockwise) or 'A' (anti-clockwise).
+#               The board is stored as bitboards: one integer per player where bit (row * board_length + column)
+#               is set when the player has a marble on that node, plus one integer for every occupied node.
+
+# Importing random so that Zobrist keys can be generated.
+import random
+
+# Importing the bit permutations so that rotations can be done with lookup tables.
+import BitPermutation
+
+# Importing the index of winning sequences so that wins can be found with bitmasks.
+import WinningLines
+
+
+# The value a cell holds when no player has placed a marble on it.  Players are numbered from 0.
+BLANK = -1
+
+# The rotation directions a player can choose from when ending their turn.
+ROTATIONS = ('C', 'A')
+
+# The seed for the random numbers behind the Zobrist keys.  A fixed seed keeps hashes the same from run to run.
+ZOBRIST_SEED = 20230923
+
+# Zobrist keys only depend on the board's length and the player count, so they are shared like the rotation tables.
+# The keys are (board_length, player_count) tuples.
+zobrist_key_cache = {}
+
+# Rotation tables only depend on the sub-board's length and the board's length, so they are built once for each pair
+# and shared by every game with that shape.  The keys are (sub_board_length, board_length) tuples.
+rotation_table_cache = {}
+
+
+class PentagoEngine:
+    """A non-interactive game of Scalable Pentago.  The configuration is passed to the constructor and the game is
+    played through legal_moves, apply, undo, winners, and is_terminal.  Invalid configurations raise a ValueError
+    that explains which rule was broken; these are the same rules the console game enforces on its input."""
+
+    def __init__(self, sub_board_length, sub_board_number, winning_length, player_count):
+        """Creates an empty game with the passed configuration."""
+
+        # Validating the configuration before anything is built from it.
+        board_length = validate_configuration(sub_board_length, sub_board_number, winning_length, player_count)
+
+        # Storing the configuration of the game.
+        self.__sub_board_length = sub_board_length
+        self.__sub_board_number = sub_board_number
+        self.__board_length = board_length
+        self.__winning_length = winning_length
+        self.__player_count = player_count
+
+        # The number of sub-boards in a row (or column) of the game board.
+        self.__sub_boards_per_side = board_length // sub_board_length
+
+        # The board is a list of bitboards (one per player) and a bitboard of the occupied nodes.  Python's integers
+        # have no size limit, so one integer holds every node of even the largest board.
+        self.__boards = [0] * player_count
+        self.__occupied = 0
+        self.__full_mask = (1 << (board_length * board_length)) - 1
+
+        # Counting the marbles on the board.  Rotations never change the number of marbles, so the counter only
+        # changes when a marble is placed or lifted, and it makes checking for a full board a single comparison.
+        self.__node_count = board_length * board_length
+        self.__marble_count = 0
+
+        # Creating the upper left corners and the masks that select every node inside of each sub-board.  Index 0 is
+        # unused so that they can be looked up with the sub-board numbers that players use.  The corner's bit is
+        # where the sub-board's contents are shifted down to before a rotation table is applied to them.
+        self.__sub_board_corners = [(0, 0)]
+        self.__sub_board_corner_bits = [0]
+        self.__sub_board_masks = [0]
+        for sub_board in range(1, sub_board_number + 1):
+            sub_board_row, sub_board_column = divmod(sub_board - 1, self.__sub_boards_per_side)
+            corner = (sub_board_row * sub_board_length, sub_board_column * sub_board_length)
+            self.__sub_board_corners.append(corner)
+            self.__sub_board_corner_bits.append(corner[0] * board_length + corner[1])
+            mask = 0
+            for row, column in self.sub_board_positions(sub_board):
+                mask |= 1 << (row * board_length + column)
+            self.__sub_board_masks.append(mask)
+
+        # Obtaining the rotation tables for the shape of this board.
+        self.__rotations = get_rotation_tables(sub_board_length, board_length)
+
+        # Obtaining the Zobrist keys and starting the position's hash.  The hash is the XOR of the keys of every
+        # (player, node) pair that holds a marble, so it is updated by XOR-ing the keys of the nodes that change.
+        # The player to move doesn't need a key since it always follows from the number of marbles.
+        self.__zobrist_keys = get_zobrist_keys(board_length, player_count)
+        self.__hash = 0
+
+        # Obtaining the shared index of every winning sequence for this board.  A marble that is placed outside of
+        # the rotated sub-board only needs the sequences through its node.
+        self.__winning_lines = WinningLines.get_winning_lines(board_length, winning_length)
+
+        # Each sub-board keeps, for every direction, the shifts that find runs of marbles and a mask of the nodes
+        # where a sequence that touches the sub-board starts.  A rotation can only complete those sequences, so
+        # they are found with a few shifts of the whole bitboard that are then masked by these start nodes.
+        self.__sub_board_starts = [()]
+        for sub_board in range(1, sub_board_number + 1):
+            start_masks = self.__winning_lines.start_masks_touching(self.__sub_board_masks[sub_board])
+            self.__sub_board_starts.append(tuple((self.__winning_lines.get_run_shifts(direction), start_mask)
+                                                 for direction, start_mask in enumerate(start_masks)))
+
+        # The history holds everything needed to take a move back: the move, the bit the marble was placed on,
+        # and the winners before the move was made.
+        self.__history = []
+        self.__winners = []
+
+    def get_sub_board_length(self):
+        """Gets the length of a sub-board's sides."""
+        return self.__sub_board_length
+
+    def get_sub_board_number(self):
+        """Gets the number of sub-boards in the game board."""
+        return self.__sub_board_number
+
+    def get_board_length(self):
+        """Gets the length of the game board's sides."""
+        return self.__board_length
+
+    def get_winning_length(self):
+        """Gets the number of marbles in a row that is needed to win."""
+        return self.__winning_length
+
+    def get_player_count(self):
+        """Gets the number of players in the game."""
+        return self.__player_count
+
+    def get_configuration(self):
+        """Gets the tuple of values that was passed to the constructor."""
+        return (self.__sub_board_length, self.__sub_board_number, self.__winning_length, self.__player_count)
+
+    def get_move_count(self):
+        """Gets the number of moves that have been applied to the board."""
+        return len(self.__history)
+
+    def get_current_player(self):
+        """Gets the number of the player whose turn it is.  Players take turns in order, starting with player 0."""
+        return len(self.__history) % self.__player_count
+
+    def get_history(self):
+        """Gets a list of the moves that have been applied, from first to last."""
+        return [entry[0] for entry in self.__history]
+
+    def get_boards(self):
+        """Gets a tuple holding each player's bitboard, ordered by player number."""
+        return tuple(self.__boards)
+
+    def get_occupied(self):
+        """Gets the bitboard of every node that holds a marble."""
+        return self.__occupied
+
+    def get_marble_count(self):
+        """Gets the number of marbles on the board."""
+        return self.__marble_count
+
+    def get_empty_mask(self):
+        """Gets the bitboard of every empty node.  It's the complement of the occupancy bitboard, which is kept up to
+        date by every placement, rotation, and undo, so it always matches the board."""
+        return self.__full_mask ^ self.__occupied
+
+    def empty_cells(self):
+        """Yields the (row, column) position of every empty node, row by row."""
+        board_length = self.__board_length
+        empty = self.__full_mask ^ self.__occupied
+        while empty:
+            lowest_bit = empty & -empty
+            yield divmod(lowest_bit.bit_length() - 1, board_length)
+            empty ^= lowest_bit
+
+    def get_winning_lines(self):
+        """Gets the shared index of every winning sequence on the board."""
+        return self.__winning_lines
+
+    def get_sub_board_mask(self, sub_board):
+        """Gets the bitboard that selects every node inside of a sub-board."""
+        return self.__sub_board_masks[sub_board]
+
+    def get_hash(self):
+        """Gets the 64-bit Zobrist hash of the position."""
+        return self.__hash
+
+    def encode_move(self, move):
+        """Returns a move packed into a single integer: ((node * sub_board_number) + sub_board - 1) * 2 + direction,
+        where the direction is 0 for clockwise and 1 for anti-clockwise."""
+        row, column, sub_board, rotation = move
+        node = row * self.__board_length + column
+        return ((node * self.__sub_board_number) + sub_board - 1) * 2 + (0 if rotation.upper() == 'C' else 1)
+
+    def decode_move(self, code):
+        """Returns the move tuple of an integer made by encode_move."""
+        code, direction = divmod(code, 2)
+        node, sub_board = divmod(code, self.__sub_board_number)
+        row, column = divmod(node, self.__board_length)
+        return row, column, sub_board + 1, ROTATIONS[direction]
+
+    def get_cell(self, row, column):
+        """Gets the player number occupying a cell, or BLANK if the cell is empty."""
+        bit = 1 << (row * self.__board_length + column)
+        if self.__occupied & bit:
+            for player, board in enumerate(self.__boards):
+                if board & bit:
+                    return player
+        return BLANK
+
+    def sub_board_of_node(self, row, column):
+        """Returns the number of the sub-board (starting at 1) that contains the passed position."""
+        sub_board_row = row // self.__sub_board_length
+        sub_board_column = column // self.__sub_board_length
+        return sub_board_row * self.__sub_boards_per_side + sub_board_column + 1
+
+    def sub_board_corner_position(self, sub_board):
+        """Returns the row and column of the upper left corner of a sub-board as a tuple."""
+        return self.__sub_board_corners[sub_board]
+
+    def is_board_full(self):
+        """Returns true if every cell of the board holds a marble."""
+        return self.__marble_count == self.__node_count
+
+    def winners(self):
+        """Returns a list of the players that won with the last move.  More than one player can win at once
+        since a rotation can complete sequences for several players; an empty list means nobody has won."""
+        return list(self.__winners)
+
+    def is_terminal(self):
+        """Returns true if the game is over, either because someone won or because the board is full."""
+        return bool(self.__winners) or self.is_board_full()
+
+    def check_move(self, move):
+        """Returns a message explaining why a move is illegal, or None if the move can be applied."""
+
+        # Unpacking the move and checking that it has every part.
+        try:
+            row, column, sub_board, rotation = move
+        except (TypeError, ValueError):
+            return "A move must hold a row, a column, a sub-board, and a rotation direction."
+
+        # Checking the game is still being played.
+        if self.is_terminal():
+            return "The game is over.  No more moves can be made."
+
+        # Checking the position is within the board and is not filled already.
+        if (not isinstance(row, int)) or (row < 0) or (row > self.__board_length - 1):
+            return "Your input for row is not within the board's boundaries."
+        if (not isinstance(column, int)) or (column < 0) or (column > self.__board_length - 1):
+            return "Your input for column is not within the board's boundaries."
+        if self.__occupied >> (row * self.__board_length + column) & 1:
+            return "The position is already filled.  Please select a new position."
+
+        # Checking the sub-board exists and the rotation is one of the acceptable directions.
+        if (not isinstance(sub_board, int)) or (sub_board < 1) or (sub_board > self.__sub_board_number):
+            return ("The sub-board value must be greater than 0 and no greater than " +
+                    str(self.__sub_board_number) + ".")
+        if (not isinstance(rotation, str)) or (rotation.upper() not in ROTATIONS):
+            return "The rotation direction must be either 'c', 'C', 'a', or 'A'."
+
+        # The move is legal.
+        return None
+
+    def legal_moves(self):
+        """Returns a list of every legal move in the current position.  A finished game has no legal moves."""
+        if self.is_terminal():
+            return []
+
+        # Every empty cell can be combined with every sub-board and both rotation directions.
+        sub_boards = range(1, self.__sub_board_number + 1)
+        return [(row, column, sub_board, rotation)
+                for row, column in self.empty_cells()
+                for sub_board in sub_boards
+                for rotation in ROTATIONS]
+
+    def distinct_moves(self):
+        """Yields one legal move for every distinct position the current position can lead to.  Many moves lead to
+        the same position: rotating an empty sub-board (or one whose marbles look the same after turning) changes
+        nothing, a sub-board that looks the same after a half turn gives the same result in both directions, and a
+        marble placed into a sub-board can land where another placement would have put it.  Only the first move
+        found for each resulting position is yielded.  A finished game has no moves."""
+        if self.is_terminal():
+            return
+        player = len(self.__history) % self.__player_count
+
+        # Grouping the rotations by the boards they leave behind.  Each group is rotated with its first rotation.
+        groups = {}
+        for sub_board in range(1, self.__sub_board_number + 1):
+            for rotation in ROTATIONS:
+                rotated = self.rotated_boards(sub_board, rotation)
+                if rotated not in groups:
+                    groups[rotated] = (sub_board, rotation)
+
+        # Different groups can only reach the same position when the other players' boards match and the mover's
+        # boards differ by the 2 nodes the marbles land on, so only groups that share the other players' boards
+        # need their resulting positions remembered.  Those groups are numbered by the other players' boards.
+        classes = {}
+        class_sizes = {}
+        for rotated in groups:
+            others = rotated[:player] + rotated[player + 1:]
+            classes.setdefault(others, len(classes))
+            class_sizes[others] = class_sizes.get(others, 0) + 1
+
+        board_length = self.__board_length
+        empty_nodes = []
+        empty = self.__full_mask ^ self.__occupied
+        while empty:
+            lowest_bit = empty & -empty
+            empty_nodes.append(divmod(lowest_bit.bit_length() - 1, board_length) + (lowest_bit,))
+            empty ^= lowest_bit
+
+        seen = set()
+        for rotated, (sub_board, rotation) in groups.items():
+            others = rotated[:player] + rotated[player + 1:]
+
+            # BASE CASE : Nobody else can reach the same positions, and every placement lands on its own node.
+            if class_sizes[others] == 1:
+                for row, column, bit in empty_nodes:
+                    yield row, column, sub_board, rotation
+                continue
+
+            # Working out where each marble lands and skipping the positions that another group already reached.
+            class_number = classes[others]
+            mover_board = rotated[player]
+            sub_board_mask = self.__sub_board_masks[sub_board]
+            corner_bit = self.__sub_board_corner_bits[sub_board]
+            permutation = self.__rotations[rotation]
+            for row, column, bit in empty_nodes:
+                if bit & sub_board_mask:
+                    bit = permutation.apply(bit >> corner_bit) << corner_bit
+                key = (class_number, mover_board | bit)
+                if key not in seen:
+                    seen.add(key)
+                    yield row, column, sub_board, rotation
+
+    def rotated_boards(self, sub_board, rotation):
+        """Returns a tuple of every player's bitboard as it would be after rotating a sub-board, without changing
+        the board."""
+        sub_board_mask = self.__sub_board_masks[sub_board]
+        corner_bit = self.__sub_board_corner_bits[sub_board]
+        permutation = self.__rotations[rotation]
+        rotated_boards = []
+        for board in self.__boards:
+            inside = board & sub_board_mask
+            if inside:
+                board ^= inside ^ (permutation.apply(inside >> corner_bit) << corner_bit)
+            rotated_boards.append(board)
+        return tuple(rotated_boards)
+
+    def apply(self, move):
+        """Places the current player's marble, rotates the chosen sub-board, and works out who has won.
+        Raises a ValueError if the move is illegal."""
+
+        # Refusing illegal moves so that the board can never be put into an impossible state.
+        problem = self.check_move(move)
+        if problem is not None:
+            raise ValueError(problem)
+        row, column, sub_board, rotation = move
+        rotation = rotation.upper()
+
+        # Recording what is needed to undo the move before the board changes.
+        bit = 1 << (row * self.__board_length + column)
+        player = len(self.__history) % self.__player_count
+        self.__history.append(((row, column, sub_board, rotation), bit, self.__winners))
+
+        # Remembering the bitboards of the players that can gain marbles with this move.  Those are the player that
+        # places a marble and the players that own marbles in the sub-board that is about to be rotated.
+        boards = self.__boards
+        sub_board_mask = self.__sub_board_masks[sub_board]
+        previous_boards = [(other, board) for other, board in enumerate(boards)
+                           if (other == player) or (board & sub_board_mask)]
+
+        # Placing the marble and rotating the sub-board.
+        boards[player] |= bit
+        self.__occupied |= bit
+        self.__marble_count += 1
+        self.__hash ^= self.__zobrist_keys[player][bit.bit_length() - 1]
+        self.rotate(sub_board, rotation)
+
+        # Finding the winners.  A player can only have completed a sequence that passes through the rotated sub-board
+        # or, for the player that moved, through the node of their marble.
+        winners = []
+        placed_outside = not (bit & sub_board_mask)
+        for other, previous_board in previous_boards:
+            board = boards[other]
+            if board == previous_board:
+                continue
+            if (board & sub_board_mask) and self.has_sequence_touching(board, sub_board):
+                winners.append(other)
+            elif (other == player) and placed_outside and self.has_sequence_through(board, bit):
+                winners.append(other)
+        self.__winners = winners
+
+    def undo(self):
+        """Takes back the last move that was applied.  Raises an IndexError if no moves have been made."""
+        if not self.__history:
+            raise IndexError("There are no moves to undo.")
+        (row, column, sub_board, rotation), bit, previous_winners = self.__history.pop()
+
+        # Rotating the sub-board back in the opposite direction and then lifting the marble off the board.
+        self.rotate(sub_board, 'A' if rotation == 'C' else 'C')
+        player = len(self.__history) % self.__player_count
+        self.__boards[player] ^= bit
+        self.__occupied ^= bit
+        self.__marble_count -= 1
+        self.__hash ^= self.__zobrist_keys[player][bit.bit_length() - 1]
+        self.__winners = previous_winners
+
+    def sub_board_positions(self, sub_board):
+        """Returns a list of the (row, column) positions inside of a sub-board."""
+        sub_board_row, sub_board_column = divmod(sub_board - 1, self.__sub_boards_per_side)
+        corner_row = sub_board_row * self.__sub_board_length
+        corner_column = sub_board_column * self.__sub_board_length
+        return [(corner_row + row, corner_column + column)
+                for row in range(self.__sub_board_length)
+                for column in range(self.__sub_board_length)]
+
+    def rotate(self, sub_board, rotation):
+        """Rotates a sub-board in the passed direction.  This does not record anything in the history, so it should
+        only be used directly by tools that want to look at rotations on their own."""
+        sub_board_mask = self.__sub_board_masks[sub_board]
+        corner_bit = self.__sub_board_corner_bits[sub_board]
+        permutation = self.__rotations[rotation]
+
+        # Rotating every bitboard that has marbles inside of the sub-board.  The sub-board's contents are shifted
+        # down to the first bit, moved by the rotation table, and shifted back up into place.  The hash is updated
+        # with the nodes whose state changed for the player; marbles that land on a node of their own colour cancel.
+        boards = self.__boards
+        rotated_occupancy = 0
+        for player in range(self.__player_count):
+            inside = boards[player] & sub_board_mask
+            if inside:
+                rotated = permutation.apply(inside >> corner_bit) << corner_bit
+                changed = inside ^ rotated
+                if changed:
+                    boards[player] ^= changed
+                    self.__hash ^= xor_of_keys(self.__zobrist_keys[player], changed)
+                rotated_occupancy |= rotated
+
+        # The occupancy bitboard is rebuilt from the rotated marbles so that it keeps matching the players' bitboards.
+        self.__occupied = (self.__occupied & ~sub_board_mask) | rotated_occupancy
+
+    def has_sequence_through(self, board, bit):
+        """Returns true if the bitboard holds a winning sequence that passes through the node of the passed bit."""
+        for line in self.__winning_lines.get_line_masks_of_node(bit.bit_length() - 1):
+            if board & line == line:
+                return True
+        return False
+
+    def has_sequence_touching(self, board, sub_board):
+        """Returns true if the bitboard holds a winning sequence that passes through the passed sub-board.  For every
+        direction, a bit that survives shifting the bitboard onto itself is the start of a run of marbles."""
+        for shifts, start_mask in self.__sub_board_starts[sub_board]:
+            runs = board
+            for shift in shifts:
+                runs &= runs >> shift
+                if not runs:
+                    break
+            if runs & start_mask:
+                return True
+        return False
+
+
+def get_zobrist_keys(board_length, player_count):
+    """Returns a list holding a list of random 64-bit keys for every node, one list for each player."""
+    key = (board_length, player_count)
+    if key not in zobrist_key_cache:
+        generator = random.Random(ZOBRIST_SEED)
+        zobrist_key_cache[key] = [[generator.getrandbits(64) for node in range(board_length * board_length)]
+                                  for player in range(player_count)]
+    return zobrist_key_cache[key]
+
+
+def xor_of_keys(keys, bits):
+    """Returns the XOR of the keys of every node whose bit is set in the passed bitboard."""
+    result = 0
+    while bits:
+        lowest_bit = bits & -bits
+        result ^= keys[lowest_bit.bit_length() - 1]
+        bits ^= lowest_bit
+    return result
+
+
+def get_rotation_tables(sub_board_length, board_length):
+    """Returns a dictionary holding a bit permutation for each rotation direction of a sub-board.  The permutations
+    work on a sub-board whose upper left corner has been shifted down to bit 0, so one pair serves every sub-board."""
+    key = (sub_board_length, board_length)
+    if key not in rotation_table_cache:
+
+        # A clockwise rotation moves a node at (row, column) to (column, length - 1 - row) inside the sub-board.
+        # An anti-clockwise rotation moves it to (length - 1 - column, row).
+        last = sub_board_length - 1
+        clockwise = {}
+        anti_clockwise = {}
+        for row in range(sub_board_length):
+            for column in range(sub_board_length):
+                source = row * board_length + column
+                clockwise[source] = column * board_length + (last - row)
+                anti_clockwise[source] = (last - column) * board_length + row
+
+        rotation_table_cache[key] = {'C': BitPermutation.BitPermutation(clockwise),
+                                     'A': BitPermutation.BitPermutation(anti_clockwise)}
+    return rotation_table_cache[key]
+
+
+def validate_configuration(sub_board_length, sub_board_number, winning_length, player_count):
+    """Raises a ValueError if the configuration breaks any of the game's rules.  Returns the board's length
+    when the configuration is acceptable."""
+
+    # SUB-BOARD LENGTH CHECK : The sub-boards need at least 2 nodes on a side to be rotated.
+    if sub_board_length < 2:
+        raise ValueError("The sub-board length must be greater than 1.")
+
+    # SUB-BOARD NUMBER CHECK : The number of sub-boards is 4 to the power of X where X is greater than 0.
+    sub_boards_per_side = 1
+    while sub_boards_per_side * sub_boards_per_side < sub_board_number:
+        sub_boards_per_side *= 2
+    if (sub_board_number < 4) or (sub_boards_per_side * sub_boards_per_side != sub_board_number):
+        raise ValueError("The number of sub-boards must be 4 to the power of X where X is greater than 0.")
+
+    # The board's length has no upper limit; bitboards are Python integers, so they grow with the board.
+    board_length = sub_board_length * sub_boards_per_side
+
+    # WINNING LENGTH CHECKS : The winning length has to fit on the board and has to be at least 2.
+    if winning_length > board_length:
+        raise ValueError("The winning length is greater than the board's length.")
+    if winning_length < 2:
+        raise ValueError("The winning length is too short.  Values lower than 2 are not acceptable.")
+
+    # PLAYER COUNT CHECKS : There must be at least 2 players, and no more players than the number of nodes in the
+    # board divided by the winning length.
+    if player_count < 2:
+        raise ValueError("The player count can NOT be lower than 2.")
+    if player_count > (board_length * board_length) // winning_length:
+        raise ValueError("The player count can NOT be higher than the total number of nodes in the board "
+                         "divided by the winning length.")
+
+    # The configuration is acceptable.
+    return board_length
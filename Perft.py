@@ -0,0 +1,182 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Perft (performance test) for the Scalable Pentago engine.  It walks the whole tree of moves from a
+#               position down to a depth and counts the positions at the bottom, which measures how fast the engine
+#               makes and takes back moves.  The counts only come out right when placements, rotations, sub-board
+#               numbering, and win checks are all correct, so they are compared against a table of counts that
+#               were checked against a separate, simple implementation of the rules.  Games that end before the
+#               depth is reached have no positions at the bottom, like in chess perft.
+#
+#               Example : python Perft.py --config 3,4,5,2 --depth 2 --split
+#                         python Perft.py --check
+
+# Importing argparse so that perft can be run from the command line.
+import argparse
+
+# Importing time so that the speed of the engine can be measured.
+import time
+
+# Importing the engine that is being tested.
+import PentagoEngine
+
+
+# The reference counts of each configuration, keyed by (configuration, moves, depth), where the moves (written the
+# same way as --moves) are made before counting and are empty for counts from the empty board.  Each entry holds the
+# number of positions at the bottom of the tree of legal moves, the number at the bottom of the tree of distinct
+# moves, and the number of unique positions at that depth.  Standard Pentago is configuration (3, 4, 5, 2).  Counts
+# from the empty board are only cut short by wins deep in the tree, so the positions part way through a game are
+# set up with a player one move away from winning, where finished games cut the tree under the default --max-leaves.
+REFERENCE_COUNTS = {
+    ((2, 4, 2, 2), '', 1): (128, 16, 16),
+    ((2, 4, 2, 2), '', 2): (15360, 720, 240),
+    ((2, 4, 2, 2), '', 3): (1720320, 44640, 1680),
+    ((2, 4, 2, 2), '', 4): (116293632, 2377440, 8736),
+    ((2, 4, 2, 2), '0,0,4,C;3,3,1,C', 3): (480192, 192132, 10209),
+    ((2, 4, 3, 3), '', 3): (1720320, 46368, 3360),
+    ((2, 4, 3, 3), '0,0,1,C;3,3,4,A;1,1,1,A;2,2,4,C;0,3,2,C;3,0,3,C', 2): (5616, 5553, 2540),
+    ((3, 4, 5, 2), '', 1): (288, 36, 36),
+    ((3, 4, 5, 2), '', 2): (80640, 3500, 1260),
+    ((3, 4, 5, 2), '', 3): (21934080, 504792, 21420),
+    ((3, 4, 5, 2), '0,0,4,C;5,5,4,C;0,1,4,C;4,4,4,C;0,2,4,C;3,3,4,C;0,3,4,C;5,3,4,C', 2): (47520, 37006, 15777),
+    ((2, 16, 3, 3), '', 2): (4128768, 12096, 4032),
+    ((4, 4, 4, 4), '', 2): (258048, 12096, 4032),
+}
+
+
+def perft(engine, depth, distinct=False):
+    """RECURSIVE METHOD : Returns the number of positions at the bottom of the tree of moves depth moves below the
+    engine's position.  With distinct, moves that lead to the same position as an earlier move are skipped."""
+
+    # BASE CASE : The bottom of the tree has been reached.
+    if depth == 0:
+        return 1
+
+    moves = engine.distinct_moves() if distinct else engine.legal_moves()
+
+    # BASE CASE : The positions one move down are all at the bottom, so they only need to be counted.
+    if depth == 1:
+        return sum(1 for move in moves)
+
+    count = 0
+    for move in moves:
+        engine.apply(move)
+        count += perft(engine, depth - 1, distinct)
+        engine.undo()
+    return count
+
+
+def split_perft(engine, depth, distinct=False):
+    """Returns a list of (move, count) tuples with the perft count below each first move, in the order the engine
+    generates the moves.  Comparing the split of two engines shows which first move their counts differ under."""
+    counts = []
+    moves = list(engine.distinct_moves() if distinct else engine.legal_moves())
+    for move in moves:
+        engine.apply(move)
+        counts.append((move, perft(engine, depth - 1, distinct)))
+        engine.undo()
+    return counts
+
+
+def unique_positions(engine, depth):
+    """Returns the number of different positions that can be reached in exactly depth moves.  Positions are told
+    apart by every player's bitboard; the player to move always follows from the number of marbles."""
+    frontier = {engine.get_boards(): engine.get_history()}
+    for step in range(depth):
+        next_frontier = {}
+        for boards, history in frontier.items():
+            position = replay(engine.get_configuration(), history)
+            for move in position.distinct_moves():
+                position.apply(move)
+                next_frontier.setdefault(position.get_boards(), history + [move])
+                position.undo()
+        frontier = next_frontier
+    return len(frontier)
+
+
+def replay(configuration, moves):
+    """Returns a new engine with the configuration that the moves have been applied to."""
+    engine = PentagoEngine.PentagoEngine(*configuration)
+    for move in moves:
+        engine.apply(move)
+    return engine
+
+
+def timed(function, *arguments):
+    """Returns a tuple of (the function's result, the seconds it took)."""
+    start = time.perf_counter()
+    result = function(*arguments)
+    return result, time.perf_counter() - start
+
+
+def check_references(max_leaves, report=print):
+    """Runs every reference count with no more than max_leaves positions at the bottom and reports whether each one
+    matches.  Returns true if all of them did."""
+    passed = True
+    for (configuration, moves, depth), (leaves, distinct_leaves, unique) in sorted(REFERENCE_COUNTS.items()):
+        name = "%-14s %s depth %d" % (configuration, "after %d moves" % len(parse_moves(moves)) if moves else
+                                      "from the start", depth)
+        if leaves > max_leaves:
+            report("%s : skipped (%d positions)" % (name, leaves))
+            continue
+        engine = replay(configuration, parse_moves(moves))
+        found_leaves, seconds = timed(perft, engine, depth)
+        found = (found_leaves, perft(engine, depth, True), unique_positions(engine, depth))
+        matched = found == (leaves, distinct_leaves, unique)
+        passed = passed and matched
+        report("%s : %s %.0f positions per second %s" %
+               (name, "ok  " if matched else "FAIL", leaves / seconds if seconds else 0.0,
+                found if not matched else ""))
+    return passed
+
+
+def parse_moves(text):
+    """Returns a list of moves written as "row,column,sub_board,rotation" separated by semicolons."""
+    moves = []
+    for part in filter(None, text.split(';')):
+        row, column, sub_board, rotation = part.split(',')
+        moves.append((int(row), int(column), int(sub_board), rotation.strip().upper()))
+    return moves
+
+
+def main(arguments=None):
+    """Runs perft as set up by command line arguments."""
+    parser = argparse.ArgumentParser(description="Counts the positions in the tree of moves of Scalable Pentago.")
+    parser.add_argument('--config', default='3,4,5,2',
+                        help="sub_board_length,sub_board_number,winning_length,players (default : standard Pentago)")
+    parser.add_argument('--depth', type=int, default=2, help="the number of moves to look ahead")
+    parser.add_argument('--moves', default='', help="moves to make before counting, as row,column,sub_board,rotation "
+                                                    "separated by semicolons")
+    parser.add_argument('--split', action='store_true', help="print the count below every first move")
+    parser.add_argument('--distinct', action='store_true', help="skip moves that lead to an already counted position")
+    parser.add_argument('--unique', action='store_true', help="also count the unique positions at the depth")
+    parser.add_argument('--check', action='store_true', help="compare the engine against the reference counts")
+    parser.add_argument('--max-leaves', type=int, default=5000000,
+                        help="the largest reference count that --check runs (default : 5000000)")
+    options = parser.parse_args(arguments)
+
+    if options.check:
+        return 0 if check_references(options.max_leaves) else 1
+
+    try:
+        engine = replay(tuple(int(value) for value in options.config.split(',')), parse_moves(options.moves))
+    except ValueError as error:
+        parser.error(str(error))
+
+    if options.split:
+        counts, seconds = timed(split_perft, engine, options.depth, options.distinct)
+        for (row, column, sub_board, rotation), count in counts:
+            print("%d,%d,%d,%s : %d" % (row, column, sub_board, rotation, count))
+        total = sum(count for move, count in counts)
+    else:
+        total, seconds = timed(perft, engine, options.depth, options.distinct)
+    print("Positions : %d in %.3f seconds (%.0f per second)." % (total, seconds, total / seconds if seconds else 0.0))
+
+    if options.unique:
+        unique, seconds = timed(unique_positions, engine, options.depth)
+        print("Unique positions : %d in %.3f seconds." % (unique, seconds))
+    return 0
+
+
+# Running perft if this script is the file that's designated as "main".
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,562 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Solves small 2 player configurations of Scalable Pentago outright by backward induction.  Positions
+#               are split into layers by how many marbles are on the board, and every move adds exactly one marble,
+#               so the moves from one layer only lead into the next.  The full board is solved first and every layer
+#               is then solved from the one after it, down to the empty board (or down to a chosen layer, which gives
+#               endgame tables).  Every position gets its exact value for the player to move: a win, a draw, or a
+#               loss.
+#
+#               Each layer is a table with one byte per position, indexed by a ranking that numbers every way of
+#               placing the layer's marbles: the occupied nodes are numbered with the combinatorial number system,
+#               and so are the nodes of the second player among them.  A layer is solved in chunks of consecutive
+#               ranks that are spread across a pool of processes.  The layer after it is decompressed once into a raw
+#               file that every process maps, and each chunk is compressed with zlib onto the layer's own file as it
+#               comes back, so neither layer is ever copied into every process or held in memory whole.
+#               SolvedTables reads the files back so games can look positions up while they're played.
+#
+#               Example : python RetrogradeSolver.py --config 2,4,3,2 --output solved-2-4-3-2
+#                         python RetrogradeSolver.py --config 2,4,4,2 --output endgame --min-layer 10
+
+# Importing argparse so that configurations can be solved from the command line.
+import argparse
+
+# Importing collections for the queue of chunks that are being solved.
+import collections
+
+# Importing itertools to list the ways of splitting a layer's marbles between the players.
+import itertools
+
+# Importing json for the index of the solved layers.
+import json
+
+# Importing os for the paths of the layer files and the number of cores.
+import os
+
+# Importing time so that every layer reports how long it took.
+import time
+
+# Importing zlib to compress the layer files.
+import zlib
+
+# Importing the process pool that solves the chunks of a layer side by side.
+from concurrent.futures import ProcessPoolExecutor
+
+# Importing NumPy to solve whole chunks of positions at a time.
+import numpy
+
+# Importing the engine for the board's shape, its winning sequences, and its moves.
+import PentagoEngine
+
+
+# The values of a position for the player to move.  A position's value is 2 minus the value of the position its best
+# move leads to, since the value of that position is for the other player.
+LOSS = 0
+DRAW = 1
+WIN = 2
+
+# The names of the values, for reports.
+VALUE_NAMES = {LOSS: 'loss', DRAW: 'draw', WIN: 'win'}
+
+# The most positions solved at once in one chunk.  The arrays of a chunk take about 40 bytes per position.
+CHUNK_POSITIONS = 1 << 16
+
+# The name of the index in a solution's directory, the name of every layer's file, and the name of the raw copy of
+# the next layer that the processes map while a layer is solved.
+INDEX_NAME = 'solution.json'
+LAYER_NAME = 'layer-%03d.z'
+RAW_LAYER_NAME = 'layer-%03d.raw'
+
+# How many bytes of a layer file are decompressed at a time.
+BLOCK_SIZE = 1 << 20
+
+# How many chunks every process may have waiting, so that the chunks that came back early don't pile up.
+QUEUED_CHUNKS = 2
+
+# How many decompressed layers SolvedTables keeps.  A game only moves from one layer to the next.
+CACHED_LAYERS = 2
+
+# The tables of a configuration are shared by everything in the same process.  The keys are configurations.
+ranking_cache = {}
+
+# The layer after the one being solved, mapped once in every worker process.
+worker_next_layer = None
+
+
+class Ranking:
+    """Numbers the positions of one board shape, layer by layer, and holds what the solver needs to move bitboards
+    around in bulk.  Bitboards are NumPy uint64 arrays, so boards can have up to 64 nodes."""
+
+    def __init__(self, configuration):
+        """Builds the tables for a 2 player configuration.  Raises a ValueError for other configurations or boards
+        with more than 64 nodes."""
+        engine = PentagoEngine.PentagoEngine(*configuration)
+        if engine.get_player_count() != 2:
+            raise ValueError("Only 2 player configurations can be solved.")
+        node_count = engine.get_board_length() ** 2
+        if node_count > 64:
+            raise ValueError("Only boards with up to 64 nodes can be solved.")
+        self.__configuration = tuple(configuration)
+        self.__node_count = node_count
+        self.__engine = engine
+
+        # Binomial coefficients, where binomials[n, k] is n choose k.  Row -1 is never used for a real count; it's
+        # only read when an empty node is multiplied by 0.
+        binomials = numpy.zeros((node_count + 2, node_count + 2), dtype=numpy.int64)
+        for n in range(node_count + 1):
+            binomials[n, 0] = 1
+            for k in range(1, n + 1):
+                binomials[n, k] = binomials[n - 1, k - 1] + binomials[n - 1, k]
+        self.__binomials = binomials
+
+        # Byte tables, so a ranking works on 8 nodes at a time.  For a byte of the occupied nodes at byte_index
+        # with set_before nodes occupied below it, occupied_ranks[byte_index, set_before, byte] is what its nodes add
+        # to the rank of the occupied nodes.  compressed[occupied_byte, second_byte] gathers the second player's bits
+        # into the positions of the occupied nodes, and second_ranks[set_before, second_before, compressed byte] is
+        # what they add to the rank of the second player's nodes among the occupied ones.
+        byte_count = (node_count + 7) // 8
+        self.__byte_count = byte_count
+        self.__bit_counts = numpy.array([bin(byte).count('1') for byte in range(256)], dtype=numpy.int64)
+        self.__occupied_ranks = numpy.zeros((byte_count, node_count + 1, 256), dtype=numpy.int64)
+        self.__second_ranks = numpy.zeros((node_count + 1, node_count + 1, 256), dtype=numpy.int64)
+        self.__compressed = numpy.zeros((256, 256), dtype=numpy.int64)
+        for byte in range(256):
+            for byte_index in range(byte_count):
+                for set_before in range(node_count + 1):
+                    rank = 0
+                    count = set_before
+                    for bit in range(8):
+                        if byte >> bit & 1:
+                            count += 1
+                            node = byte_index * 8 + bit
+                            if (node < node_count) and (count <= node_count):
+                                rank += int(binomials[node, count])
+                    self.__occupied_ranks[byte_index, set_before, byte] = rank
+            for set_before in range(node_count + 1):
+                for second_before in range(node_count + 1):
+                    rank = 0
+                    count = second_before
+                    for bit in range(8):
+                        if (byte >> bit & 1) and (set_before + bit <= node_count) and (count < node_count):
+                            count += 1
+                            rank += int(binomials[set_before + bit, count])
+                    self.__second_ranks[set_before, second_before, byte] = rank
+            for second in range(256):
+                if second & ~byte:
+                    continue
+                gathered = 0
+                place = 0
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        gathered |= (second >> bit & 1) << place
+                        place += 1
+                self.__compressed[byte, second] = gathered
+
+        # The bits of every node, the winning sequences, and the nodes that every rotation moves.
+        self.__node_bits = [numpy.uint64(1 << node) for node in range(node_count)]
+        self.__lines = [numpy.uint64(line) for line in engine.get_winning_lines().get_lines()]
+        self.__rotations = []
+        for sub_board in range(1, engine.get_sub_board_number() + 1):
+            for rotation in PentagoEngine.ROTATIONS:
+                self.__rotations.append(((sub_board, rotation),) + self.rotation_moves(sub_board, rotation))
+
+    def get_configuration(self):
+        """Gets the configuration whose positions are ranked."""
+        return self.__configuration
+
+    def get_node_count(self):
+        """Gets the number of nodes on the board, which is also the number of the last layer."""
+        return self.__node_count
+
+    def rotation_moves(self, sub_board, rotation):
+        """Returns a tuple of (the sub-board's mask, a list of (source bit, target bit) pairs) for a rotation.  The
+        pairs are read off the engine by rotating one marble at a time."""
+        engine = self.__engine
+        pairs = []
+        mask = 0
+        for row, column in engine.sub_board_positions(sub_board):
+            probe = PentagoEngine.PentagoEngine(*self.__configuration)
+            probe.apply((row, column, sub_board, rotation))
+            target = probe.get_boards()[0]
+            source = 1 << (row * engine.get_board_length() + column)
+            mask |= source
+            pairs.append((numpy.uint64(source), numpy.uint64(target)))
+        return numpy.uint64(mask), pairs
+
+    def layer_counts(self, layer):
+        """Returns a tuple of (marbles of the first player, marbles of the second player) in a layer."""
+        return (layer + 1) // 2, layer // 2
+
+    def layer_size(self, layer):
+        """Returns the number of positions in a layer."""
+        first, second = self.layer_counts(layer)
+        return int(self.__binomials[self.__node_count, layer] * self.__binomials[layer, second])
+
+    def rank(self, occupied, second, layer):
+        """Returns the ranks of positions in a layer, given arrays of their occupied nodes and the second player's
+        nodes."""
+        first_count, second_count = self.layer_counts(layer)
+        occupied_rank = numpy.zeros(len(occupied), dtype=numpy.int64)
+        second_rank = numpy.zeros(len(occupied), dtype=numpy.int64)
+        set_before = numpy.zeros(len(occupied), dtype=numpy.int64)
+        second_before = numpy.zeros(len(occupied), dtype=numpy.int64)
+        for byte_index in range(self.__byte_count):
+            occupied_byte = ((occupied >> numpy.uint64(byte_index * 8)) & numpy.uint64(255)).astype(numpy.int64)
+            second_byte = ((second >> numpy.uint64(byte_index * 8)) & numpy.uint64(255)).astype(numpy.int64)
+            occupied_rank += self.__occupied_ranks[byte_index, set_before, occupied_byte]
+            compressed = self.__compressed[occupied_byte, second_byte]
+            second_rank += self.__second_ranks[set_before, second_before, compressed]
+            set_before += self.__bit_counts[occupied_byte]
+            second_before += self.__bit_counts[second_byte]
+        return occupied_rank * self.__binomials[layer, second_count] + second_rank
+
+    def rank_boards(self, boards):
+        """Returns the layer and rank of one position, given its tuple of 2 bitboards."""
+        layer = bin(boards[0] | boards[1]).count('1')
+        occupied = numpy.array([boards[0] | boards[1]], dtype=numpy.uint64)
+        second = numpy.array([boards[1]], dtype=numpy.uint64)
+        return layer, int(self.rank(occupied, second, layer)[0])
+
+    def layer_positions(self, layer, first_row, row_count):
+        """Returns arrays of (first player's boards, second player's boards) for a slice of a layer.  The layer is
+        listed by its sets of occupied nodes, and every set is a row that holds every way of splitting it between
+        the players.  Rows are in the order of the occupied nodes' rank and splits in the order of the second
+        player's rank, so the slice holds the consecutive ranks from first_row times the number of splits."""
+        first_count, second_count = self.layer_counts(layer)
+        if layer == 0:
+            empty = numpy.zeros(row_count, dtype=numpy.uint64)
+            return empty, empty.copy()
+
+        # Unranking the rows straight from their numbers: the largest node of a set of k nodes with rank r is the
+        # largest node n where n choose k is at most r, and the rest of the set has the rank left over.
+        ranks = numpy.arange(first_row, first_row + row_count, dtype=numpy.int64)
+        nodes = numpy.zeros((row_count, layer), dtype=numpy.uint64)
+        for count in range(layer, 0, -1):
+            largest = numpy.searchsorted(self.__binomials[:self.__node_count, count], ranks, side='right') - 1
+            nodes[:, count - 1] = largest
+            ranks -= self.__binomials[largest, count]
+        bits = numpy.left_shift(numpy.uint64(1), nodes)
+        occupied = numpy.bitwise_or.reduce(bits, axis=1)
+
+        # Splitting every row in the order of the second player's rank, which compares the largest node first.
+        splits = sorted(itertools.combinations(range(layer), second_count), key=lambda split: split[::-1])
+        if second_count:
+            second = numpy.bitwise_or.reduce(bits[:, numpy.array(splits, dtype=numpy.intp)], axis=2)
+        else:
+            second = numpy.zeros((row_count, 1), dtype=numpy.uint64)
+        occupied = numpy.repeat(occupied, len(splits))
+        second = second.reshape(-1)
+        return occupied ^ second, second
+
+    def row_count(self, layer):
+        """Returns the number of rows (sets of occupied nodes) of a layer."""
+        return int(self.__binomials[self.__node_count, layer])
+
+    def has_sequence(self, boards):
+        """Returns a boolean array of which bitboards hold a winning sequence."""
+        found = numpy.zeros(len(boards), dtype=bool)
+        for line in self.__lines:
+            found |= (boards & line) == line
+        return found
+
+    def solve_positions(self, first, second, layer, next_layer):
+        """Returns the values of positions in a layer for the player to move, given arrays of both players' boards
+        and the solved table of the next layer (which isn't read for the last layer)."""
+        node_count = self.__node_count
+        mover_wins = self.has_sequence(first if layer % 2 == 0 else second)
+        other_wins = self.has_sequence(second if layer % 2 == 0 else first)
+
+        # Positions where someone already has a sequence, and full boards, are finished games.
+        values = numpy.full(len(first), LOSS, dtype=numpy.uint8)
+        values[mover_wins & other_wins] = DRAW
+        values[mover_wins & ~other_wins] = WIN
+        finished = mover_wins | other_wins
+        if layer == node_count:
+            values[~finished] = DRAW
+            return values
+        playing = numpy.flatnonzero(~finished)
+
+        # Trying every move of the positions that are still being played.  The best value found so far starts as a
+        # loss, and a position stops being looked at once it has found a win.
+        for node in range(node_count):
+            bit = self.__node_bits[node]
+            occupied = first[playing] | second[playing]
+            candidates = playing[(occupied & bit) == 0]
+            candidates = candidates[values[candidates] != WIN]
+            if not len(candidates):
+                continue
+            placed_first = first[candidates]
+            placed_second = second[candidates]
+            if layer % 2 == 0:
+                placed_first = placed_first | bit
+            else:
+                placed_second = placed_second | bit
+            best = values[candidates]
+            for move, mask, pairs in self.__rotations:
+                rotated_first = placed_first & ~mask
+                rotated_second = placed_second & ~mask
+                for source, target in pairs:
+                    rotated_first |= numpy.where((placed_first & source) != 0, target, numpy.uint64(0))
+                    rotated_second |= numpy.where((placed_second & source) != 0, target, numpy.uint64(0))
+                ranks = self.rank(rotated_first | rotated_second, rotated_second, layer + 1)
+                numpy.maximum(best, WIN - next_layer[ranks], out=best)
+            values[candidates] = best
+        return values
+
+
+def get_ranking(configuration):
+    """Returns the shared Ranking of a configuration, building it the first time it's asked for."""
+    configuration = tuple(configuration)
+    if configuration not in ranking_cache:
+        ranking_cache[configuration] = Ranking(configuration)
+    return ranking_cache[configuration]
+
+
+def read_layer(directory, layer):
+    """Returns the solved table of a layer from a solution's directory as a NumPy array."""
+    with open(os.path.join(directory, LAYER_NAME % layer), 'rb') as layer_file:
+        return numpy.frombuffer(zlib.decompress(layer_file.read()), dtype=numpy.uint8)
+
+
+def write_layer(directory, layer, table):
+    """Compresses a layer's table and writes it to the solution's directory."""
+    with LayerWriter(directory, layer) as writer:
+        writer.write(table)
+
+
+def unpack_layer(directory, layer):
+    """Decompresses a layer's file, a block at a time, into a raw file next to it that processes can map.  Returns
+    the raw file's path."""
+    path = os.path.join(directory, RAW_LAYER_NAME % layer)
+    decompressor = zlib.decompressobj()
+    with open(os.path.join(directory, LAYER_NAME % layer), 'rb') as layer_file, open(path, 'wb') as raw_file:
+        while True:
+            block = layer_file.read(BLOCK_SIZE)
+            if not block:
+                break
+            raw_file.write(decompressor.decompress(block))
+        raw_file.write(decompressor.flush())
+    return path
+
+
+class LayerWriter:
+    """Compresses a layer's table onto its file one piece at a time, so the table is never held whole.  The file is
+    written under another name first and only moved into place once the writer is closed without an error, so a
+    layer file is always whole."""
+
+    def __init__(self, directory, layer):
+        """Starts the file of a layer in a solution's directory."""
+        self.__path = os.path.join(directory, LAYER_NAME % layer)
+        self.__file = open(self.__path + '.tmp', 'wb')
+        self.__compressor = zlib.compressobj(6)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        if exception_type is None:
+            self.close()
+        else:
+            self.__file.close()
+            os.remove(self.__path + '.tmp')
+
+    def write(self, values):
+        """Appends the next piece of the table."""
+        self.__file.write(self.__compressor.compress(values.tobytes()))
+
+    def close(self):
+        """Finishes the file and moves it into place."""
+        self.__file.write(self.__compressor.flush())
+        self.__file.close()
+        os.replace(self.__path + '.tmp', self.__path)
+
+
+def read_index(directory):
+    """Returns the index of a solution's directory, or None if it doesn't have one."""
+    path = os.path.join(directory, INDEX_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path) as index_file:
+        return json.load(index_file)
+
+
+def write_index(directory, index):
+    """Writes the index of a solution's directory."""
+    path = os.path.join(directory, INDEX_NAME)
+    with open(path + '.tmp', 'w') as index_file:
+        json.dump(index, index_file, indent=1)
+    os.replace(path + '.tmp', path)
+
+
+def load_worker(path):
+    """Maps the raw file of the layer after the one being solved in a worker process, or forgets the last one when
+    path is None.  Every process maps the same file, so the layer isn't copied into each of them."""
+    global worker_next_layer
+    worker_next_layer = numpy.memmap(path, dtype=numpy.uint8, mode='r') if path is not None else None
+
+
+def solve_chunk(configuration, layer, first_row, row_count):
+    """Solves the positions in a slice of rows of a layer.  Returns their values, in the order of their ranks."""
+    ranking = get_ranking(configuration)
+    first, second = ranking.layer_positions(layer, first_row, row_count)
+    return ranking.solve_positions(first, second, layer, worker_next_layer)
+
+
+def solve_chunks(configuration, layer, chunks, next_path, workers):
+    """Yields the values of every chunk of (first row, row count) in order, given the path of the next layer's raw
+    file (None for the last layer).  The chunks are solved here when there's one worker, and in a pool otherwise
+    with at most QUEUED_CHUNKS waiting for every process."""
+    if workers == 1:
+        load_worker(next_path)
+        try:
+            for first_row, row_count in chunks:
+                yield solve_chunk(configuration, layer, first_row, row_count)
+        finally:
+            load_worker(None)
+        return
+    with ProcessPoolExecutor(workers, initializer=load_worker, initargs=(next_path,)) as pool:
+        pending = collections.deque()
+        for first_row, row_count in chunks:
+            pending.append(pool.submit(solve_chunk, configuration, layer, first_row, row_count))
+            if len(pending) > QUEUED_CHUNKS * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def solve(configuration, directory, min_layer=0, workers=None, report=print):
+    """Solves every layer of a configuration from the full board down to min_layer and writes them to a directory.
+    Layers that the directory already holds are kept, so a solve that was stopped can be resumed.  Returns the
+    index of the directory."""
+    ranking = get_ranking(configuration)
+    node_count = ranking.get_node_count()
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(directory, exist_ok=True)
+
+    # Starting from the directory's index, or a new one.
+    index = read_index(directory)
+    if (index is not None) and (tuple(index['configuration']) != ranking.get_configuration()):
+        raise ValueError("The directory holds the solution of configuration " + str(tuple(index['configuration'])) +
+                         ".")
+    if index is None:
+        index = {'configuration': list(ranking.get_configuration()), 'layers': {}}
+        write_index(directory, index)
+
+    for layer in range(node_count, min_layer - 1, -1):
+        if str(layer) in index['layers']:
+            continue
+        start = time.perf_counter()
+
+        # Splitting the layer into chunks of whole rows.
+        row_count = ranking.row_count(layer)
+        splits = ranking.layer_size(layer) // row_count
+        rows_per_chunk = max(1, CHUNK_POSITIONS // splits)
+        chunks = ((first_row, min(rows_per_chunk, row_count - first_row))
+                  for first_row in range(0, row_count, rows_per_chunk))
+
+        # Compressing every chunk onto the layer's file as it comes back.  The chunks hold consecutive ranks, so
+        # they're written in the order they were handed out.  The layer is written before it's added to the index,
+        # so the index never lists a layer that isn't all there.
+        next_path = unpack_layer(directory, layer + 1) if layer < node_count else None
+        counts = numpy.zeros(WIN + 1, dtype=numpy.int64)
+        try:
+            with LayerWriter(directory, layer) as writer:
+                for values in solve_chunks(configuration, layer, chunks, next_path, workers):
+                    writer.write(values)
+                    counts += numpy.bincount(values, minlength=WIN + 1)
+        finally:
+            if next_path is not None:
+                os.remove(next_path)
+        positions = ranking.layer_size(layer)
+        index['layers'][str(layer)] = {'positions': positions, 'wins': int(counts[WIN]),
+                                       'draws': int(counts[DRAW]), 'losses': int(counts[LOSS])}
+        write_index(directory, index)
+        report("Layer %3d : %10d positions, %10d wins, %10d draws, %10d losses in %.1f seconds." %
+               (layer, positions, counts[WIN], counts[DRAW], counts[LOSS], time.perf_counter() - start))
+    return index
+
+
+class SolvedTables:
+    """Looks positions up in a solved directory.  Layers are decompressed the first time they're needed and the
+    most recent CACHED_LAYERS are kept."""
+
+    def __init__(self, directory):
+        """Opens the solution in a directory.  Raises a ValueError if it doesn't hold one."""
+        index = read_index(directory)
+        if index is None:
+            raise ValueError("The directory doesn't hold a solution.")
+        self.__directory = directory
+        self.__ranking = get_ranking(index['configuration'])
+        self.__layers = set(int(layer) for layer in index['layers'])
+        self.__cache = {}
+
+    def get_configuration(self):
+        """Gets the configuration that was solved."""
+        return self.__ranking.get_configuration()
+
+    def get_layers(self):
+        """Gets the sorted list of the layers that were solved."""
+        return sorted(self.__layers)
+
+    def get_layer(self, layer):
+        """Returns the table of a layer, reading it from the disk if it isn't cached."""
+        if layer not in self.__cache:
+            if len(self.__cache) >= CACHED_LAYERS:
+                del self.__cache[next(iter(self.__cache))]
+            self.__cache[layer] = read_layer(self.__directory, layer)
+        return self.__cache[layer]
+
+    def probe(self, engine):
+        """Returns the value of the engine's position for the player to move (WIN, DRAW, or LOSS), or None if the
+        position's layer wasn't solved or the engine plays another configuration."""
+        if engine.get_configuration() != self.get_configuration():
+            return None
+        layer, rank = self.__ranking.rank_boards(engine.get_boards())
+        if layer not in self.__layers:
+            return None
+        return int(self.get_layer(layer)[rank])
+
+    def best_move(self, engine):
+        """Returns a tuple of (the best move, its value for the player to move) in the engine's position, or None if
+        the position can't be looked up.  Moves that win sooner aren't preferred; every best move is as good as any
+        other."""
+        if engine.is_terminal() or (self.probe(engine) is None):
+            return None
+        best = None
+        for move in engine.distinct_moves():
+            engine.apply(move)
+            try:
+                value = WIN - self.probe(engine)
+            finally:
+                engine.undo()
+            if (best is None) or (value > best[1]):
+                best = (move, value)
+                if value == WIN:
+                    break
+        return best
+
+
+def main(arguments=None):
+    """Solves a configuration as set up by command line arguments."""
+    parser = argparse.ArgumentParser(description="Solves small 2 player configurations of Scalable Pentago.")
+    parser.add_argument('--config', default='2,4,3,2',
+                        help="sub_board_length,sub_board_number,winning_length,players (default : 2,4,3,2)")
+    parser.add_argument('--output', required=True, help="the directory to write the solved layers to")
+    parser.add_argument('--min-layer', type=int, default=0, help="the layer (marble count) to stop at")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="the number of processes to use")
+    options = parser.parse_args(arguments)
+
+    try:
+        configuration = tuple(int(value) for value in options.config.split(','))
+        index = solve(configuration, options.output, options.min_layer, options.workers)
+    except ValueError as error:
+        parser.error(str(error))
+    if '0' in index['layers']:
+        value = WIN if index['layers']['0']['wins'] else (DRAW if index['layers']['0']['draws'] else LOSS)
+        print("The empty board is a " + VALUE_NAMES[value] + " for the first player.")
+    return 0
+
+
+# Solving the configuration if this script is the file that's designated as "main".
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,192 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Symmetries of a Scalable Pentago position.  The board is square and it is split into equal square
+#               sub-boards, so rotating or mirroring the whole board maps sub-boards onto sub-boards and winning
+#               sequences onto winning sequences; the 8 symmetries of a square give 8 versions of every position
+#               that play out the same way.  Players can also be renamed: shifting every player's number so that
+#               the player to move becomes player 0 keeps the order of turns.  A canonical form picks one version
+#               of every position, so caches, opening books, and datasets only need to store it once.
+#
+#               The symmetries are numbered like this, where (row, column) moves to the listed position and N is
+#               the board's length minus 1:
+#                   0 : (row, column)           identity
+#                   1 : (column, N - row)       clockwise quarter turn
+#                   2 : (N - row, N - column)   half turn
+#                   3 : (N - column, row)       anti-clockwise quarter turn
+#                   4 : (row, N - column)       mirror left to right
+#                   5 : (N - row, column)       mirror top to bottom
+#                   6 : (column, row)           mirror along the main diagonal
+#                   7 : (N - column, N - row)   mirror along the other diagonal
+#               Symmetries 4 to 7 mirror the board, which also turns clockwise rotations into anti-clockwise ones.
+
+# Importing hashlib so that canonical forms can be turned into hashes that stay the same from run to run.
+import hashlib
+
+
+# The number of symmetries of a square.
+SYMMETRY_COUNT = 8
+
+# The symmetry that undoes each symmetry.  The quarter turns undo each other; every other symmetry undoes itself.
+INVERSES = (0, 3, 2, 1, 4, 5, 6, 7)
+
+# The number of bits of a row that one lookup table covers.
+CHUNK_WIDTH = 8
+
+# The symmetry tables are shared by every game with the same shape.  The keys are (board_length, sub_board_length).
+board_symmetry_cache = {}
+
+
+class BoardSymmetry:
+    """Applies the 8 symmetries of a square to bitboards and moves of one board shape.  Every symmetry moves whole
+    rows of the bitboard at once: a row either lands on another row (possibly reversed) or is spread down a column
+    (possibly upside down), and both are done with lookup tables covering CHUNK_WIDTH bits of the row at a time."""
+
+    def __init__(self, board_length, sub_board_length):
+        """Builds the lookup tables for the passed board shape."""
+        self.__board_length = board_length
+        self.__sub_board_length = sub_board_length
+        self.__row_mask = (1 << board_length) - 1
+        last = board_length - 1
+
+        # The tables for each way a row can be placed, indexed by [chunk][pattern].  "Reversed" places bit J at
+        # bit N - J of the row, "spread" places bit J at row J of column 0, and "spread reversed" places bit J at
+        # row N - J of column 0.
+        chunk_count = (board_length + CHUNK_WIDTH - 1) // CHUNK_WIDTH
+        self.__chunks = range(chunk_count)
+        self.__reversed = []
+        self.__spread = []
+        self.__spread_reversed = []
+        for chunk in self.__chunks:
+            first = chunk * CHUNK_WIDTH
+            width = min(CHUNK_WIDTH, board_length - first)
+            destinations = {
+                'reversed': [last - (first + offset) for offset in range(width)],
+                'spread': [(first + offset) * board_length for offset in range(width)],
+                'spread_reversed': [(last - (first + offset)) * board_length for offset in range(width)],
+            }
+            for name, table_list in (('reversed', self.__reversed), ('spread', self.__spread),
+                                     ('spread_reversed', self.__spread_reversed)):
+                table = [0] * (1 << width)
+                for pattern in range(1, len(table)):
+                    lowest_bit = pattern & -pattern
+                    table[pattern] = table[pattern ^ lowest_bit] | (1 << destinations[name][lowest_bit.bit_length() - 1])
+                table_list.append(table)
+
+        # How each symmetry places row R: the table to use (None keeps the row as it is) and the bit the placed row
+        # is shifted up to.  Rows that stay rows are shifted to the start of their new row; rows that become columns
+        # are shifted to their new column.
+        row_starts = [row * board_length for row in range(board_length)]
+        self.__placements = (
+            [(None, row_starts[row]) for row in range(board_length)],
+            [(self.__spread, last - row) for row in range(board_length)],
+            [(self.__reversed, row_starts[last - row]) for row in range(board_length)],
+            [(self.__spread_reversed, row) for row in range(board_length)],
+            [(self.__reversed, row_starts[row]) for row in range(board_length)],
+            [(None, row_starts[last - row]) for row in range(board_length)],
+            [(self.__spread, row) for row in range(board_length)],
+            [(self.__spread_reversed, last - row) for row in range(board_length)],
+        )
+
+    def transform_position(self, row, column, symmetry, last=None):
+        """Returns the (row, column) a position moves to under a symmetry.  The last row or column defaults to the
+        board's; passing the last sub-board row instead transforms positions on the grid of sub-boards."""
+        if last is None:
+            last = self.__board_length - 1
+        if symmetry == 0:
+            return row, column
+        if symmetry == 1:
+            return column, last - row
+        if symmetry == 2:
+            return last - row, last - column
+        if symmetry == 3:
+            return last - column, row
+        if symmetry == 4:
+            return row, last - column
+        if symmetry == 5:
+            return last - row, column
+        if symmetry == 6:
+            return column, row
+        return last - column, last - row
+
+    def transform_board(self, board, symmetry):
+        """Returns the bitboard moved by a symmetry."""
+        if symmetry == 0:
+            return board
+        board_length = self.__board_length
+        row_mask = self.__row_mask
+        chunk_mask = (1 << CHUNK_WIDTH) - 1
+        result = 0
+        for row, (tables, destination) in enumerate(self.__placements[symmetry]):
+            pattern = (board >> (row * board_length)) & row_mask
+            if not pattern:
+                continue
+            if tables is None:
+                result |= pattern << destination
+                continue
+            placed = 0
+            for chunk in self.__chunks:
+                placed |= tables[chunk][(pattern >> (chunk * CHUNK_WIDTH)) & chunk_mask]
+            result |= placed << destination
+        return result
+
+    def transform_move(self, move, symmetry):
+        """Returns the move that does in the transformed position what the passed move does in the original one."""
+        row, column, sub_board, rotation = move
+        new_row, new_column = self.transform_position(row, column, symmetry)
+
+        # The sub-boards form a smaller square grid that moves the same way as the board.
+        per_side = self.__board_length // self.__sub_board_length
+        sub_board_row, sub_board_column = divmod(sub_board - 1, per_side)
+        sub_board_row, sub_board_column = self.transform_position(sub_board_row, sub_board_column, symmetry,
+                                                                  per_side - 1)
+
+        # Mirrored boards turn the other way.
+        if symmetry >= 4:
+            rotation = 'A' if rotation.upper() == 'C' else 'C'
+        return new_row, new_column, sub_board_row * per_side + sub_board_column + 1, rotation.upper()
+
+    def canonical_form(self, boards, current_player):
+        """Returns a tuple of (canonical boards, symmetry).  The boards are first renamed so that the player to move
+        comes first, then the symmetry that gives the smallest tuple of bitboards is chosen.  Applying the returned
+        symmetry to the original position gives the canonical boards."""
+        player_count = len(boards)
+        relabelled = tuple(boards[(current_player + offset) % player_count] for offset in range(player_count))
+        best = relabelled
+        best_symmetry = 0
+        for symmetry in range(1, SYMMETRY_COUNT):
+            candidate = tuple(self.transform_board(board, symmetry) for board in relabelled)
+            if candidate < best:
+                best = candidate
+                best_symmetry = symmetry
+        return best, best_symmetry
+
+
+def get_board_symmetry(board_length, sub_board_length):
+    """Returns the shared BoardSymmetry for the passed board shape, building it the first time it's asked for."""
+    key = (board_length, sub_board_length)
+    if key not in board_symmetry_cache:
+        board_symmetry_cache[key] = BoardSymmetry(board_length, sub_board_length)
+    return board_symmetry_cache[key]
+
+
+def canonical_form(engine):
+    """Returns a tuple of (canonical boards, symmetry) for the engine's position.  See BoardSymmetry.canonical_form."""
+    symmetry = get_board_symmetry(engine.get_board_length(), engine.get_sub_board_length())
+    return symmetry.canonical_form(engine.get_boards(), engine.get_current_player())
+
+
+def canonical_hash(engine):
+    """Returns a tuple of (64-bit hash of the canonical form, symmetry) for the engine's position.  The hash depends
+    only on the configuration and the canonical boards, so it is the same on every run and every machine."""
+    boards, symmetry = canonical_form(engine)
+    return hash_boards(engine.get_configuration(), boards), symmetry
+
+
+def hash_boards(configuration, boards):
+    """Returns a 64-bit hash of a configuration tuple and a tuple of bitboards that stays the same from run to run."""
+    node_bytes = (configuration[0] * configuration[0] * configuration[1] + 7) // 8
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(repr(configuration).encode())
+    for board in boards:
+        digest.update(board.to_bytes(node_bytes, 'little'))
+    return int.from_bytes(digest.digest(), 'little')
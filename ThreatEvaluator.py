@@ -0,0 +1,284 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : A static evaluation of Scalable Pentago positions built from threat patterns.  Every winning sequence
+#               that holds marbles of only one player is a threat for that player, counted by how many of its
+#               marbles are in place and how many of its two end neighbours (the nodes just past either end along
+#               its direction) are empty: 2 for an open threat, 1 for a half-open threat, and 0 for a closed one.
+#               The counts are kept up to date incrementally.  Whenever the evaluator is asked about a position, it
+#               compares the position's bitboards with the last ones it saw, and only the sequences that pass
+#               through a changed node or end next to one are looked at again; a move changes its node and the
+#               nodes of the sub-board it rotates, so placements, rotations, and undos all cost the same small
+#               amount.  Each threat is worth a weight from a table of [marbles][open ends], which can be passed in
+#               to tune a player, and all the children of a position can be scored in one pass without applying
+#               their moves to the engine.
+#
+#               Example : evaluator = ThreatEvaluator.ThreatEvaluator(engine)
+#                         score = evaluator.evaluate(engine, engine.get_current_player())
+
+# Importing the engine for the directions of the rotations.
+import PentagoEngine
+
+# Importing the winning sequences that threats are counted on.
+import WinningLines
+
+
+# The base score of a threat that holds a number of a player's marbles.  Index X is the score for X marbles; threats
+# with more marbles are worth much more since they are closer to being completed.  Threats with more marbles than
+# the list holds get the last score.
+SEQUENCE_SCORES = [0, 1, 4, 16, 64, 256, 1024, 4096]
+
+# How much the base score is multiplied by for a threat with 0, 1, or 2 empty end neighbours.  An open threat can
+# still grow into a longer run on either side, so it's worth more than one that is boxed in.
+OPEN_END_FACTORS = (2, 3, 4)
+
+# The value stored for a sequence that isn't a threat for anyone: it's empty, or more than one player has marbles in it.
+NO_THREAT = -1
+
+
+class ThreatEvaluator:
+    """Counts the threats of every player in the positions of one configuration.  The evaluator isn't tied to one
+    engine's position; it follows whichever position it's asked about, so a search can apply and undo moves freely
+    between evaluations."""
+
+    def __init__(self, engine, weights=None):
+        """Creates an evaluator for the configuration of the engine, starting from its current position.  The
+        weights are a table where weights[X][Y] is the worth of a threat with X marbles and Y empty end neighbours,
+        for X from 0 to the winning length; by default it's made by make_weights.  Raises a ValueError if the
+        weights don't have that shape."""
+        board_length = engine.get_board_length()
+        winning_length = engine.get_winning_length()
+        self.__board_length = board_length
+        self.__sub_board_length = engine.get_sub_board_length()
+        self.__winning_length = winning_length
+        self.__player_count = engine.get_player_count()
+
+        if weights is None:
+            weights = make_weights(winning_length)
+        if (len(weights) != winning_length + 1) or any(len(row) != 3 for row in weights):
+            raise ValueError("The weights must have " + str(winning_length + 1) + " rows (0 to " +
+                             str(winning_length) + " marbles) of 3 values (0 to 2 open ends).")
+
+        # Every kind of threat has its own index: (player * (winning_length + 1) + marbles) * 3 + open ends.  The
+        # worth, the player, and the number of marbles of each index are looked up instead of worked out.
+        self.__index_weights = []
+        self.__index_players = []
+        self.__index_marbles = []
+        for player in range(self.__player_count):
+            for marbles in range(winning_length + 1):
+                for open_ends in range(3):
+                    self.__index_weights.append(weights[marbles][open_ends])
+                    self.__index_players.append(player)
+                    self.__index_marbles.append(marbles)
+
+        # The bitmask of every sequence and of its end neighbours that are on the board.  An end neighbour that
+        # would be off of the board is left out, so it counts the same as one that is blocked.
+        lines = WinningLines.get_winning_lines(board_length, winning_length)
+        self.__line_masks = lines.get_lines()
+        self.__end_masks = []
+        touching = [list(lines.get_lines_of_node(node)) for node in range(board_length * board_length)]
+        for line in range(lines.get_line_count()):
+            nodes = lines.get_line_nodes(line)
+            row_step, column_step = WinningLines.DIRECTIONS[lines.get_line_direction(line)]
+            end_mask = 0
+            for node, sign in ((nodes[0], -1), (nodes[-1], 1)):
+                row, column = divmod(node, board_length)
+                row += row_step * sign
+                column += column_step * sign
+                if (0 <= row < board_length) and (0 <= column < board_length):
+                    end_node = row * board_length + column
+                    end_mask |= 1 << end_node
+                    touching[end_node].append(line)
+            self.__end_masks.append(end_mask)
+
+        # The sequences that have to be looked at again when a node changes: the ones through it and the ones that
+        # end next to it.
+        self.__lines_of_node = [tuple(numbers) for numbers in touching]
+
+        # Where each node of a sub-board lands when it's rotated, filled in the first time it's needed.
+        self.__landings = {}
+
+        # The position the counts belong to, the threat index of every sequence, and the totals.
+        self.__boards = (0,) * self.__player_count
+        self.__line_threats = [NO_THREAT] * lines.get_line_count()
+        self.__counts = [0] * len(self.__index_weights)
+        self.__totals = [0] * self.__player_count
+        self.follow(engine.get_boards())
+
+    def get_counts(self, player):
+        """Gets the threat counts of a player in the last position the evaluator followed, as a list where index X
+        holds the counts of threats with X marbles as [closed, half-open, open]."""
+        start = player * (self.__winning_length + 1) * 3
+        counts = self.__counts[start:start + (self.__winning_length + 1) * 3]
+        return [counts[marbles * 3:marbles * 3 + 3] for marbles in range(self.__winning_length + 1)]
+
+    def get_totals(self):
+        """Gets a list of the weighted worth of every player's threats in the last position the evaluator followed."""
+        return list(self.__totals)
+
+    def follow(self, boards):
+        """Brings the counts up to date with a tuple of bitboards.  Only the sequences through the nodes that differ
+        from the last bitboards, and the ones that end next to them, are looked at again."""
+        changed = 0
+        for before, after in zip(self.__boards, boards):
+            changed |= before ^ after
+        if not changed:
+            return
+        self.__boards = tuple(boards)
+        occupied = 0
+        for board in boards:
+            occupied |= board
+
+        line_threats = self.__line_threats
+        counts = self.__counts
+        totals = self.__totals
+        index_weights = self.__index_weights
+        index_players = self.__index_players
+        for line in self.lines_touching(changed):
+            threat = self.classify(line, boards, occupied)
+            previous = line_threats[line]
+            if threat == previous:
+                continue
+            if previous != NO_THREAT:
+                counts[previous] -= 1
+                totals[index_players[previous]] -= index_weights[previous]
+            if threat != NO_THREAT:
+                counts[threat] += 1
+                totals[index_players[threat]] += index_weights[threat]
+            line_threats[line] = threat
+
+    def evaluate(self, engine, player):
+        """Returns the score of the engine's position for a player: the worth of its threats minus the worth of
+        everyone else's."""
+        self.follow(engine.get_boards())
+        totals = self.__totals
+        return 2 * totals[player] - sum(totals)
+
+    def score_children(self, engine, moves, player):
+        """Returns a list holding a tuple of (score for the player, winners) for the position every move leads to,
+        without applying the moves to the engine.  The winners are the players with a completed sequence, the same
+        as the engine's winners after the move."""
+        return list(self.child_scores(engine, moves, player))
+
+    def child_scores(self, engine, moves, player):
+        """Yields the tuples of score_children one move at a time, so a search can stop as soon as it has seen
+        enough.  Moves that rotate the same sub-board the same way share the work of the rotation, so each of them
+        only has to look again at the sequences around its own marble.  The engine must not change while the
+        tuples are being yielded."""
+        self.follow(engine.get_boards())
+        mover = engine.get_current_player()
+        board_length = self.__board_length
+        line_threats = self.__line_threats
+        index_weights = self.__index_weights
+        index_players = self.__index_players
+        index_marbles = self.__index_marbles
+        winning_length = self.__winning_length
+
+        groups = {}
+        for row, column, sub_board, rotation in moves:
+            rotation = rotation.upper()
+
+            # Working out the rotation once for every move that shares it: the rotated boards, the threats of the
+            # sequences it changes, the totals after it, and anyone it completes a sequence for.
+            group = groups.get((sub_board, rotation))
+            if group is None:
+                rotated = engine.rotated_boards(sub_board, rotation)
+                rotated_occupied = 0
+                changed = 0
+                for before, after in zip(self.__boards, rotated):
+                    rotated_occupied |= after
+                    changed |= before ^ after
+                rotated_threats = {}
+                rotated_totals = list(self.__totals)
+                rotated_winners = set()
+                for line in self.lines_touching(changed):
+                    threat = self.classify(line, rotated, rotated_occupied)
+                    previous = line_threats[line]
+                    if previous != NO_THREAT:
+                        rotated_totals[index_players[previous]] -= index_weights[previous]
+                    if threat != NO_THREAT:
+                        rotated_totals[index_players[threat]] += index_weights[threat]
+                        if index_marbles[threat] == winning_length:
+                            rotated_winners.add(index_players[threat])
+                    rotated_threats[line] = threat
+                group = (rotated, rotated_occupied, rotated_threats, rotated_totals, rotated_winners)
+                groups[(sub_board, rotation)] = group
+            rotated, rotated_occupied, rotated_threats, rotated_totals, rotated_winners = group
+
+            # Placing the marble where it ends up after the rotation.  A completed sequence can't be broken by a
+            # marble placed on an empty node, so the rotation's winners stay winners.
+            node = row * board_length + column
+            node = self.get_landings(sub_board, rotation).get(node, node)
+            bit = 1 << node
+            child = list(rotated)
+            child[mover] |= bit
+            child_occupied = rotated_occupied | bit
+            totals = list(rotated_totals)
+            winners = set(rotated_winners)
+            for line in self.__lines_of_node[node]:
+                threat = self.classify(line, child, child_occupied)
+                previous = rotated_threats.get(line, line_threats[line])
+                if threat == previous:
+                    continue
+                if previous != NO_THREAT:
+                    totals[index_players[previous]] -= index_weights[previous]
+                if threat != NO_THREAT:
+                    totals[index_players[threat]] += index_weights[threat]
+                    if index_marbles[threat] == winning_length:
+                        winners.add(index_players[threat])
+            yield 2 * totals[player] - sum(totals), sorted(winners)
+
+    def classify(self, line, boards, occupied):
+        """Returns the threat index of a sequence in a position, or NO_THREAT if the sequence is empty or holds
+        marbles of more than one player."""
+        mask = self.__line_masks[line]
+        held = occupied & mask
+        if not held:
+            return NO_THREAT
+        for player, board in enumerate(boards):
+            inside = board & mask
+            if inside:
+                if inside != held:
+                    return NO_THREAT
+                end_mask = self.__end_masks[line]
+                open_ends = (end_mask ^ (end_mask & occupied)).bit_count()
+                return (player * (self.__winning_length + 1) + inside.bit_count()) * 3 + open_ends
+        return NO_THREAT
+
+    def lines_touching(self, nodes):
+        """Returns the set of sequences that pass through or end next to any node of a bitmask."""
+        lines = set()
+        lines_of_node = self.__lines_of_node
+        while nodes:
+            lowest_bit = nodes & -nodes
+            lines.update(lines_of_node[lowest_bit.bit_length() - 1])
+            nodes ^= lowest_bit
+        return lines
+
+    def get_landings(self, sub_board, rotation):
+        """Gets a dictionary of where every node of a sub-board lands when it's rotated in a direction.  A clockwise
+        rotation moves a node at (row, column) of the sub-board to (column, length - 1 - row), and an anti-clockwise
+        rotation moves it to (length - 1 - column, row), the same as the engine."""
+        key = (sub_board, rotation)
+        if key not in self.__landings:
+            length = self.__sub_board_length
+            sub_boards_per_side = self.__board_length // length
+            corner_row = (sub_board - 1) // sub_boards_per_side * length
+            corner_column = (sub_board - 1) % sub_boards_per_side * length
+            landings = {}
+            for row in range(length):
+                for column in range(length):
+                    if rotation == PentagoEngine.ROTATIONS[0]:
+                        new_row, new_column = column, length - 1 - row
+                    else:
+                        new_row, new_column = length - 1 - column, row
+                    landings[(corner_row + row) * self.__board_length + corner_column + column] = \
+                        (corner_row + new_row) * self.__board_length + corner_column + new_column
+            self.__landings[key] = landings
+        return self.__landings[key]
+
+
+def make_weights(winning_length, sequence_scores=SEQUENCE_SCORES, open_end_factors=OPEN_END_FACTORS):
+    """Returns a weights table for a winning length, where a threat with X marbles and Y empty end neighbours is
+    worth sequence_scores[X] (or the last score, past the end of the list) times open_end_factors[Y]."""
+    return [[sequence_scores[min(marbles, len(sequence_scores) - 1)] * factor for factor in open_end_factors]
+            for marbles in range(winning_length + 1)]
@@ -0,0 +1,423 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : A round-robin tournament runner for Scalable Pentago bots.  Every line-up of bots plays a number of
+#               games on every configuration that's asked for, with every bot taking every seat.  Games are spread
+#               across a pool of processes and each game gets its own seed that only depends on the tournament's
+#               seed and the game's name, so any game can be played again exactly.  Results are written to a JSON
+#               lines file as soon as each game finishes; running the same tournament again with the same file
+#               skips the games that are already in it, so a tournament that was stopped can be resumed.  At the
+#               end, a table of wins, draws, and losses is printed along with Elo estimates for every bot.
+#
+#               Example : python Tournament.py random alphabeta:depth=1 --config 3,4,5,2 --games 10
+
+# Importing argparse so that tournaments can be set up from the command line.
+import argparse
+
+# Importing hashlib so that every game's seed can be worked out from its name on any machine.
+import hashlib
+
+# Importing itertools to build the line-ups of bots.
+import itertools
+
+# Importing json so that results can be streamed to and read back from a file.
+import json
+
+# Importing os to find out how many cores there are and whether a results file already exists.
+import os
+
+# Importing random for the random bot and for anything else the bots pick by chance.
+import random
+
+# Importing time so that the length of every game can be recorded.
+import time
+
+# Importing the process pool that plays the games side by side.
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Importing the engine for the rules of the game.
+import PentagoEngine
+
+# Importing the computer player so it can take part in tournaments.
+import AlphaBetaPlayer
+
+# Importing the transposition table for its default size.
+import TranspositionTable
+
+# Importing opening books so that alpha-beta bots can be given one.
+import OpeningBook
+
+# Importing the Monte Carlo tree search player so it can take part in tournaments.
+import MCTSPlayer
+
+
+# The rating every bot starts from and the number of rating points where a bot is expected to score 10 times as much
+# as its opponent; these are the usual values for Elo ratings.
+ELO_BASE = 1500.0
+ELO_SCALE = 400.0
+
+# How many passes are made over the results when fitting the Elo ratings and how far a rating moves on each pass.
+ELO_ITERATIONS = 2000
+ELO_STEP = 32.0
+
+
+class RandomPlayer:
+    """A bot that picks a random empty node, a random sub-board, and a random direction.  It is the weakest
+    possible opponent, so it's a good baseline for other bots."""
+
+    def __init__(self, seed=None):
+        """Creates a random bot.  Bots with the same seed make the same moves in the same positions."""
+        self.__random = random.Random(seed)
+
+    def choose_move(self, engine):
+        """Returns a random legal move.  Raises a ValueError if the game is already over."""
+        if engine.is_terminal():
+            raise ValueError("The game is over.  No more moves can be made.")
+        row, column = self.__random.choice(list(engine.empty_cells()))
+        sub_board = self.__random.randint(1, engine.get_sub_board_number())
+        return row, column, sub_board, self.__random.choice(PentagoEngine.ROTATIONS)
+
+
+def make_random_player(options, seed):
+    """Creates a RandomPlayer.  It doesn't take any options."""
+    return RandomPlayer(seed)
+
+
+def make_alpha_beta_player(options, seed):
+    """Creates an AlphaBetaPlayer.  The options are "time" (seconds per move), "depth" (the deepest search),
+    "table" (megabytes of transposition table), "symmetry" (1 to share entries between symmetric positions), and
+    "book" (the path of an opening book).  A depth without a time gives every move as long as it needs, which keeps
+    games reproducible."""
+    depth = int(options['depth']) if 'depth' in options else None
+    time_limit = float(options['time']) if 'time' in options else (float('inf') if depth is not None else 1.0)
+    book = OpeningBook.OpeningBook(options['book']) if 'book' in options else None
+    return AlphaBetaPlayer.AlphaBetaPlayer(time_limit, depth,
+                                           float(options.get('table', TranspositionTable.DEFAULT_MEGABYTES)),
+                                           options.get('symmetry', '0') == '1', book)
+
+
+def make_mcts_player(options, seed):
+    """Creates an MCTSPlayer.  The options are "time" (seconds per move), "visits" (the most rollouts per move),
+    "exploration" (the UCT constant), and "bias" (the chance a rollout move goes next to the mover's marbles).  Games
+    are already played side by side, so the player doesn't start worker processes of its own.  Visits without a time
+    keep games reproducible."""
+    visits = int(options['visits']) if 'visits' in options else None
+    time_limit = float(options['time']) if 'time' in options else (float('inf') if visits is not None else 1.0)
+    return MCTSPlayer.MCTSPlayer(time_limit, 1, seed, visits, float(options.get('exploration', MCTSPlayer.EXPLORATION)),
+                                 float(options.get('bias', MCTSPlayer.ROLLOUT_BIAS)))
+
+
+# The kinds of bots a tournament can use, by name.  Every maker takes a dictionary of options and a seed.
+BOT_MAKERS = {
+    'random': make_random_player,
+    'alphabeta': make_alpha_beta_player,
+    'mcts': make_mcts_player,
+}
+
+
+def parse_bot(specification):
+    """Returns a tuple of (kind, options) for a bot written as "kind" or "kind:option=value,option=value".  Raises a
+    ValueError for an unknown kind or a badly written option."""
+    kind, _, option_text = specification.partition(':')
+    if kind not in BOT_MAKERS:
+        raise ValueError("Unknown bot : " + kind + ".  Known bots : " + ", ".join(sorted(BOT_MAKERS)))
+    options = {}
+    for option in filter(None, option_text.split(',')):
+        name, equals, value = option.partition('=')
+        if not equals:
+            raise ValueError("Bot options must be written as name=value.  Option : " + option)
+        options[name] = value
+    return kind, options
+
+
+def make_bot(specification, seed):
+    """Creates the bot written in the specification with the passed seed."""
+    kind, options = parse_bot(specification)
+    return BOT_MAKERS[kind](options, seed)
+
+
+def all_configurations(max_board_length, max_players=None):
+    """Returns a list of every configuration (sub_board_length, sub_board_number, winning_length, player_count)
+    the game allows on boards no longer than max_board_length, optionally with no more than max_players."""
+    configurations = []
+    sub_board_number = 4
+    while 2 * int(sub_board_number ** 0.5) <= max_board_length:
+        for sub_board_length in range(2, max_board_length // int(sub_board_number ** 0.5) + 1):
+            board_length = sub_board_length * int(sub_board_number ** 0.5)
+            for winning_length in range(2, board_length + 1):
+                for player_count in itertools.count(2):
+                    if (max_players is not None) and (player_count > max_players):
+                        break
+                    try:
+                        PentagoEngine.validate_configuration(sub_board_length, sub_board_number, winning_length,
+                                                             player_count)
+                    except ValueError:
+                        break
+                    configurations.append((sub_board_length, sub_board_number, winning_length, player_count))
+        sub_board_number *= 4
+    return configurations
+
+
+def line_ups(bot_count, player_count):
+    """Returns every seating of bots for one configuration as tuples of bot indexes, one per seat.  Every group of
+    bots plays once with each bot in each seat, turning the seats like a table.  Bots are repeated when there are
+    more seats than bots."""
+    if bot_count >= player_count:
+        groups = itertools.combinations(range(bot_count), player_count)
+    else:
+        groups = itertools.combinations_with_replacement(range(bot_count), player_count)
+    seatings = []
+    seen = set()
+    for group in groups:
+        if len(set(group)) == 1:
+            continue
+        for turn in range(player_count):
+            seating = group[turn:] + group[:turn]
+            if seating not in seen:
+                seen.add(seating)
+                seatings.append(seating)
+    return seatings
+
+
+def schedule(bots, configurations, games_per_line_up, tournament_seed):
+    """Returns the list of games in a tournament.  Every game is a dictionary that holds everything a worker needs
+    to play it, including a name made from the tournament's seed, the configuration, the seating, and the round,
+    and the game's own seed worked out from that name."""
+    games = []
+    for configuration in configurations:
+        for seating in line_ups(len(bots), configuration[3]):
+            for round_number in range(games_per_line_up):
+                name = "%d|%s|%s|%d" % (tournament_seed, ",".join(map(str, configuration)),
+                                        ",".join(bots[bot] for bot in seating), round_number)
+                games.append({'name': name, 'configuration': configuration,
+                              'seats': [bots[bot] for bot in seating], 'seed': game_seed(tournament_seed, name)})
+    return games
+
+
+def game_seed(tournament_seed, name):
+    """Returns a 64-bit seed for a game that only depends on the tournament's seed and the game's name."""
+    digest = hashlib.blake2b((str(tournament_seed) + "|" + name).encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), 'little')
+
+
+def play_game(game):
+    """Plays one scheduled game to the end and returns its result as a dictionary.  This runs inside of the worker
+    processes, so it only takes and returns plain data."""
+    engine = PentagoEngine.PentagoEngine(*game['configuration'])
+
+    # Every seat gets its own seed so that two copies of the same bot don't make the same choices.
+    bots = [make_bot(specification, game['seed'] + seat) for seat, specification in enumerate(game['seats'])]
+
+    start = time.perf_counter()
+    while not engine.is_terminal():
+        engine.apply(bots[engine.get_current_player()].choose_move(engine))
+    return {'name': game['name'], 'configuration': list(game['configuration']), 'seats': game['seats'],
+            'seed': game['seed'], 'winners': engine.winners(), 'moves': engine.get_move_count(),
+            'seconds': round(time.perf_counter() - start, 4)}
+
+
+def read_results(path):
+    """Returns the list of results already in a results file, or an empty list if there isn't one.  A line that
+    was cut off part way through (like when a tournament is stopped while writing) is ignored."""
+    results = []
+    if not os.path.exists(path):
+        return results
+    with open(path) as results_file:
+        for line in results_file:
+            try:
+                results.append(json.loads(line))
+            except ValueError:
+                continue
+    return results
+
+
+def repair_results(path):
+    """Cuts a results file back to the end of its last whole line, so that a line that was cut off part way through
+    isn't joined onto the next result that is appended."""
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb+') as results_file:
+        end = results_file.read().rfind(b'\n') + 1
+        if end != results_file.tell():
+            results_file.truncate(end)
+
+
+def run_tournament(games, results_path, workers=None, report=print):
+    """Plays every game that isn't already in the results file and appends each result as soon as it finishes.
+    Returns the list of every result in the file, old and new."""
+    results = read_results(results_path)
+    finished = {result['name'] for result in results}
+    remaining = [game for game in games if game['name'] not in finished]
+    report("%d games scheduled, %d already played, %d to play." % (len(games), len(games) - len(remaining),
+                                                                   len(remaining)))
+    if not remaining:
+        return results
+
+    # Playing the games side by side.  Results are flushed one at a time so that a stopped tournament keeps every
+    # game that finished.
+    repair_results(results_path)
+    with open(results_path, 'a') as results_file, \
+            ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(play_game, game) for game in remaining]
+        for count, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results_file.write(json.dumps(result) + '\n')
+            results_file.flush()
+            results.append(result)
+            report("[%d/%d] %s : winners %s in %d moves." % (count, len(remaining), result['name'],
+                                                             result['winners'], result['moves']))
+    return results
+
+
+def tally(results):
+    """Returns a dictionary that maps each bot to its counts of games, wins, draws (shared wins and full boards),
+    and losses."""
+    table = {}
+    for result in results:
+        winners = set(result['winners'])
+        for seat, bot in enumerate(result['seats']):
+            counts = table.setdefault(bot, {'games': 0, 'wins': 0, 'draws': 0, 'losses': 0})
+            counts['games'] += 1
+            if (seat in winners) and (len(winners) == 1):
+                counts['wins'] += 1
+            elif (seat in winners) or (not winners):
+                counts['draws'] += 1
+            else:
+                counts['losses'] += 1
+    return table
+
+
+def pairwise_scores(results):
+    """Returns a list of (bot, other bot, score) tuples, one for every pair of seats in every game.  A seat that won
+    scores 1 against a seat that didn't; seats that both won or both lost score 0.5 against each other.  Seats with
+    the same bot are skipped since they say nothing about its strength."""
+    scores = []
+    for result in results:
+        winners = set(result['winners'])
+        for first, second in itertools.combinations(range(len(result['seats'])), 2):
+            if result['seats'][first] == result['seats'][second]:
+                continue
+            if (first in winners) == (second in winners):
+                score = 0.5
+            else:
+                score = 1.0 if first in winners else 0.0
+            scores.append((result['seats'][first], result['seats'][second], score))
+    return scores
+
+
+def elo_ratings(results):
+    """Returns a dictionary of Elo estimates for every bot that fit the pairwise scores of the results.  The ratings
+    are moved towards the scores they should have produced again and again until they settle, and then shifted so
+    that their average is ELO_BASE."""
+    scores = pairwise_scores(results)
+    bots = sorted({bot for result in results for bot in result['seats']})
+    ratings = dict.fromkeys(bots, 0.0)
+    if not scores:
+        return {bot: ELO_BASE for bot in bots}
+    pairings = {bot: 0 for bot in bots}
+    for first, second, score in scores:
+        pairings[first] += 1
+        pairings[second] += 1
+
+    for iteration in range(ELO_ITERATIONS):
+        differences = dict.fromkeys(bots, 0.0)
+        for first, second, score in scores:
+            expected = 1.0 / (1.0 + 10.0 ** ((ratings[second] - ratings[first]) / ELO_SCALE))
+            differences[first] += score - expected
+            differences[second] -= score - expected
+        for bot in bots:
+            ratings[bot] += ELO_STEP * differences[bot] / max(1, pairings[bot])
+
+        # Bots that won or lost every pairing would drift forever, so the ratings are kept within a sane range.
+        for bot in bots:
+            ratings[bot] = max(-2 * ELO_SCALE * len(bots), min(2 * ELO_SCALE * len(bots), ratings[bot]))
+
+    average = sum(ratings.values()) / len(ratings)
+    return {bot: round(ELO_BASE + rating - average, 1) for bot, rating in ratings.items()}
+
+
+def format_tables(results):
+    """Returns the win, draw, and loss table and the head to head table of the results as printable text."""
+    table = tally(results)
+    ratings = elo_ratings(results)
+    bots = sorted(table, key=lambda bot: -ratings[bot])
+    width = max([len(bot) for bot in bots] + [3])
+    lines = ["%-*s %7s %7s %7s %7s %8s" % (width, "Bot", "Games", "Wins", "Draws", "Losses", "Elo")]
+    for bot in bots:
+        counts = table[bot]
+        lines.append("%-*s %7d %7d %7d %7d %8.1f" % (width, bot, counts['games'], counts['wins'], counts['draws'],
+                                                    counts['losses'], ratings[bot]))
+
+    # The head to head table holds the average pairwise score of the row's bot against the column's bot.
+    totals = {}
+    for first, second, score in pairwise_scores(results):
+        for row, column, row_score in ((first, second, score), (second, first, 1.0 - score)):
+            total = totals.setdefault((row, column), [0.0, 0])
+            total[0] += row_score
+            total[1] += 1
+    lines.append("")
+    lines.append("%-*s " % (width, "") + " ".join("%*s" % (max(6, len(bot)), bot) for bot in bots))
+    for row in bots:
+        cells = []
+        for column in bots:
+            total = totals.get((row, column))
+            cells.append("%*s" % (max(6, len(column)), "-" if not total else "%.3f" % (total[0] / total[1])))
+        lines.append("%-*s " % (width, row) + " ".join(cells))
+    return '\n'.join(lines)
+
+
+def parse_configuration(text):
+    """Returns a configuration tuple for text written as "sub_board_length,sub_board_number,winning_length,players".
+    Raises an ArgumentTypeError when it isn't a valid configuration."""
+    try:
+        configuration = tuple(int(value) for value in text.split(','))
+        if len(configuration) != 4:
+            raise ValueError("A configuration needs 4 numbers.")
+        PentagoEngine.validate_configuration(*configuration)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
+    return configuration
+
+
+def main(arguments=None):
+    """Runs a tournament set up by command line arguments."""
+    parser = argparse.ArgumentParser(description="Plays a round-robin tournament between Scalable Pentago bots.")
+    parser.add_argument('bots', nargs='+', help="bots written as kind or kind:option=value,... (kinds : " +
+                                                ", ".join(sorted(BOT_MAKERS)) + ")")
+    parser.add_argument('--config', dest='configurations', action='append', type=parse_configuration,
+                        help="a configuration written as sub_board_length,sub_board_number,winning_length,players; "
+                             "can be given more than once")
+    parser.add_argument('--all-configurations', type=int, metavar='MAX_BOARD_LENGTH',
+                        help="play every configuration the game allows up to this board length")
+    parser.add_argument('--max-players', type=int, help="leave out configurations with more players than this")
+    parser.add_argument('--games', type=int, default=2, help="games per line-up on each configuration")
+    parser.add_argument('--seed', type=int, default=0, help="the tournament's seed")
+    parser.add_argument('--workers', type=int, help="processes to play games on (default : every core)")
+    parser.add_argument('--results', default='tournament.jsonl', help="the results file to write to and resume from")
+    options = parser.parse_args(arguments)
+
+    for specification in options.bots:
+        try:
+            parse_bot(specification)
+        except ValueError as error:
+            parser.error(str(error))
+    if len(set(options.bots)) < 2:
+        parser.error("A tournament needs at least 2 different bots.")
+
+    configurations = list(options.configurations or [])
+    if options.all_configurations:
+        configurations += all_configurations(options.all_configurations, options.max_players)
+    if not configurations:
+        configurations = [(3, 4, 5, 2)]
+
+    games = schedule(options.bots, configurations, options.games, options.seed)
+    results = run_tournament(games, options.results, options.workers)
+
+    # Only this tournament's games are counted, even if the results file holds games from other tournaments.
+    names = {game['name'] for game in games}
+    print()
+    print(format_tables([result for result in results if result['name'] in names]))
+
+
+# Running a tournament if this script is the file that's designated as "main".
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : A transposition table remembers the results of positions that a search has already looked at, so
+#               the same position reached through a different order of moves doesn't have to be searched again.
+#               The table has a fixed size that is chosen in megabytes and never grows.  Every bucket holds two
+#               entries: one that is only replaced by results from deeper (or newer) searches, and one that is
+#               always replaced.  The deep entries keep the most valuable results while the other entries keep
+#               the most recent ones.
+
+# Importing array so that the entries are stored as packed numbers instead of Python objects.
+from array import array
+
+
+# The kinds of scores an entry can hold.  An exact score is the real score of the position, a lower bound means the
+# real score is at least the stored score, and an upper bound means the real score is at most the stored score.
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# The move code stored in entries that don't have a best move.
+NO_MOVE = -1
+
+# The number of bytes one entry takes up: the key (8), the score (8), the move (8), the depth (2), the kind of
+# score (1), and the generation of the search that stored it (1).
+BYTES_PER_ENTRY = 28
+
+# The size of a table when no size is given.
+DEFAULT_MEGABYTES = 16
+
+
+class TranspositionTable:
+    """A fixed-size table of search results keyed by 64-bit position hashes."""
+
+    def __init__(self, megabytes=DEFAULT_MEGABYTES):
+        """Creates an empty table that takes up about the passed number of megabytes."""
+
+        # Working out how many buckets of two entries fit into the memory.  There is always at least one bucket.
+        self.__bucket_count = max(1, int(megabytes * 1024 * 1024) // (2 * BYTES_PER_ENTRY))
+        entry_count = self.__bucket_count * 2
+
+        # Every part of an entry has its own array.  Entry 2 * B is the deep entry of bucket B and entry 2 * B + 1
+        # is its always-replaced entry.  The arrays are filled with zeroes; a depth of -1 marks an empty entry.
+        self.__keys = array('Q', bytes(8 * entry_count))
+        self.__scores = array('q', bytes(8 * entry_count))
+        self.__moves = array('q', [NO_MOVE]) * entry_count
+        self.__depths = array('h', [-1]) * entry_count
+        self.__kinds = array('b', bytes(entry_count))
+        self.__generations = array('B', bytes(entry_count))
+
+        # The generation is increased for every new search so that old deep entries can be replaced.
+        self.__generation = 0
+
+        # Statistics for anyone tuning the table's size.
+        self.__probes = 0
+        self.__hits = 0
+
+    def get_entry_count(self):
+        """Gets the number of entries the table can hold."""
+        return self.__bucket_count * 2
+
+    def get_hit_rate(self):
+        """Gets the fraction of probes that found an entry."""
+        return self.__hits / self.__probes if self.__probes else 0.0
+
+    def new_search(self):
+        """Marks the start of a new search.  Entries stored by earlier searches can then be replaced by any result."""
+        self.__generation = (self.__generation + 1) % 256
+
+    def clear(self):
+        """Empties the table without changing its size."""
+        for index in range(len(self.__depths)):
+            self.__depths[index] = -1
+            self.__moves[index] = NO_MOVE
+
+    def probe(self, key):
+        """Returns a tuple of (depth, score, kind, move) for the position's entry, or None if there isn't one."""
+        self.__probes += 1
+        index = (key % self.__bucket_count) * 2
+        for entry in (index, index + 1):
+            if (self.__depths[entry] >= 0) and (self.__keys[entry] == key):
+                self.__hits += 1
+                return self.__depths[entry], self.__scores[entry], self.__kinds[entry], self.__moves[entry]
+        return None
+
+    def store(self, key, depth, score, kind, move=NO_MOVE):
+        """Stores the result of a search.  The deep entry is used when the position is already there, when it is
+        empty, when it was stored by an older search, or when the new result is at least as deep; otherwise the
+        result goes into the always-replaced entry."""
+        index = (key % self.__bucket_count) * 2
+        deep_depth = self.__depths[index]
+        if (deep_depth < 0) or (self.__keys[index] == key) or (depth >= deep_depth) or \
+                (self.__generations[index] != self.__generation):
+            entry = index
+        else:
+            entry = index + 1
+
+        # Keeping the best move that was already known when the new result doesn't have one.
+        if (move == NO_MOVE) and (self.__keys[entry] == key) and (self.__depths[entry] >= 0):
+            move = self.__moves[entry]
+
+        self.__keys[entry] = key
+        self.__depths[entry] = depth
+        self.__scores[entry] = score
+        self.__kinds[entry] = kind
+        self.__moves[entry] = move
+        self.__generations[entry] = self.__generation
@@ -0,0 +1,147 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : The index of every possible winning sequence on a board.  For a board length and a winning length,
+#               the sequences (rows, columns, and both diagonals) never change, so they are built once and shared
+#               by every game with the same lengths.  Sequences are stored as bitmasks that use the engine's bit
+#               layout (bit row * board_length + column), and every node knows which sequences pass through it.
+#               Win checks, threat counting, and evaluation are all built on top of this index.
+
+
+# The directions a winning sequence can run in, as (row step, column step): east, south, southeast, and southwest.
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+# The indexes are shared by every game that uses the same lengths.  The keys are (board_length, winning_length).
+winning_lines_cache = {}
+
+
+class WinningLines:
+    """Holds every winning sequence for one board length and winning length.  Sequences are numbered in the order
+    of DIRECTIONS and then by their starting node, read row by row."""
+
+    def __init__(self, board_length, winning_length):
+        """Builds the sequences and the index of which sequences pass through each node."""
+        self.__board_length = board_length
+        self.__winning_length = winning_length
+
+        # The sequences as bitmasks, the nodes that make up each sequence, and the direction of each sequence.
+        self.__lines = []
+        self.__line_nodes = []
+        self.__line_directions = []
+
+        # For each direction: the distance between neighbouring bits and the mask of nodes a sequence can start on.
+        self.__steps = []
+        self.__start_masks = []
+
+        # The shifts that find runs of marbles in each direction.  Every shift doubles the length of the runs that
+        # are kept (until the winning length is reached), so a winning length of X only needs about log2(X) shifts.
+        extensions = []
+        covered = 1
+        while covered < winning_length:
+            extensions.append(min(covered, winning_length - covered))
+            covered += extensions[-1]
+        self.__run_shifts = []
+
+        # Building the sequences direction by direction.  A sequence is the first sequence of its direction shifted
+        # up to its starting node, so the masks are made with one shift each instead of one loop over the nodes.
+        lines_of_node = [[] for index in range(board_length * board_length)]
+        for direction, (row_step, column_step) in enumerate(DIRECTIONS):
+            step = row_step * board_length + column_step
+            self.__steps.append(step)
+            self.__run_shifts.append(tuple(step * extension for extension in extensions))
+
+            # The nodes that a sequence in this direction can start on without running off of the board.
+            first_row = 0
+            last_row = board_length - 1 - row_step * (winning_length - 1)
+            first_column = max(0, -column_step * (winning_length - 1))
+            last_column = board_length - 1 - max(0, column_step * (winning_length - 1))
+
+            # The offsets of a sequence's nodes from its starting node, and the mask of a sequence starting at bit 0.
+            offsets = [step * position for position in range(winning_length)]
+            base_mask = 0
+            for offset in offsets:
+                base_mask |= 1 << offset
+
+            start_mask = 0
+            for row in range(first_row, last_row + 1):
+                for column in range(first_column, last_column + 1):
+                    start = row * board_length + column
+                    start_mask |= 1 << start
+                    nodes = tuple(start + offset for offset in offsets)
+                    for node in nodes:
+                        lines_of_node[node].append(len(self.__lines))
+                    self.__lines.append(base_mask << start)
+                    self.__line_nodes.append(nodes)
+                    self.__line_directions.append(direction)
+            self.__start_masks.append(start_mask)
+
+        # The reverse index: a tuple of sequence numbers and a tuple of sequence masks for every node.
+        self.__lines_of_node = [tuple(numbers) for numbers in lines_of_node]
+        self.__line_masks_of_node = [tuple(self.__lines[number] for number in numbers) for numbers in lines_of_node]
+
+    def get_board_length(self):
+        """Gets the board length the sequences were built for."""
+        return self.__board_length
+
+    def get_winning_length(self):
+        """Gets the length of every sequence."""
+        return self.__winning_length
+
+    def get_line_count(self):
+        """Gets the number of winning sequences on the board."""
+        return len(self.__lines)
+
+    def get_lines(self):
+        """Gets the list of every sequence's bitmask."""
+        return self.__lines
+
+    def get_line_nodes(self, line):
+        """Gets a tuple of the node indexes (row * board_length + column) that make up a sequence, in order."""
+        return self.__line_nodes[line]
+
+    def get_line_direction(self, line):
+        """Gets the index into DIRECTIONS of the direction a sequence runs in."""
+        return self.__line_directions[line]
+
+    def get_lines_of_node(self, node):
+        """Gets a tuple of the numbers of the sequences that pass through a node."""
+        return self.__lines_of_node[node]
+
+    def get_line_masks_of_node(self, node):
+        """Gets a tuple of the bitmasks of the sequences that pass through a node."""
+        return self.__line_masks_of_node[node]
+
+    def get_run_shifts(self, direction):
+        """Gets the shifts that turn a bitboard into the start nodes of its runs of winning length in a direction."""
+        return self.__run_shifts[direction]
+
+    def start_masks_touching(self, region):
+        """Returns a list holding, for each direction, the mask of the start nodes of sequences that pass through
+        any node of the region bitmask.  A sequence starting on node S covers S + step * K, so its start is found by
+        shifting the region down by step * K for every K in the winning length."""
+        touching = []
+        for step, start_mask in zip(self.__steps, self.__start_masks):
+            starts = 0
+            for position in range(self.__winning_length):
+                starts |= region >> (step * position)
+            touching.append(starts & start_mask)
+        return touching
+
+    def has_sequence(self, board):
+        """Returns true if the bitboard holds a winning sequence anywhere on the board."""
+        for direction in range(len(DIRECTIONS)):
+            runs = board
+            for shift in self.__run_shifts[direction]:
+                runs &= runs >> shift
+                if not runs:
+                    break
+            if runs & self.__start_masks[direction]:
+                return True
+        return False
+
+
+def get_winning_lines(board_length, winning_length):
+    """Returns the shared WinningLines for the passed lengths, building it the first time it's asked for."""
+    key = (board_length, winning_length)
+    if key not in winning_lines_cache:
+        winning_lines_cache[key] = WinningLines(board_length, winning_length)
+    return winning_lines_cache[key]
@@ -0,0 +1,132 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : The rules of Scalable Pentago written as plainly as possible, for the tests to check the engine
+#               against.  A board is a tuple of rows of player numbers (BLANK for an empty node), every move copies
+#               the board, and every win check looks at every node in every direction.  None of it is fast, and it
+#               shares no code with the engine, so the two only agree when the engine follows the rules.
+
+# The value of an empty node, the same as the engine's.
+BLANK = -1
+
+# The directions a winning sequence can run in from its first node: east, south, southeast, and southwest.
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+class NaiveRules:
+    """The rules of one configuration."""
+
+    def __init__(self, sub_board_length, sub_board_number, winning_length, player_count):
+        """Sets up the rules of a configuration.  The configuration isn't checked; the engine does that."""
+        self.sub_board_length = sub_board_length
+        self.sub_board_number = sub_board_number
+        self.winning_length = winning_length
+        self.player_count = player_count
+        self.per_side = int(round(sub_board_number ** 0.5))
+        self.board_length = sub_board_length * self.per_side
+
+    def empty_board(self):
+        """Returns a board with no marbles on it."""
+        return tuple((BLANK, ) * self.board_length for row in range(self.board_length))
+
+    def winners(self, board):
+        """Returns the sorted list of the players that have a winning sequence anywhere on the board."""
+        length = self.board_length
+        found = set()
+        for row in range(length):
+            for column in range(length):
+                player = board[row][column]
+                if (player == BLANK) or (player in found):
+                    continue
+                for row_step, column_step in DIRECTIONS:
+                    last_row = row + row_step * (self.winning_length - 1)
+                    last_column = column + column_step * (self.winning_length - 1)
+                    if not ((0 <= last_row < length) and (0 <= last_column < length)):
+                        continue
+                    if all(board[row + row_step * step][column + column_step * step] == player
+                           for step in range(self.winning_length)):
+                        found.add(player)
+                        break
+        return sorted(found)
+
+    def is_terminal(self, board):
+        """Returns true if someone has won or the board is full."""
+        return bool(self.winners(board)) or all(BLANK not in row for row in board)
+
+    def moves(self, board):
+        """Yields every legal move of a board that isn't over: every empty node with every sub-board and
+        direction."""
+        for row in range(self.board_length):
+            for column in range(self.board_length):
+                if board[row][column] == BLANK:
+                    for sub_board in range(1, self.sub_board_number + 1):
+                        for rotation in ('C', 'A'):
+                            yield row, column, sub_board, rotation
+
+    def apply(self, board, move, player):
+        """Returns the board after the player places a marble and rotates a sub-board.  Turning clockwise moves
+        the sub-board's node (row, column) to (column, length - 1 - row)."""
+        row, column, sub_board, rotation = move
+        cells = [list(board_row) for board_row in board]
+        cells[row][column] = player
+        length = self.sub_board_length
+        top = (sub_board - 1) // self.per_side * length
+        left = (sub_board - 1) % self.per_side * length
+        before = [[cells[top + local_row][left + local_column] for local_column in range(length)]
+                  for local_row in range(length)]
+        for local_row in range(length):
+            for local_column in range(length):
+                if rotation == 'C':
+                    new_row, new_column = local_column, length - 1 - local_row
+                else:
+                    new_row, new_column = length - 1 - local_column, local_row
+                cells[top + new_row][left + new_column] = before[local_row][local_column]
+        return tuple(tuple(board_row) for board_row in cells)
+
+    def play(self, moves):
+        """Returns the board after the moves are played from the empty board, with the players taking turns."""
+        board = self.empty_board()
+        for count, move in enumerate(moves):
+            board = self.apply(board, move, count % self.player_count)
+        return board
+
+    def perft(self, board, player, depth, distinct=False):
+        """RECURSIVE METHOD : Returns the number of positions depth moves below the board.  With distinct, moves
+        that lead to the same board as an earlier move of the same position are counted once."""
+
+        # BASE CASE : The bottom of the tree has been reached.
+        if depth == 0:
+            return 1
+
+        # BASE CASE : Nobody moves after the game is over.
+        if self.is_terminal(board):
+            return 0
+        children = [self.apply(board, move, player) for move in self.moves(board)]
+        if distinct:
+            children = list(dict.fromkeys(children))
+        next_player = (player + 1) % self.player_count
+        return sum(self.perft(child, next_player, depth - 1, distinct) for child in children)
+
+    def value(self, board, player, memo):
+        """RECURSIVE METHOD : Returns the value of a 2 player board for the player to move: 2 for a win, 1 for a draw,
+        and 0 for a loss.  Values are kept in memo by (board, player)."""
+        key = (board, player)
+        if key in memo:
+            return memo[key]
+        winners = self.winners(board)
+
+        # BASE CASE : The game is over.  Winning together is a draw.
+        if winners:
+            result = 1 if len(winners) == 2 else (2 if player in winners else 0)
+        elif all(BLANK not in row for row in board):
+            result = 1
+        else:
+            result = max(2 - self.value(self.apply(board, move, player), 1 - player, memo)
+                         for move in self.moves(board))
+        memo[key] = result
+        return result
+
+
+def engine_board(engine):
+    """Returns the engine's position as a naive board."""
+    length = engine.get_board_length()
+    return tuple(tuple(engine.get_cell(row, column) for column in range(length)) for row in range(length))
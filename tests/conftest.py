@@ -0,0 +1,12 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Shared set up for the tests.  The game's modules sit in the folder above this one instead of in a
+#               package, so that folder is put on the import path before any test imports them.
+#
+#               Example : python -m pytest -q
+
+# Importing os and sys to put the game's folder on the import path.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
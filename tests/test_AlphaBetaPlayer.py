@@ -0,0 +1,138 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks the alpha-beta player against plain searches: a search to a shallow depth has to give the same
+#               score as a minimax without pruning, a search to the end of the game has to give the same result as
+#               the naive rules, and a forced win has to be found and kept.
+#
+#               Example : python -m pytest -q tests/test_AlphaBetaPlayer.py
+
+# Importing random for the moves of the positions.
+import random
+
+# Importing pytest to run every check on every configuration.
+import pytest
+
+# Importing the modules being checked.
+import AlphaBetaPlayer
+import PentagoEngine
+
+# Importing the naive rules the results are checked against.
+from NaiveRules import NaiveRules, engine_board
+
+
+def random_positions(configuration, marbles, count, seed=0):
+    """Returns engines in count positions of random games that have the number of marbles and aren't over."""
+    generator = random.Random(seed)
+    engines = []
+    while len(engines) < count:
+        engine = PentagoEngine.PentagoEngine(*configuration)
+        while (engine.get_marble_count() < marbles) and not engine.is_terminal():
+            engine.apply(generator.choice(list(engine.legal_moves())))
+        if not engine.is_terminal():
+            engines.append(engine)
+    return engines
+
+
+def minimax(player, engine, depth, ply, root_player):
+    """RECURSIVE METHOD : Returns the score of a search without pruning, tables, or move ordering that scores
+    positions the same way as the player, from the point of view of root_player."""
+
+    # BASE CASE : The game is over or the search has gone deep enough.
+    if engine.is_terminal():
+        return player.terminal_score(engine.winners(), ply)
+    if depth == 0:
+        return player.evaluate(engine)
+    scores = []
+    for move in engine.legal_moves():
+        engine.apply(move)
+        scores.append(minimax(player, engine, depth - 1, ply + 1, root_player))
+        engine.undo()
+    return max(scores) if engine.get_current_player() == root_player else min(scores)
+
+
+def result_of(score):
+    """Returns a search's score as the naive rules' value: 2 for a win, 1 for a draw, and 0 for a loss."""
+    if score > AlphaBetaPlayer.WIN_SCORE // 2:
+        return 2
+    if score < -AlphaBetaPlayer.WIN_SCORE // 2:
+        return 0
+    return 1
+
+
+@pytest.mark.parametrize('configuration, depth', [((2, 4, 3, 2), 1), ((2, 4, 3, 2), 2), ((2, 4, 3, 3), 2),
+                                                  ((3, 4, 4, 2), 1)])
+def test_shallow_searches_match_a_plain_minimax(configuration, depth):
+    for engine in random_positions(configuration, 5, 3):
+        player = AlphaBetaPlayer.AlphaBetaPlayer(float('inf'), depth)
+        boards = engine.get_boards()
+        move = player.choose_move(engine)
+        assert engine.get_boards() == boards
+        assert engine.check_move(move) is None
+
+        # The deepening only stops early when the shallower search already proved a win or a loss.
+        searched = player.get_last_depth()
+        assert (searched == depth) or (result_of(player.get_last_score()) != 1)
+        root_player = engine.get_current_player()
+        assert player.get_last_score() == minimax(player, engine, searched, 0, root_player)
+
+        # The chosen move is one of the moves with the best score.
+        engine.apply(move)
+        assert minimax(player, engine, searched - 1, 1, root_player) == player.get_last_score()
+
+
+@pytest.mark.parametrize('marbles', [11, 12, 13])
+def test_searches_to_the_end_match_the_naive_rules(marbles):
+    rules = NaiveRules(2, 4, 3, 2)
+    memo = {}
+    for engine in random_positions((2, 4, 3, 2), marbles, 4, marbles):
+        player = AlphaBetaPlayer.AlphaBetaPlayer(float('inf'))
+        move = player.choose_move(engine)
+        value = rules.value(engine_board(engine), engine.get_current_player(), memo)
+        assert result_of(player.get_last_score()) == value
+        if value == 1:
+            assert player.get_last_score() == 0
+
+        # The chosen move keeps the value of the position.
+        engine.apply(move)
+        assert 2 - rules.value(engine_board(engine), engine.get_current_player(), memo) == value
+
+
+def wins_now(engine):
+    """Returns true if the player to move has a move that wins the game for them alone."""
+    mover = engine.get_current_player()
+    for move in engine.legal_moves():
+        engine.apply(move)
+        won = engine.winners() == [mover]
+        engine.undo()
+        if won:
+            return True
+    return False
+
+
+def test_forced_wins_are_found():
+    found = {1: 0, 3: 0}
+    for engine in random_positions((2, 4, 4, 2), 8, 20, 7):
+        mover = engine.get_current_player()
+
+        # A win on this move is found by a search of 1 turn, and a win after any reply by a search of 3.
+        plies = 1 if wins_now(engine) else 3
+        player = AlphaBetaPlayer.AlphaBetaPlayer(float('inf'), plies)
+        move = player.choose_move(engine)
+        if player.get_last_score() <= AlphaBetaPlayer.WIN_SCORE // 2:
+            assert plies == 3
+            continue
+        assert player.get_last_score() >= AlphaBetaPlayer.WIN_SCORE - plies
+        engine.apply(move)
+        if plies == 1:
+            assert engine.winners() == [mover]
+        else:
+
+            # Every reply loses the game: it doesn't win for the other player, and the mover wins straight after.
+            assert not engine.is_terminal()
+            for reply in engine.legal_moves():
+                engine.apply(reply)
+                assert mover in engine.winners() or wins_now(engine)
+                assert engine.winners() in ([], [mover])
+                engine.undo()
+        found[plies] += 1
+    assert found[1] and found[3]
@@ -0,0 +1,52 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks the batch engine against the bitboard engine: a batch of random games played on both has to
+#               end with the same boards and winners in every game, and moves with values out of range are refused.
+#
+#               Example : python -m pytest -q tests/test_BatchEngine.py
+
+# Importing NumPy for the batch engine's random generator.
+import numpy
+
+# Importing pytest to check the errors.
+import pytest
+
+# Importing the modules being checked.
+import BatchEngine
+import PentagoEngine
+
+# Importing the naive rules for the board of an engine.
+from NaiveRules import engine_board
+
+
+def test_batch_engine_matches_the_engine():
+    configuration = (3, 4, 4, 2)
+    game_count = 64
+    batch = BatchEngine.BatchEngine(game_count, *configuration)
+    generator = numpy.random.default_rng(0)
+    engines = [PentagoEngine.PentagoEngine(*configuration) for game in range(game_count)]
+    board_length = batch.get_board_length()
+    while not batch.all_finished():
+        nodes, sub_boards, rotations = batch.random_moves(generator)
+        for game, engine in enumerate(engines):
+            if not engine.is_terminal():
+                row, column = divmod(int(nodes[game]), board_length)
+                engine.apply((row, column, int(sub_boards[game]), PentagoEngine.ROTATIONS[rotations[game]]))
+        batch.apply(nodes, sub_boards, rotations)
+
+    cells = batch.get_cells()
+    winners = batch.get_winners()
+    for game, engine in enumerate(engines):
+        assert engine.is_terminal()
+        assert cells[game].tolist() == [list(row) for row in engine_board(engine)]
+        assert [player for player in range(configuration[3]) if winners[game][player]] == sorted(engine.winners())
+
+
+def test_batch_engine_rejects_values_out_of_range():
+    batch = BatchEngine.BatchEngine(2, 3, 4, 5, 2)
+    for nodes, sub_boards, rotations in [([0, 1], [0, 1], [0, 0]), ([0, 1], [1, 5], [0, 0]),
+                                         ([0, 1], [1, 1], [0, 2]), ([-1, 1], [1, 1], [0, 0]),
+                                         ([0, 36], [1, 1], [0, 0])]:
+        with pytest.raises(ValueError):
+            batch.apply(nodes, sub_boards, rotations)
+    assert batch.get_move_count() == 0
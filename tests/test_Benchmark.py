@@ -0,0 +1,69 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks the benchmarks' numbers rather than their speed: the summary of a set of samples, the flags a
+#               comparison gives when the samples of two runs overlap or don't, and a small run from the command line
+#               that is saved and compared against a baseline.
+#
+#               Example : python -m pytest -q tests/test_Benchmark.py
+
+# Importing contextlib and io to hide what the benchmarks print.
+import contextlib
+import io
+
+# Importing json to read and write the saved results.
+import json
+
+# Importing the module being checked.
+import Benchmark
+
+
+def results_of(*benchmarks):
+    """Returns a made up set of results holding a (name, fastest, median, p95) tuple for every benchmark."""
+    return {'results': [{'configuration': [2, 4, 3, 2], 'benchmark': name, 'fastest': fastest, 'median': median,
+                         'p95': p95} for name, fastest, median, p95 in benchmarks]}
+
+
+def test_samples_are_summarized():
+    summary = Benchmark.summarize([5.0, 1.0, 4.0, 2.0, 3.0])
+    assert summary == {'fastest': 1.0, 'median': 3.0, 'p95': 5.0, 'ops_per_second': 1 / 3.0, 'samples': 5}
+    summary = Benchmark.summarize([float(sample) for sample in range(1, 41)])
+    assert (summary['median'], summary['p95']) == (20.5, 38.0)
+
+
+def test_only_samples_that_no_longer_overlap_are_flagged():
+    baseline = results_of(('slower', 1.0, 1.1, 1.2), ('noisy', 1.0, 1.1, 1.2), ('faster', 1.0, 1.1, 1.2),
+                          ('same', 1.0, 1.1, 1.2), ('gone', 1.0, 1.1, 1.2))
+    results = results_of(('slower', 1.4, 1.5, 1.6), ('noisy', 1.3, 1.5, 2.0), ('faster', 0.5, 0.6, 0.8),
+                         ('same', 1.0, 1.2, 1.3), ('new', 1.0, 1.0, 1.0))
+    changes, regressions = Benchmark.compare(results, baseline, 0.10)
+    flags = {name: flag for configuration, name, old_median, new_median, change, flag in changes}
+    assert flags == {'slower': 'REGRESSION', 'noisy': '', 'faster': 'faster', 'same': ''}
+    assert regressions == [change for change in changes if change[1] == 'slower']
+    assert changes[0][2:5] == (1.1, 1.5, 1.5 / 1.1 - 1.0)
+
+    # A looser threshold lets the slower samples through.
+    assert not Benchmark.compare(results, baseline, 0.5)[1]
+
+
+def test_a_run_is_saved_and_compared_against_a_baseline(tmp_path):
+    output = str(tmp_path / 'results.json')
+    baseline = str(tmp_path / 'baseline.json')
+    arguments = ['--sub-board-lengths', '2', '--sub-board-numbers', '4', '--winning-lengths', '3', '--players', '2',
+                 '--no-large', '--benchmarks', 'apply_undo,is_board_full', '--samples', '3']
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert Benchmark.main(arguments + ['--output', output]) == 0
+    with open(output) as output_file:
+        results = json.load(output_file)
+    assert [(result['configuration'], result['benchmark'], result['samples']) for result in results['results']] == \
+        [([2, 4, 3, 2], 'apply_undo', 3), ([2, 4, 3, 2], 'is_board_full', 3)]
+
+    # A baseline that was far faster makes the run a regression.
+    for result in results['results']:
+        result.update({'fastest': result['fastest'] / 100, 'median': result['median'] / 100,
+                       'p95': result['p95'] / 100})
+    with open(baseline, 'w') as baseline_file:
+        json.dump(results, baseline_file)
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        assert Benchmark.main(arguments + ['--compare', baseline]) == 1
+    assert "2 of 2 benchmarks regressed" in printed.getvalue()
@@ -0,0 +1,112 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks that the shards written by DatasetExport read back, through the index and numpy.memmap, as
+#               the positions of the recorded games, in both encodings and both with and without the canonical form.
+#
+#               Example : python -m pytest -q tests/test_DatasetExport.py
+
+# Importing json to read the index.
+import json
+
+# Importing random for the moves of the recorded games.
+import random
+
+# Importing NumPy to unpack the packed positions.
+import numpy
+
+# Importing the modules being checked.
+import DatasetExport
+import GameRecord
+import PentagoEngine
+import Symmetry
+
+
+CONFIGURATION = (2, 4, 3, 2)
+
+# Few enough rows per shard that the games are split across several shards.
+SHARD_ROWS = 7
+
+
+def write_records(path, count):
+    """Writes random games to a record file and returns their engines."""
+    engines = []
+    with GameRecord.GameRecordWriter(path, CONFIGURATION) as writer:
+        for seed in range(count):
+            engine = PentagoEngine.PentagoEngine(*CONFIGURATION)
+            generator = random.Random(seed)
+            while not engine.is_terminal():
+                engine.apply(generator.choice(list(engine.legal_moves())))
+            writer.write_engine(engine)
+            engines.append(engine)
+    return engines
+
+
+def expected_rows(engines, canonical):
+    """Returns a list of (boards, side to move, outcome, move number) for every position of the games, in the order
+    they are exported."""
+    rows = []
+    for finished in engines:
+        engine = PentagoEngine.PentagoEngine(*CONFIGURATION)
+        for move in finished.get_history():
+            player = engine.get_current_player()
+            boards = Symmetry.canonical_form(engine)[0] if canonical else engine.get_boards()
+            rows.append((boards, 0 if canonical else player, DatasetExport.outcome_for(player, finished.winners()),
+                         engine.get_move_count()))
+            engine.apply(move)
+    return rows
+
+
+def read_rows(index_path, board_length):
+    """Returns every row of the shards listed in an index as (boards, side to move, outcome, move number)."""
+    rows = []
+    with open(index_path) as index_file:
+        encoding = json.load(index_file)['encoding']
+    for shard in DatasetExport.open_shards(index_path):
+        for row in shard:
+            boards = []
+            for plane in row['position']:
+                if encoding == 'packed':
+                    plane = numpy.unpackbits(plane, bitorder='little')[:board_length * board_length]
+                bits = plane.reshape(-1)
+                boards.append(sum(1 << node for node in numpy.flatnonzero(bits).tolist()))
+            rows.append((tuple(boards), int(row['side_to_move']), int(row['outcome']), int(row['move_number'])))
+    return rows
+
+
+def test_positions_as_played_read_back_from_every_encoding(tmp_path):
+    record_path = str(tmp_path / 'games.spgr')
+    engines = write_records(record_path, 5)
+    board_length = engines[0].get_board_length()
+    for encoding in DatasetExport.ENCODINGS:
+        prefix = str(tmp_path / encoding)
+        index = DatasetExport.export([record_path], prefix, encoding, deduplicate=False, canonical=False,
+                                     shard_rows=SHARD_ROWS, report=lambda line: None)
+        assert len(index['shards']) > 1
+        assert all(shard['rows'] <= SHARD_ROWS for shard in index['shards'])
+        assert read_rows(prefix + '.json', board_length) == expected_rows(engines, False)
+
+
+def test_canonical_positions_are_stored_once(tmp_path):
+    record_path = str(tmp_path / 'games.spgr')
+    engines = write_records(record_path, 5)
+    prefix = str(tmp_path / 'canonical')
+    index = DatasetExport.export([record_path], prefix, 'onehot', shard_rows=SHARD_ROWS, report=lambda line: None)
+    rows = read_rows(prefix + '.json', engines[0].get_board_length())
+
+    # The rows are the canonical positions in the order they were first seen, with the player to move as player 0.
+    first_seen = {}
+    for row in expected_rows(engines, True):
+        first_seen.setdefault(row[0], row)
+    assert rows == list(first_seen.values())
+    assert index['rows'] + index['duplicates_skipped'] == sum(len(engine.get_history()) for engine in engines)
+
+
+def test_every_file_reports_its_own_counts(tmp_path):
+    paths = [str(tmp_path / 'first.spgr'), str(tmp_path / 'second.spgr')]
+    write_records(paths[0], 3)
+    write_records(paths[1], 2)
+    reports = []
+    index = DatasetExport.export(paths, str(tmp_path / 'both'), 'packed', deduplicate=False, canonical=False,
+                                 report=reports.append)
+    assert [report.split(' : ')[1].split(',')[0] for report in reports] == ['3 games', '2 games']
+    assert sum(int(report.split(', ')[1].split()[0]) for report in reports) == index['rows']
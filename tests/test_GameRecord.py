@@ -0,0 +1,138 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks that game record files give back every game that was written to them, after being appended
+#               to, after a crash cut the last game off, and while a writer is still appending to it.
+#
+#               Example : python -m pytest -q tests/test_GameRecord.py
+
+# Importing os to cut record files short and remove their indexes.
+import os
+
+# Importing random for the moves of the recorded games.
+import random
+
+# Importing struct to write a header and read the index's raw bytes.
+import struct
+
+# Importing pytest for the checks that have to raise.
+import pytest
+
+# Importing the modules being checked.
+import GameRecord
+import PentagoEngine
+
+
+CONFIGURATION = (3, 4, 5, 2)
+
+
+def random_games(count, configuration=CONFIGURATION):
+    """Returns a list of engines that random games were played to the end on."""
+    engines = []
+    for seed in range(count):
+        engine = PentagoEngine.PentagoEngine(*configuration)
+        generator = random.Random(seed)
+        while not engine.is_terminal():
+            engine.apply(generator.choice(list(engine.legal_moves())))
+        engines.append(engine)
+    return engines
+
+
+def recorded(engines):
+    """Returns the (moves, winners) tuples a reader should give back for the engines' games."""
+    return [(engine.get_history(), engine.winners()) for engine in engines]
+
+
+def test_games_read_back_in_order_and_by_index(tmp_path):
+    path = str(tmp_path / 'games.spgr')
+    engines = random_games(6)
+    with GameRecord.GameRecordWriter(path, CONFIGURATION) as writer:
+        for engine in engines[:4]:
+            writer.write_engine(engine)
+    with GameRecord.GameRecordWriter(path, CONFIGURATION) as writer:
+        for engine in engines[4:]:
+            writer.write_game(engine.get_history(), engine.winners())
+
+    with GameRecord.GameRecordReader(path) as reader:
+        assert reader.get_configuration() == CONFIGURATION
+        assert len(reader) == 6
+        assert list(reader) == recorded(engines)
+        for index in (5, 0, 3):
+            assert reader.read_game(index) == recorded(engines)[index]
+        assert reader.replay(2).get_boards() == engines[2].get_boards()
+        with pytest.raises(IndexError):
+            reader.read_game(6)
+
+
+def test_index_offsets_are_little_endian(tmp_path):
+    path = str(tmp_path / 'games.spgr')
+    with GameRecord.GameRecordWriter(path, CONFIGURATION) as writer:
+        for engine in random_games(3):
+            writer.write_engine(engine)
+    with open(path + GameRecord.INDEX_SUFFIX, 'rb') as index_file:
+        offsets = struct.unpack('<3Q', index_file.read())
+    assert offsets == tuple(GameRecord.load_offsets(path)[0])
+
+
+def test_a_game_cut_off_by_a_crash_is_dropped(tmp_path):
+    path = str(tmp_path / 'games.spgr')
+    engines = random_games(4)
+    with GameRecord.GameRecordWriter(path, CONFIGURATION) as writer:
+        for engine in engines[:3]:
+            writer.write_engine(engine)
+    with open(path, 'r+b') as record_file:
+        record_file.truncate(os.path.getsize(path) - 3)
+    os.remove(path + GameRecord.INDEX_SUFFIX)
+
+    with GameRecord.GameRecordReader(path) as reader:
+        assert list(reader) == recorded(engines[:2])
+
+    # New games start right after the last whole one.
+    with GameRecord.GameRecordWriter(path, CONFIGURATION) as writer:
+        writer.write_engine(engines[3])
+    with GameRecord.GameRecordReader(path) as reader:
+        assert list(reader) == recorded(engines[:2] + engines[3:])
+
+
+def test_readers_never_write_the_index(tmp_path):
+    path = str(tmp_path / 'games.spgr')
+    engines = random_games(4)
+    with GameRecord.GameRecordWriter(path, CONFIGURATION) as writer:
+        for engine in engines[:2]:
+            writer.write_engine(engine)
+    os.remove(path + GameRecord.INDEX_SUFFIX)
+    with GameRecord.GameRecordReader(path) as reader:
+        assert reader.read_game(1) == recorded(engines)[1]
+    assert not os.path.exists(path + GameRecord.INDEX_SUFFIX)
+
+    # A reader opened while a writer is appending sees every game written so far, and the writer's index stays whole.
+    with GameRecord.GameRecordWriter(path, CONFIGURATION) as writer:
+        writer.write_engine(engines[2])
+        with GameRecord.GameRecordReader(path) as reader:
+            assert len(reader) == 3
+            assert reader.read_game(2) == recorded(engines)[2]
+        writer.write_engine(engines[3])
+    with open(path + GameRecord.INDEX_SUFFIX, 'rb') as index_file:
+        offsets = struct.unpack('<4Q', index_file.read())
+    assert offsets == tuple(GameRecord.load_offsets(path)[0])
+    with GameRecord.GameRecordReader(path) as reader:
+        assert list(reader) == recorded(engines)
+
+
+def test_large_configurations_fit_in_the_header(tmp_path):
+    path = tmp_path / 'large.spgr'
+    path.write_bytes(GameRecord.MAGIC + struct.pack(GameRecord.HEADER_FORMAT, GameRecord.VERSION, 2, 65536, 5, 2))
+    with open(path, 'rb') as record_file:
+        assert GameRecord.read_header(record_file) == (2, 65536, 5, 2)
+
+
+def test_mismatched_and_foreign_files_are_refused(tmp_path):
+    path = str(tmp_path / 'games.spgr')
+    with GameRecord.GameRecordWriter(path, CONFIGURATION) as writer:
+        writer.write_engine(random_games(1)[0])
+    with pytest.raises(ValueError):
+        GameRecord.GameRecordWriter(path, (2, 4, 3, 2))
+
+    foreign = tmp_path / 'foreign.spgr'
+    foreign.write_bytes(b'not a game record')
+    with pytest.raises(ValueError):
+        GameRecord.GameRecordReader(str(foreign))
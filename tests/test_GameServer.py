@@ -0,0 +1,159 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks the game server's protocol by talking to a real server over a local TCP socket: making a
+#               game, taking seats, sending moves in and out of turn, the errors for bad messages, and a game of
+#               bots played to its end.
+#
+#               Example : python -m pytest -q tests/test_GameServer.py
+
+# Importing asyncio to run the server and its clients.
+import asyncio
+
+# Importing json to read the server's messages.
+import json
+
+# Importing the modules being checked.
+import GameServer
+import PentagoEngine
+
+
+# How long a client waits for a message before the test fails.
+TIMEOUT = 30.0
+
+
+class Client:
+    """One connection to the server that sends messages and reads the replies one line at a time."""
+
+    def __init__(self, reader, writer):
+        """Wraps the streams of a connection."""
+        self.reader = reader
+        self.writer = writer
+
+    def send(self, message):
+        """Sends a message, or a line of raw bytes."""
+        self.writer.write(message if isinstance(message, bytes) else GameServer.encode_message(message))
+
+    async def receive(self):
+        """Returns the next message from the server."""
+        return json.loads(await asyncio.wait_for(self.reader.readline(), TIMEOUT))
+
+    async def receive_until(self, check):
+        """Returns the first message from the server that passes the check, skipping the ones before it."""
+        while True:
+            message = await self.receive()
+            if check(message):
+                return message
+
+    def close(self):
+        """Closes the connection."""
+        self.writer.close()
+
+
+def run_with_server(scenario, workers=1):
+    """Runs a coroutine function with a server listening on a free local port and a function that connects a new
+    Client to it."""
+    async def main():
+        server = GameServer.GameServer(workers)
+        listener = await asyncio.start_server(server.handle_connection, '127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+
+        async def connect():
+            return Client(*await asyncio.open_connection('127.0.0.1', port))
+        try:
+            await scenario(server, connect)
+        finally:
+            listener.close()
+            await listener.wait_closed()
+            server.close()
+    asyncio.run(main())
+
+
+def test_two_people_play_a_game():
+    async def scenario(server, connect):
+        first = await connect()
+        second = await connect()
+
+        first.send({'type': 'create', 'config': [2, 4, 3, 2]})
+        created = await first.receive()
+        assert created['type'] == 'created'
+        game = created['game']
+        state = await first.receive()
+        assert (state['type'], state['started'], state['open_seats']) == ('state', False, [0, 1])
+
+        first.send({'type': 'join', 'game': game, 'seat': 0})
+        assert await first.receive() == {'type': 'joined', 'game': game, 'seat': 0}
+        second.send({'type': 'join', 'game': game})
+        assert await second.receive() == {'type': 'joined', 'game': game, 'seat': 1}
+        state = await first.receive_until(lambda message: message['type'] == 'state' and message['started'])
+        assert state['to_move'] == 0
+
+        # A move out of turn is refused, and its id comes back with the error.
+        second.send({'type': 'move', 'game': game, 'move': [0, 'A', 1, 'c'], 'id': 5})
+        error = await second.receive_until(lambda message: message['type'] == 'error')
+        assert error['id'] == 5
+
+        # A move in turn is applied and sent to both players, with the column given as a label.
+        first.send({'type': 'move', 'game': game, 'move': [0, 'B', 2, 'a']})
+        engine = PentagoEngine.PentagoEngine(2, 4, 3, 2)
+        engine.apply((0, 1, 2, 'A'))
+        for client in (first, second):
+            state = await client.receive_until(lambda message: message['type'] == 'state' and message['moves'] == 1)
+            assert state['last_move'] == [0, 1, 2, 'A']
+            assert state['board'] == [[engine.get_cell(row, column) for column in range(4)] for row in range(4)]
+            assert state['to_move'] == 1
+
+        # An illegal move gets the engine's reason.
+        second.send({'type': 'move', 'game': game, 'move': [0, 1, 5, 'C']})
+        error = await second.receive_until(lambda message: message['type'] == 'error')
+        assert error['message'] == engine.check_move((0, 1, 5, 'C'))
+
+        first.send({'type': 'list', 'id': 'games'})
+        games = await first.receive_until(lambda message: message['type'] == 'games')
+        assert games['id'] == 'games'
+        assert games['games'] == [{'game': game, 'config': [2, 4, 3, 2], 'moves': 1, 'open_seats': [],
+                                   'over': False}]
+        first.send({'type': 'stats', 'game': game})
+        stats = await first.receive_until(lambda message: message['type'] == 'stats')
+        assert stats['latency']['human']['count'] == 1
+
+        # Leaving opens the seat back up for the players still in the game.
+        first.send({'type': 'leave', 'game': game})
+        assert await first.receive_until(lambda message: message['type'] == 'left') == {'type': 'left', 'game': game}
+        state = await second.receive_until(lambda message: message['type'] == 'state' and message['open_seats'])
+        assert state['open_seats'] == [0]
+        first.close()
+        second.close()
+    run_with_server(scenario)
+
+
+def test_bad_messages_get_errors():
+    async def scenario(server, connect):
+        client = await connect()
+        for line in [b'not json\n', b'[1, 2]\n', b'{"type": "dance"}\n', b'{"type": "join", "game": 99}\n',
+                     b'{"type": "create", "config": [2, 4, 3]}\n', b'{"type": "create", "config": [2, 5, 3, 2]}\n',
+                     b'{"type": "create", "config": [2, 4, 3, 2], "bots": {"0": "nobody"}}\n']:
+            client.send(line)
+            assert (await client.receive())['type'] == 'error'
+        assert not server.get_games()
+        client.close()
+    run_with_server(scenario)
+
+
+def test_bots_play_a_game_to_its_end():
+    async def scenario(server, connect):
+        watcher = await connect()
+        watcher.send({'type': 'create', 'config': [2, 4, 3, 2], 'bots': {'0': 'random', '1': 'random'}})
+        game = (await watcher.receive())['game']
+        state = await watcher.receive_until(lambda message: message['type'] == 'state' and message['over'])
+        assert state['aborted'] is None
+
+        # Replaying the game's moves gives the same end.
+        engine = PentagoEngine.PentagoEngine(2, 4, 3, 2)
+        history = server.get_games()[game].engine.get_history()
+        for move in history:
+            engine.apply(move)
+        assert state['moves'] == len(history)
+        assert state['winners'] == engine.winners()
+        assert engine.is_terminal()
+        watcher.close()
+    run_with_server(scenario)
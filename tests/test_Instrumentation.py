@@ -0,0 +1,150 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks the instrumentation: wrapped methods are counted on the one object they were attached to and
+#               put back by detach, recursion is counted by its deepest call, turns get the calls made during them,
+#               search nodes come from the computer players, and a whole console game can be played instrumented.
+#
+#               Example : python -m pytest -q tests/test_Instrumentation.py
+
+# Importing contextlib and io to hide what the console game prints.
+import contextlib
+import io
+
+# Importing random for the moves of the games.
+import random
+
+# Importing sys to answer the console game's questions from a string.
+import sys
+
+# Importing the modules being checked.
+import AlphaBetaPlayer
+import Instrumentation
+import MCTSPlayer
+import PentagoEngine
+import ScalablePentago
+
+
+class Countdown:
+    """An object with a recursive method, to see how deep the wrapper follows it."""
+
+    def count_down(self, number):
+        """RECURSIVE METHOD : Returns 0 after calling itself number times."""
+
+        # BASE CASE : Counting has reached 0.
+        if not number:
+            return 0
+        return self.count_down(number - 1)
+
+
+def random_game(configuration, seed):
+    """Returns the moves of a random game played to its end."""
+    engine = PentagoEngine.PentagoEngine(*configuration)
+    generator = random.Random(seed)
+    while not engine.is_terminal():
+        engine.apply(generator.choice(list(engine.legal_moves())))
+    return engine.get_history()
+
+
+def test_only_the_attached_object_is_counted_until_detached():
+    engine = PentagoEngine.PentagoEngine(2, 4, 3, 2)
+    other = PentagoEngine.PentagoEngine(2, 4, 3, 2)
+    instrumentation = Instrumentation.Instrumentation()
+    instrumentation.attach(engine, Instrumentation.ENGINE_METHODS + ('not_a_method',), "engine")
+    moves = random_game((2, 4, 3, 2), 0)
+    for move in moves:
+        engine.apply(move)
+        other.apply(move)
+    engine.undo()
+    counts = instrumentation.snapshot()
+    assert counts['engine.apply'][0] == len(moves)
+    assert counts['engine.undo'][0] == 1
+    assert counts['engine.rotate'][0] == len(moves) + 1
+    assert counts['engine.has_sequence_touching'][0] > 0
+    assert counts['search.nodes'] == (0, 0.0, 0)
+    assert 'engine.not_a_method' not in counts
+
+    # Detaching puts the engine's own methods back, so nothing more is counted.
+    instrumentation.detach()
+    assert 'apply' not in vars(engine)
+    engine.apply(moves[-1])
+    assert instrumentation.snapshot()['engine.apply'][0] == len(moves)
+    assert engine.get_boards() == other.get_boards()
+
+
+def test_recursion_is_counted_by_its_deepest_call():
+    countdown = Countdown()
+    instrumentation = Instrumentation.Instrumentation()
+    instrumentation.attach(countdown, ['count_down'], "countdown")
+    countdown.count_down(6)
+    countdown.count_down(2)
+    calls, seconds, max_depth = instrumentation.snapshot()['countdown.count_down']
+    assert (calls, max_depth) == (7 + 3, 7)
+    assert seconds >= 0.0
+    assert "deepest 7" in Instrumentation.format_summary(instrumentation.game_summary())
+
+
+def test_turns_get_the_calls_made_during_them():
+    engine = PentagoEngine.PentagoEngine(2, 4, 3, 2)
+    instrumentation = Instrumentation.Instrumentation()
+    instrumentation.attach(engine, Instrumentation.ENGINE_METHODS, "engine")
+    alpha_beta = AlphaBetaPlayer.AlphaBetaPlayer(float('inf'), 1)
+    mcts = MCTSPlayer.MCTSPlayer(float('inf'), seed=1, max_visits=30)
+    instrumentation.attach_search_counter(alpha_beta, "alphabeta")
+    instrumentation.attach_search_counter(mcts, "mcts")
+
+    instrumentation.begin_turn("First")
+    engine.apply(alpha_beta.choose_move(engine))
+    first = instrumentation.end_turn()
+    instrumentation.begin_turn("Second")
+    engine.apply(mcts.choose_move(engine))
+    second = instrumentation.end_turn()
+
+    assert first['label'] == "First"
+    assert first['counts']['search.nodes'][0] == alpha_beta.get_last_nodes() > 0
+    assert first['counts']['alphabeta.choose_move'][0] == 1
+    assert first['counts']['mcts.choose_move'][0] == 0
+    assert second['counts']['search.nodes'][0] == mcts.get_last_visits() == 30
+    assert second['counts']['mcts.choose_move'][0] == 1
+    for turn in (first, second):
+        assert turn['counts']['engine.apply'][0] >= 1
+        assert turn['seconds'] >= turn['counts']['engine.apply'][1]
+    assert instrumentation.get_turns() == [first, second]
+
+    # The game's counts add up every turn's.
+    game = instrumentation.game_summary()
+    assert game['label'] == "Game (2 turns)"
+    for label, (calls, seconds, max_depth) in game['counts'].items():
+        assert calls == first['counts'][label][0] + second['counts'][label][0]
+
+    # Labels without calls are left out of the printed summary.
+    text = Instrumentation.format_summary(second)
+    assert text.startswith("Second : ")
+    assert "mcts.choose_move" in text
+    assert "alphabeta.choose_move" not in text
+
+
+def test_a_console_game_reports_every_turn(monkeypatch):
+    moves = random_game((2, 4, 3, 2), 1)
+    answers = "2\n1\n3\n2\n\n" + "".join("%d\n%s\n%d\n%s\n" % (row, chr(ord('A') + column), sub_board, rotation.lower())
+                                         for row, column, sub_board, rotation in moves)
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(answers))
+    reports = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        console = ScalablePentago.ScalablePentago()
+        instrumentation = Instrumentation.Instrumentation()
+        instrumentation.attach_game(console, reports.append)
+        console.gameplay_start()
+
+    assert console.get_engine().get_history() == moves
+    assert len(reports) == len(instrumentation.get_turns()) == len(moves)
+    assert reports[0].startswith("Turn 1 (player 0) : ")
+    assert reports[1].startswith("Turn 2 (player 1) : ")
+    for turn in instrumentation.get_turns():
+        assert turn['counts']['engine.apply'][0] == 1
+        assert turn['counts']['console.obtain_row_and_column'][0] == 1
+        assert turn['counts']['console.print_board'][0] == 1
+    assert instrumentation.game_summary()['counts']['engine.apply'][0] == len(moves)
+
+    instrumentation.detach()
+    assert 'take_turn' not in vars(console)
+    assert 'apply' not in vars(console.get_engine())
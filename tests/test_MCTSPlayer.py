@@ -0,0 +1,118 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks the Monte Carlo tree search player: a search with a seed and a visit limit is repeatable and
+#               leaves the engine where it was, the tree of the last search is picked back up after the moves that
+#               were played, several processes add up their visits, and a move that wins straight away is taken.
+#
+#               Example : python -m pytest -q tests/test_MCTSPlayer.py
+
+# Importing random for the moves of the positions.
+import random
+
+# Importing pytest to check the errors.
+import pytest
+
+# Importing the modules being checked.
+import MCTSPlayer
+import PentagoEngine
+
+
+def random_position(configuration, marbles, generator):
+    """Returns an engine in a position of a random game with the number of marbles that isn't over."""
+    while True:
+        engine = PentagoEngine.PentagoEngine(*configuration)
+        while (engine.get_marble_count() < marbles) and not engine.is_terminal():
+            engine.apply(generator.choice(list(engine.legal_moves())))
+        if not engine.is_terminal():
+            return engine
+
+
+def winning_moves(engine):
+    """Returns the moves that win the game straight away for the player to move alone."""
+    mover = engine.get_current_player()
+    moves = []
+    for move in engine.legal_moves():
+        engine.apply(move)
+        if engine.winners() == [mover]:
+            moves.append(move)
+        engine.undo()
+    return moves
+
+
+def test_searches_are_repeatable_and_leave_the_engine_alone():
+    engine = random_position((3, 4, 5, 2), 6, random.Random(0))
+    boards = engine.get_boards()
+    history = engine.get_history()
+    moves = []
+    for attempt in range(2):
+        player = MCTSPlayer.MCTSPlayer(float('inf'), seed=5, max_visits=200)
+        moves.append(player.choose_move(engine))
+        assert (engine.get_boards(), engine.get_history()) == (boards, history)
+        assert player.get_last_visits() == 200
+        assert player.get_last_reused() == 0
+    assert engine.check_move(moves[0]) is None
+    assert moves[0] == moves[1]
+
+
+def test_the_last_tree_is_reused():
+    engine = PentagoEngine.PentagoEngine(2, 4, 3, 2)
+    player = MCTSPlayer.MCTSPlayer(float('inf'), seed=2, max_visits=300)
+    move = player.choose_move(engine)
+
+    # The same position starts with every visit of the last search, and the chosen move with the visits under it.
+    player.choose_move(engine)
+    assert player.get_last_reused() == 300
+    engine.apply(move)
+    player.choose_move(engine)
+    assert 0 < player.get_last_reused() < 600
+
+    # A game that didn't come from the last search's root starts from nothing.
+    other = PentagoEngine.PentagoEngine(2, 4, 3, 2)
+    other.apply(next(other_move for other_move in other.legal_moves() if other_move != move))
+    player.choose_move(other)
+    assert player.get_last_reused() == 0
+
+
+def test_worker_processes_add_their_visits():
+    engine = PentagoEngine.PentagoEngine(2, 4, 3, 2)
+    player = MCTSPlayer.MCTSPlayer(float('inf'), workers=2, seed=3, max_visits=50)
+    try:
+        move = player.choose_move(engine)
+        assert player.get_last_visits() == 100
+        assert engine.check_move(move) is None
+    finally:
+        player.close()
+
+
+def test_wins_on_the_spot_are_taken():
+    generator = random.Random(3)
+    found = 0
+    while found < 6:
+        engine = random_position((2, 4, 4, 2), 8, generator)
+        wins = winning_moves(engine)
+        if not wins:
+            continue
+        player = MCTSPlayer.MCTSPlayer(float('inf'), seed=found, max_visits=1500)
+        assert player.choose_move(engine) in wins
+        found += 1
+
+
+def test_finished_games_are_refused():
+    engine = PentagoEngine.PentagoEngine(2, 4, 3, 2)
+    generator = random.Random(4)
+    while not engine.is_terminal():
+        engine.apply(generator.choice(list(engine.legal_moves())))
+    with pytest.raises(ValueError):
+        MCTSPlayer.MCTSPlayer(float('inf'), max_visits=10).choose_move(engine)
+
+
+def test_rollouts_split_one_reward_and_take_their_moves_back():
+    generator = random.Random(6)
+    for configuration in [(2, 4, 3, 2), (2, 16, 4, 3)]:
+        engine = random_position(configuration, 3, generator)
+        boards = engine.get_boards()
+        for rollout in range(20):
+            rewards = MCTSPlayer.rollout(engine, generator, MCTSPlayer.ROLLOUT_BIAS)
+            assert len(rewards) == configuration[3]
+            assert sum(rewards) == pytest.approx(1.0)
+            assert engine.get_boards() == boards
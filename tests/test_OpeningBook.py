@@ -0,0 +1,93 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks that an opening book gives back every entry it was written with, and that looking a position
+#               up gives the book's move turned to fit the position, whichever rotated or mirrored copy is played.
+#
+#               Example : python -m pytest -q tests/test_OpeningBook.py
+
+# Importing sys to pretend to be a big-endian machine.
+import sys
+
+# Importing pytest for the checks that have to raise.
+import pytest
+
+# Importing the modules being checked.
+import AlphaBetaPlayer
+import OpeningBook
+import PentagoEngine
+import Symmetry
+
+
+CONFIGURATION = (2, 4, 3, 2)
+
+
+def build_book(path):
+    """Builds a small book at path and returns its entries and the histories of the positions in it."""
+    player = AlphaBetaPlayer.AlphaBetaPlayer(float('inf'), 1)
+    entries = OpeningBook.build_entries(CONFIGURATION, {}, plies=3, games=4, player=player, exploration=0.5,
+                                        report=lambda line: None)
+    OpeningBook.write_book(path, CONFIGURATION, entries)
+    return entries, player
+
+
+def test_entries_read_back(tmp_path):
+    path = str(tmp_path / 'book.spob')
+    entries, player = build_book(path)
+    assert OpeningBook.read_entries(path) == (entries, CONFIGURATION)
+    with OpeningBook.OpeningBook(path) as book:
+        assert len(book) == len(entries)
+        assert [key for key, code, score, depth in book.entries()] == sorted(entries)
+        for key, entry in entries.items():
+            assert book.probe(key) == entry
+        assert book.probe(max(entries) + 1) is None
+
+
+def test_lookups_fit_every_symmetric_copy(tmp_path):
+    path = str(tmp_path / 'book.spob')
+    entries, player = build_book(path)
+
+    # The first game that built the book follows the book, so every position of its line is in the book.
+    engine = PentagoEngine.PentagoEngine(*CONFIGURATION)
+    main_line = []
+    for ply in range(3):
+        main_line.append(OpeningBook.add_position(entries, engine, player))
+        engine.apply(main_line[-1])
+    board_symmetry = Symmetry.get_board_symmetry(engine.get_board_length(), engine.get_sub_board_length())
+
+    # Playing every symmetric copy of the line.  The book's move has to lead to a copy of the position the line's
+    # own move leads to; a symmetric position can have several moves that do.
+    with OpeningBook.OpeningBook(path) as book:
+        for symmetry in range(Symmetry.SYMMETRY_COUNT):
+            engine = PentagoEngine.PentagoEngine(*CONFIGURATION)
+            for move in main_line:
+                looked_up = book.lookup(engine)
+                assert looked_up is not None
+                engine.apply(looked_up[0])
+                reached = Symmetry.canonical_hash(engine)[0]
+                engine.undo()
+                engine.apply(board_symmetry.transform_move(move, symmetry))
+                assert Symmetry.canonical_hash(engine)[0] == reached
+
+
+def test_damaged_books_and_oversized_configurations_are_refused(tmp_path):
+    path = tmp_path / 'book.spob'
+    build_book(str(path))
+    data = path.read_bytes()
+    path.write_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        OpeningBook.OpeningBook(str(path))
+    path.write_bytes(b'SPGR' + data[4:])
+    with pytest.raises(ValueError):
+        OpeningBook.OpeningBook(str(path))
+    with pytest.raises(ValueError):
+        OpeningBook.write_book(str(tmp_path / 'large.spob'), (2, 65536, 5, 2), {})
+
+
+def test_big_endian_machines_are_refused(tmp_path, monkeypatch):
+    path = str(tmp_path / 'book.spob')
+    build_book(path)
+    monkeypatch.setattr(sys, 'byteorder', 'big')
+    with pytest.raises(ValueError):
+        OpeningBook.OpeningBook(path)
+    with pytest.raises(ValueError):
+        OpeningBook.write_book(path, CONFIGURATION, {})
@@ -0,0 +1,92 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks the bitboard engine against the naive rules in NaiveRules.py.  Random games are played on
+#               several board shapes and player counts, and after every move the engine's board, winners, and moves
+#               have to match what the naive rules work out.
+#
+#               Example : python -m pytest -q tests/test_PentagoEngine.py
+
+# Importing random for the moves of the random games.
+import random
+
+# Importing pytest to run every check on every configuration.
+import pytest
+
+# Importing the modules being checked.
+import PentagoEngine
+
+# Importing the naive rules the engine is checked against.
+from NaiveRules import NaiveRules, engine_board
+
+
+# Configurations with different sub-board lengths, sub-board counts, winning lengths, and player counts.
+CONFIGURATIONS = [(2, 4, 3, 2), (3, 4, 5, 2), (3, 4, 4, 3), (2, 16, 4, 3), (4, 4, 4, 4)]
+
+# How many random games are played on every configuration.
+GAMES = 4
+
+
+def random_game(configuration, seed):
+    """Returns the moves of a random game played on the engine to its end."""
+    engine = PentagoEngine.PentagoEngine(*configuration)
+    generator = random.Random(seed)
+    while not engine.is_terminal():
+        engine.apply(generator.choice(list(engine.legal_moves())))
+    return engine.get_history()
+
+
+@pytest.mark.parametrize('configuration', CONFIGURATIONS)
+def test_random_games_follow_the_naive_rules(configuration):
+    rules = NaiveRules(*configuration)
+    for seed in range(GAMES):
+        engine = PentagoEngine.PentagoEngine(*configuration)
+        board = rules.empty_board()
+        for move in random_game(configuration, seed):
+            assert engine.check_move(move) is None
+            board = rules.apply(board, move, engine.get_current_player())
+            engine.apply(move)
+            assert engine_board(engine) == board
+            assert sorted(engine.winners()) == rules.winners(board)
+            assert engine.is_terminal() == rules.is_terminal(board)
+            assert engine.get_marble_count() == sum(cell != PentagoEngine.BLANK for row in board for cell in row)
+        assert engine.is_terminal()
+
+
+@pytest.mark.parametrize('configuration', CONFIGURATIONS)
+def test_moves_match_the_naive_rules(configuration):
+    rules = NaiveRules(*configuration)
+    moves = random_game(configuration, 0)
+    engine = PentagoEngine.PentagoEngine(*configuration)
+    for move in moves[:-1]:
+        engine.apply(move)
+        board = engine_board(engine)
+        player = engine.get_current_player()
+        assert set(engine.legal_moves()) == set(rules.moves(board))
+
+        # Every distinct move leads to a different position, and together they reach every position a move can.
+        distinct = [rules.apply(board, move, player) for move in engine.distinct_moves()]
+        assert len(distinct) == len(set(distinct))
+        assert set(distinct) == set(rules.apply(board, move, player) for move in rules.moves(board))
+
+
+@pytest.mark.parametrize('configuration', CONFIGURATIONS)
+def test_undo_restores_every_position(configuration):
+    engine = PentagoEngine.PentagoEngine(*configuration)
+    positions = []
+    for move in random_game(configuration, 1):
+        positions.append((engine.get_boards(), engine.get_hash(), engine.get_current_player()))
+        engine.apply(move)
+    while positions:
+        engine.undo()
+        assert (engine.get_boards(), engine.get_hash(), engine.get_current_player()) == positions.pop()
+    assert engine.get_marble_count() == 0
+
+
+def test_illegal_moves_are_explained():
+    engine = PentagoEngine.PentagoEngine(3, 4, 5, 2)
+    engine.apply((0, 0, 1, 'C'))
+    filled_row, filled_column = next((row, column) for row in range(6) for column in range(6)
+                                     if engine.get_cell(row, column) != PentagoEngine.BLANK)
+    for move in [(filled_row, filled_column, 1, 'C'), (6, 0, 1, 'C'), (0, 0, 5, 'C'), (0, 0, 0, 'C'),
+                 (0, 1, 1, 'X')]:
+        assert isinstance(engine.check_move(move), str)
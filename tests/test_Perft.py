@@ -0,0 +1,31 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks the perft counts of the engine, with and without merging moves that lead to the same
+#               position, against counts worked out by the naive rules in NaiveRules.py.
+#
+#               Example : python -m pytest -q tests/test_Perft.py
+
+# Importing pytest to run every check on every position.
+import pytest
+
+# Importing the module being checked.
+import Perft
+
+# Importing the naive rules the counts are checked against.
+from NaiveRules import NaiveRules
+
+
+@pytest.mark.parametrize('configuration, moves, depth', [
+    ((2, 4, 3, 2), '', 2),
+    ((2, 4, 3, 3), '', 2),
+    ((2, 4, 3, 2), '0,0,4,C;3,3,1,C', 2),
+    ((2, 4, 3, 3), '0,0,1,C;3,3,4,A;1,1,1,A;2,2,4,C;0,3,2,C;3,0,3,C', 2),
+])
+def test_perft_matches_the_naive_rules(configuration, moves, depth):
+    rules = NaiveRules(*configuration)
+    moves = Perft.parse_moves(moves)
+    board = rules.play(moves)
+    player = len(moves) % configuration[3]
+    engine = Perft.replay(configuration, moves)
+    assert Perft.perft(engine, depth) == rules.perft(board, player, depth)
+    assert Perft.perft(engine, depth, True) == rules.perft(board, player, depth, True)
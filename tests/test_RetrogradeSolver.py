@@ -0,0 +1,141 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks that solved layers read back from their files exactly as they were written, that a solve
+#               that is run again keeps the layers it already has, that slices of a layer hold consecutive ranks, that
+#               a pool of workers solves the same layers as one process, and that the solved values of the last layers
+#               match a plain minimax over the naive rules.
+#
+#               Example : python -m pytest -q tests/test_RetrogradeSolver.py
+
+# Importing os to list the files of a solution.
+import os
+
+# Importing random to pick the positions that are checked.
+import random
+
+# Importing NumPy for the tables.
+import numpy
+
+# Importing pytest to share one solve between the tests.
+import pytest
+
+# Importing the modules being checked.
+import PentagoEngine
+import RetrogradeSolver
+
+# Importing the naive rules the values are checked against.
+from NaiveRules import BLANK, NaiveRules
+
+
+CONFIGURATION = (2, 4, 3, 2)
+
+# The lowest layer that is solved.  Every layer from here to the full board is checked.
+MIN_LAYER = 13
+
+# How many random positions of every layer are checked against the minimax.
+POSITIONS = 12
+
+
+@pytest.fixture(scope='module')
+def solved(tmp_path_factory):
+    """Returns the directory of a solve of CONFIGURATION down to MIN_LAYER."""
+    directory = str(tmp_path_factory.mktemp('solved'))
+    RetrogradeSolver.solve(CONFIGURATION, directory, MIN_LAYER, workers=1, report=lambda line: None)
+    return directory
+
+
+def test_layers_read_back_as_written(tmp_path):
+    table = numpy.random.default_rng(0).integers(0, 3, size=5000).astype(numpy.uint8)
+    RetrogradeSolver.write_layer(str(tmp_path), 7, table)
+    assert numpy.array_equal(RetrogradeSolver.read_layer(str(tmp_path), 7), table)
+
+    # A layer written a piece at a time is the same, and so is its raw copy.
+    with RetrogradeSolver.LayerWriter(str(tmp_path), 8) as writer:
+        for start in range(0, len(table), 1234):
+            writer.write(table[start:start + 1234])
+    assert numpy.array_equal(RetrogradeSolver.read_layer(str(tmp_path), 8), table)
+    raw_path = RetrogradeSolver.unpack_layer(str(tmp_path), 8)
+    assert numpy.array_equal(numpy.fromfile(raw_path, dtype=numpy.uint8), table)
+
+
+@pytest.mark.parametrize('layer', [0, 1, 5, 8, 15, 16])
+def test_every_slice_of_a_layer_holds_consecutive_ranks(layer):
+    ranking = RetrogradeSolver.get_ranking(CONFIGURATION)
+    row_count = ranking.row_count(layer)
+    splits = ranking.layer_size(layer) // row_count
+    for first_row in sorted({0, row_count // 3, row_count - 1}):
+        count = min(7, row_count - first_row)
+        first, second = ranking.layer_positions(layer, first_row, count)
+        assert not numpy.any(first & second)
+        assert all(bin(int(board)).count('1') == layer for board in first | second)
+        assert ranking.rank(first | second, second, layer).tolist() == \
+            list(range(first_row * splits, (first_row + count) * splits))
+
+
+def test_a_solve_run_again_keeps_its_layers(solved):
+    index = RetrogradeSolver.read_index(solved)
+    assert sorted(int(layer) for layer in index['layers']) == list(range(MIN_LAYER, 17))
+    reports = []
+    assert RetrogradeSolver.solve(CONFIGURATION, solved, MIN_LAYER, workers=1, report=reports.append) == index
+    assert not reports
+    with pytest.raises(ValueError):
+        RetrogradeSolver.solve((2, 4, 4, 2), solved, 16, workers=1, report=reports.append)
+
+
+def test_a_pool_of_workers_solves_the_same_layers(solved, tmp_path):
+    directory = str(tmp_path)
+    RetrogradeSolver.solve(CONFIGURATION, directory, MIN_LAYER, workers=2, report=lambda line: None)
+    for layer in range(MIN_LAYER, 17):
+        assert numpy.array_equal(RetrogradeSolver.read_layer(directory, layer),
+                                 RetrogradeSolver.read_layer(solved, layer))
+    assert sorted(os.listdir(directory)) == sorted(os.listdir(solved))
+
+
+def test_values_match_a_naive_minimax(solved):
+    rules = NaiveRules(*CONFIGURATION)
+    board_length = rules.board_length
+    ranking = RetrogradeSolver.get_ranking(CONFIGURATION)
+    tables = RetrogradeSolver.SolvedTables(solved)
+    generator = random.Random(0)
+    memo = {}
+    for layer in range(MIN_LAYER, board_length * board_length + 1):
+        for position in range(POSITIONS):
+
+            # Placing the layer's marbles at random.  The first player has one more when the count is odd.
+            nodes = generator.sample(range(board_length * board_length), layer)
+            first = nodes[:(layer + 1) // 2]
+            second = nodes[(layer + 1) // 2:]
+            board = tuple(tuple(0 if row * board_length + column in first else
+                                (1 if row * board_length + column in second else BLANK)
+                                for column in range(board_length)) for row in range(board_length))
+            boards = (sum(1 << node for node in first), sum(1 << node for node in second))
+            found_layer, rank = ranking.rank_boards(boards)
+            assert found_layer == layer
+            assert tables.get_layer(layer)[rank] == rules.value(board, layer % 2, memo)
+
+
+def test_games_can_probe_the_tables(solved):
+    tables = RetrogradeSolver.SolvedTables(solved)
+    engine = PentagoEngine.PentagoEngine(*CONFIGURATION)
+    assert tables.probe(engine) is None
+    assert tables.probe(PentagoEngine.PentagoEngine(2, 4, 4, 2)) is None
+
+    # Playing random moves that don't end the game until the position is in the solved layers.
+    generator = random.Random(0)
+    while engine.get_marble_count() < MIN_LAYER:
+        moves = list(engine.distinct_moves())
+        generator.shuffle(moves)
+        for move in moves:
+            engine.apply(move)
+            if not engine.is_terminal():
+                break
+            engine.undo()
+        else:
+            pytest.fail("Every move ends the game before the solved layers.")
+
+    # The tables' best move keeps the position's value, which is the value for the player to move next.
+    value = tables.probe(engine)
+    move, best = tables.best_move(engine)
+    assert best == value
+    engine.apply(move)
+    assert RetrogradeSolver.WIN - tables.probe(engine) == value
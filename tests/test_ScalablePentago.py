@@ -0,0 +1,135 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks the console game's printed board: every node of the rendered board shows what the engine
+#               holds, and the escape codes of redraw mode, written onto a pretend terminal after every move and undo,
+#               always leave it showing the same thing as printing the whole board from scratch.
+#
+#               Example : python -m pytest -q tests/test_ScalablePentago.py
+
+# Importing contextlib and io to answer the console game's questions and hide what it prints.
+import contextlib
+import io
+
+# Importing random for the moves and undos.
+import random
+
+# Importing re to read the escape codes.
+import re
+
+# Importing sys to answer the console game's questions from a string.
+import sys
+
+# Importing pytest to run every check on every configuration.
+import pytest
+
+# Importing the modules being checked.
+import PentagoEngine
+import ScalablePentago
+
+
+# Configurations with small and large boards, including one with columns past Z, and with 2 players and more.
+CONFIGURATIONS = [(2, 4, 3, 2), (3, 4, 5, 3), (2, 16, 4, 4), (7, 16, 5, 2)]
+
+# The escape codes the console game writes.
+ESCAPE_CODE = re.compile(r"\033\[(?:(\d+);(\d+)H|H\033\[2J|J)")
+
+
+class Screen:
+    """A pretend terminal that understands the escape codes the console game writes: clearing the screen, moving the
+    cursor, and clearing everything below the cursor."""
+
+    def __init__(self):
+        """Creates a blank screen with the cursor at the top left."""
+        self.lines = []
+        self.line = 0
+        self.column = 0
+
+    def write(self, text):
+        """Writes text and escape codes to the screen."""
+        position = 0
+        for code in ESCAPE_CODE.finditer(text):
+            self.write_text(text[position:code.start()])
+            position = code.end()
+            if code.group(0) == ScalablePentago.CLEAR_SCREEN:
+                self.lines = []
+                self.line = self.column = 0
+            elif code.group(0) == ScalablePentago.CLEAR_BELOW:
+                del self.lines[self.line + 1:]
+                if self.line < len(self.lines):
+                    self.lines[self.line] = self.lines[self.line][:self.column]
+            else:
+                self.line = int(code.group(1)) - 1
+                self.column = int(code.group(2)) - 1
+        self.write_text(text[position:])
+
+    def write_text(self, text):
+        """Writes plain text at the cursor, over whatever is there."""
+        for character in text:
+            if character == '\n':
+                self.line += 1
+                self.column = 0
+                continue
+            while len(self.lines) <= self.line:
+                self.lines.append("")
+            current = self.lines[self.line].ljust(self.column)
+            self.lines[self.line] = current[:self.column] + character + current[self.column + 1:]
+            self.column += 1
+
+    def get_text(self):
+        """Returns what the screen shows, without the blank lines and spaces at the end."""
+        return '\n'.join(line.rstrip() for line in self.lines).rstrip('\n')
+
+
+def make_console(configuration, monkeypatch):
+    """Returns a console game set up with the configuration, with every player a human."""
+    sub_board_length, sub_board_number, winning_length, player_count = configuration
+    power = {4: 1, 16: 2, 64: 3}[sub_board_number]
+    answers = "%d\n%d\n%d\n%d\n\n" % (sub_board_length, power, winning_length, player_count)
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(answers))
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ScalablePentago.ScalablePentago(redraw=True)
+
+
+def fresh_screen(console):
+    """Returns the text of a screen that the whole board was just printed on."""
+    screen = Screen()
+    screen.write(ScalablePentago.CLEAR_SCREEN + console.render_board())
+    return screen.get_text()
+
+
+@pytest.mark.parametrize('configuration', CONFIGURATIONS)
+def test_every_node_shows_what_the_engine_holds(configuration, monkeypatch):
+    console = make_console(configuration, monkeypatch)
+    engine = console.get_engine()
+    generator = random.Random(0)
+    board_length = engine.get_board_length()
+    while (engine.get_move_count() < 12) and not engine.is_terminal():
+        engine.apply(generator.choice(list(engine.legal_moves())))
+    lines = [line.split() for line in console.render_board().split('\n') if line.strip()]
+    assert lines[0] == [ScalablePentago.column_label(column) for column in range(board_length)]
+    assert len(lines) == board_length + 1
+    for row, line in enumerate(lines[1:]):
+        expected = ["#" if engine.get_cell(row, column) == PentagoEngine.BLANK else
+                    ScalablePentago.column_label(engine.get_cell(row, column)) for column in range(board_length)]
+        assert line == [str(row)] + expected
+
+
+@pytest.mark.parametrize('configuration', CONFIGURATIONS)
+def test_redrawing_matches_printing_the_whole_board(configuration, monkeypatch):
+    console = make_console(configuration, monkeypatch)
+    engine = console.get_engine()
+    generator = random.Random(1)
+    screen = Screen()
+    for step in range(60):
+
+        # Some turns make several moves before the board is redrawn, and some take moves back.
+        for change in range(generator.choice([1, 1, 2])):
+            if engine.get_history() and (engine.is_terminal() or generator.random() < 0.3):
+                engine.undo()
+            else:
+                engine.apply(generator.choice(list(engine.legal_moves())))
+        screen.write(console.redraw_board())
+        assert screen.get_text() == fresh_screen(console)
+
+        # The turn's text below the board is cleared by the next redraw.
+        screen.write("PLAYER A'S TURN\nRow of Marble Position : 3\n")
@@ -0,0 +1,95 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks the 8 symmetries of the board against the naive rules: moving a bitboard matches moving every
+#               node on its own, a moved move does in the moved position what the move does in the original, every
+#               symmetry is undone by its inverse, and every symmetric copy of a position has the same canonical form.
+#
+#               Example : python -m pytest -q tests/test_Symmetry.py
+
+# Importing random for the moves of the positions.
+import random
+
+# Importing pytest to run every check on every configuration.
+import pytest
+
+# Importing the modules being checked.
+import PentagoEngine
+import Symmetry
+
+# Importing the naive rules the moves are checked against.
+from NaiveRules import NaiveRules, engine_board
+
+
+# Configurations with different sub-board lengths, sub-board counts, and player counts.
+CONFIGURATIONS = [(2, 4, 3, 2), (3, 4, 5, 2), (2, 16, 4, 3), (4, 4, 4, 4)]
+
+# How many moves are played on every configuration.
+MOVES = 12
+
+
+def random_moves(configuration, seed):
+    """Returns the moves of a random game, cut off after MOVES moves or when the game ends."""
+    engine = PentagoEngine.PentagoEngine(*configuration)
+    generator = random.Random(seed)
+    while (engine.get_move_count() < MOVES) and not engine.is_terminal():
+        engine.apply(generator.choice(list(engine.legal_moves())))
+    return engine.get_history()
+
+
+def transform_naive(board, board_symmetry, symmetry):
+    """Returns a naive board with every node moved on its own by a symmetry."""
+    length = len(board)
+    cells = [[None] * length for row in range(length)]
+    for row in range(length):
+        for column in range(length):
+            new_row, new_column = board_symmetry.transform_position(row, column, symmetry)
+            cells[new_row][new_column] = board[row][column]
+    return tuple(tuple(row) for row in cells)
+
+
+@pytest.mark.parametrize('configuration', CONFIGURATIONS)
+def test_boards_and_moves_round_trip_under_every_symmetry(configuration):
+    rules = NaiveRules(*configuration)
+    engine = PentagoEngine.PentagoEngine(*configuration)
+    board_symmetry = Symmetry.get_board_symmetry(engine.get_board_length(), engine.get_sub_board_length())
+    for move in random_moves(configuration, 0):
+        board = engine_board(engine)
+        player = engine.get_current_player()
+        for symmetry in range(Symmetry.SYMMETRY_COUNT):
+            inverse = Symmetry.INVERSES[symmetry]
+
+            # Moving the bitboards matches moving every node, and the inverse moves them back.
+            moved = tuple(board_symmetry.transform_board(bits, symmetry) for bits in engine.get_boards())
+            assert tuple(board_symmetry.transform_board(bits, inverse) for bits in moved) == engine.get_boards()
+            moved_board = transform_naive(board, board_symmetry, symmetry)
+            for owner, bits in enumerate(moved):
+                assert bits == sum(1 << (row * rules.board_length + column)
+                                   for row in range(rules.board_length) for column in range(rules.board_length)
+                                   if moved_board[row][column] == owner)
+
+            # Playing the moved move in the moved position reaches the moved position of the move.
+            moved_move = board_symmetry.transform_move(move, symmetry)
+            assert board_symmetry.transform_move(moved_move, inverse) == move
+            assert rules.apply(moved_board, moved_move, player) == \
+                transform_naive(rules.apply(board, move, player), board_symmetry, symmetry)
+        engine.apply(move)
+
+
+@pytest.mark.parametrize('configuration', CONFIGURATIONS)
+def test_every_symmetric_copy_has_the_same_canonical_form(configuration):
+    moves = random_moves(configuration, 1)
+    engines = [PentagoEngine.PentagoEngine(*configuration) for symmetry in range(Symmetry.SYMMETRY_COUNT)]
+    board_symmetry = Symmetry.get_board_symmetry(engines[0].get_board_length(), engines[0].get_sub_board_length())
+    for move in moves:
+        for symmetry, engine in enumerate(engines):
+            engine.apply(board_symmetry.transform_move(move, symmetry))
+        forms = [Symmetry.canonical_form(engine) for engine in engines]
+        assert len({boards for boards, symmetry in forms}) == 1
+        assert len({Symmetry.canonical_hash(engine)[0] for engine in engines}) == 1
+
+        # The returned symmetry moves the position, with the player to move renamed to player 0, to the form.
+        for engine, (boards, symmetry) in zip(engines, forms):
+            player = engine.get_current_player()
+            player_count = engine.get_player_count()
+            relabelled = [engine.get_boards()[(player + offset) % player_count] for offset in range(player_count)]
+            assert tuple(board_symmetry.transform_board(bits, symmetry) for bits in relabelled) == boards
@@ -0,0 +1,123 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks that the threat counts the evaluator keeps up to date incrementally always match a full
+#               recount of the position, after random runs of moves and undos that the evaluator only follows every
+#               so often, and that the scores of a position's children match the scores of the positions the moves
+#               lead to.
+#
+#               Example : python -m pytest -q tests/test_ThreatEvaluator.py
+
+# Importing random for the moves and undos.
+import random
+
+# Importing pytest to run every check on every configuration.
+import pytest
+
+# Importing the modules being checked.
+import PentagoEngine
+import ThreatEvaluator
+
+# Importing the naive rules for the directions of the sequences.
+from NaiveRules import BLANK, DIRECTIONS, engine_board
+
+
+# Configurations with different sub-board lengths, sub-board counts, winning lengths, and player counts.
+CONFIGURATIONS = [(2, 4, 3, 2), (3, 4, 4, 3), (3, 4, 5, 2), (2, 16, 4, 4)]
+
+# How many moves and undos are made on every configuration, and how many moves of a position have their child's
+# score checked.
+STEPS = 300
+CHILD_MOVES = 48
+
+
+def recount(board, winning_length, player_count):
+    """Returns every player's threat counts in a naive board, in the form of ThreatEvaluator.get_counts, by looking
+    at every sequence from scratch."""
+    length = len(board)
+    counts = [[[0, 0, 0] for marbles in range(winning_length + 1)] for player in range(player_count)]
+    for row in range(length):
+        for column in range(length):
+            for row_step, column_step in DIRECTIONS:
+                nodes = [(row + row_step * step, column + column_step * step) for step in range(winning_length)]
+                if not all((0 <= node_row < length) and (0 <= node_column < length)
+                           for node_row, node_column in nodes):
+                    continue
+                players = {board[node_row][node_column] for node_row, node_column in nodes} - {BLANK}
+                if len(players) != 1:
+                    continue
+                player = players.pop()
+                marbles = sum(board[node_row][node_column] == player for node_row, node_column in nodes)
+
+                # An end neighbour is open when it's on the board and empty.
+                open_ends = 0
+                for end_row, end_column in ((row - row_step, column - column_step),
+                                            (nodes[-1][0] + row_step, nodes[-1][1] + column_step)):
+                    if (0 <= end_row < length) and (0 <= end_column < length) and \
+                            (board[end_row][end_column] == BLANK):
+                        open_ends += 1
+                counts[player][marbles][open_ends] += 1
+    return counts
+
+
+def weighted_totals(counts, weights):
+    """Returns every player's weighted worth of the threat counts."""
+    return [sum(weights[marbles][open_ends] * player_counts[marbles][open_ends]
+                for marbles in range(len(player_counts)) for open_ends in range(3)) for player_counts in counts]
+
+
+@pytest.mark.parametrize('configuration', CONFIGURATIONS)
+def test_incremental_counts_match_a_full_recount(configuration):
+    engine = PentagoEngine.PentagoEngine(*configuration)
+    winning_length = configuration[2]
+    player_count = configuration[3]
+    weights = ThreatEvaluator.make_weights(winning_length)
+    evaluator = ThreatEvaluator.ThreatEvaluator(engine)
+    generator = random.Random(sum(configuration))
+    for step in range(STEPS):
+
+        # Moving forward more often than back, so the runs reach positions with plenty of marbles.
+        if engine.get_history() and (engine.is_terminal() or generator.random() < 0.35):
+            engine.undo()
+        else:
+            engine.apply(generator.choice(list(engine.legal_moves())))
+
+        # The evaluator only catches up every few steps, so it has to follow several changes at once.
+        if generator.random() < 0.5:
+            continue
+        evaluator.follow(engine.get_boards())
+        counts = recount(engine_board(engine), winning_length, player_count)
+        assert [evaluator.get_counts(player) for player in range(player_count)] == counts
+        totals = weighted_totals(counts, weights)
+        assert evaluator.get_totals() == totals
+        player = engine.get_current_player()
+        assert evaluator.evaluate(engine, player) == 2 * totals[player] - sum(totals)
+
+
+@pytest.mark.parametrize('configuration', CONFIGURATIONS)
+def test_child_scores_match_the_positions_the_moves_lead_to(configuration):
+    engine = PentagoEngine.PentagoEngine(*configuration)
+    generator = random.Random(sum(configuration))
+    evaluator = ThreatEvaluator.ThreatEvaluator(engine)
+    for turn in range(6):
+        engine.apply(generator.choice(list(engine.legal_moves())))
+        if engine.is_terminal():
+            break
+        moves = list(engine.legal_moves())
+        moves = generator.sample(moves, min(CHILD_MOVES, len(moves)))
+        boards = engine.get_boards()
+        for player in range(configuration[3]):
+            children = evaluator.score_children(engine, moves, player)
+            assert engine.get_boards() == boards
+            for move, (score, winners) in zip(moves, children):
+                engine.apply(move)
+                expected = ThreatEvaluator.ThreatEvaluator(engine).evaluate(engine, player)
+                assert (score, winners) == (expected, sorted(engine.winners()))
+                engine.undo()
+
+
+def test_weights_of_the_wrong_shape_are_refused():
+    engine = PentagoEngine.PentagoEngine(3, 4, 5, 2)
+    with pytest.raises(ValueError):
+        ThreatEvaluator.ThreatEvaluator(engine, ThreatEvaluator.make_weights(4))
+    with pytest.raises(ValueError):
+        ThreatEvaluator.ThreatEvaluator(engine, [[1, 2]] * 6)
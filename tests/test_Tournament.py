@@ -0,0 +1,110 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks the tournament runner: every bot takes every seat, games are seeded by their names alone, a
+#               stopped tournament picks up where it left off and only plays the games that are missing, and the
+#               Elo estimates order the bots by their results and fit the scores between them.
+#
+#               Example : python -m pytest -q tests/test_Tournament.py
+
+# Importing collections to count the seats of every bot.
+import collections
+
+# Importing math for the rating difference a score should give.
+import math
+
+# Importing pytest for the approximate comparisons of ratings.
+import pytest
+
+# Importing the module being checked.
+import Tournament
+
+
+# Two bots that play quickly and make the same moves every time they get the same seed.
+BOTS = ['random', 'alphabeta:depth=1']
+
+
+def result(seats, winners):
+    """Returns a made up result with only the parts the ratings look at."""
+    return {'name': ",".join(seats), 'seats': seats, 'winners': winners}
+
+
+def without_times(results):
+    """Returns the results by name without how long they took, which changes every time a game is played."""
+    return {entry['name']: {key: value for key, value in entry.items() if key != 'seconds'} for entry in results}
+
+
+@pytest.mark.parametrize('bot_count, player_count', [(2, 2), (3, 2), (2, 3), (4, 3), (3, 4)])
+def test_every_bot_takes_every_seat_equally(bot_count, player_count):
+    seatings = Tournament.line_ups(bot_count, player_count)
+    assert len(set(seatings)) == len(seatings)
+    assert all(len(set(seating)) > 1 for seating in seatings)
+    for seat in range(player_count):
+        counts = collections.Counter(seating[seat] for seating in seatings)
+        assert len(counts) == bot_count
+        assert len(set(counts.values())) == 1
+
+
+def test_games_are_seeded_by_their_names():
+    games = Tournament.schedule(BOTS, [(2, 4, 3, 2), (2, 4, 3, 3)], 2, 9)
+    assert len(games) == 2 * (len(Tournament.line_ups(2, 2)) + len(Tournament.line_ups(2, 3)))
+    assert len({game['name'] for game in games}) == len(games)
+    assert games == Tournament.schedule(BOTS, [(2, 4, 3, 2), (2, 4, 3, 3)], 2, 9)
+    other_seeds = {game['seed'] for game in Tournament.schedule(BOTS, [(2, 4, 3, 2), (2, 4, 3, 3)], 2, 10)}
+    assert not other_seeds & {game['seed'] for game in games}
+
+    # Playing a game again gives the same game.
+    assert without_times([Tournament.play_game(games[0])]) == without_times([Tournament.play_game(games[0])])
+
+
+def test_a_stopped_tournament_only_plays_the_missing_games(tmp_path):
+    games = Tournament.schedule(BOTS, [(2, 4, 3, 2), (2, 4, 3, 3)], 1, 3)
+    path = str(tmp_path / 'results.jsonl')
+    full = Tournament.run_tournament(games, path, 1, lambda message: None)
+    assert len(full) == len(games)
+
+    # Stopping part way through writing a line, after a few games.
+    with open(path) as results_file:
+        lines = results_file.readlines()
+    with open(path, 'w') as results_file:
+        results_file.writelines(lines[:3])
+        results_file.write(lines[3][:len(lines[3]) // 2])
+
+    reports = []
+    resumed = Tournament.run_tournament(games, path, 1, reports.append)
+    assert reports[0] == "%d games scheduled, 3 already played, %d to play." % (len(games), len(games) - 3)
+    assert len(reports) == 1 + len(games) - 3
+    assert without_times(resumed) == without_times(full)
+    assert without_times(Tournament.read_results(path)) == without_times(full)
+    assert len(Tournament.read_results(path)) == len(games)
+
+    # Running it again plays nothing.
+    reports = []
+    assert len(Tournament.run_tournament(games, path, 1, reports.append)) == len(games)
+    assert reports == ["%d games scheduled, %d already played, 0 to play." % (len(games), len(games))]
+
+
+def test_ratings_follow_the_results():
+    results = [result(['a', 'b'], [0])] * 3 + [result(['b', 'a'], [0])] + \
+              [result(['b', 'c'], [0])] * 3 + [result(['c', 'b'], [0])] + \
+              [result(['a', 'c'], [0])] * 3 + [result(['a', 'c'], [])]
+    ratings = Tournament.elo_ratings(results)
+    assert ratings['a'] > ratings['b'] > ratings['c']
+    assert sum(ratings.values()) / 3 == pytest.approx(Tournament.ELO_BASE, abs=0.1)
+
+    # Between 2 bots, a score of 3 out of 4 is worth the difference where 3 times as much is expected.
+    ratings = Tournament.elo_ratings(results[:4])
+    assert ratings['a'] - ratings['b'] == pytest.approx(Tournament.ELO_SCALE * math.log10(3), abs=0.5)
+
+    # Even results and games without any other bot leave everyone at the base rating.
+    even = [result(['a', 'b'], [0]), result(['a', 'b'], [1]), result(['a', 'a', 'c'], [0, 1, 2])]
+    assert Tournament.elo_ratings(even) == {'a': Tournament.ELO_BASE, 'b': Tournament.ELO_BASE,
+                                            'c': Tournament.ELO_BASE}
+
+
+def test_pairwise_scores_skip_seats_with_the_same_bot():
+    scores = Tournament.pairwise_scores([result(['a', 'a', 'b'], [1]), result(['a', 'b', 'c'], [0, 2])])
+    assert scores == [('a', 'b', 0.5), ('a', 'b', 1.0), ('a', 'b', 1.0), ('a', 'c', 0.5), ('b', 'c', 0.0)]
+    assert Tournament.tally([result(['a', 'b', 'c'], [0, 2])]) == {
+        'a': {'games': 1, 'wins': 0, 'draws': 1, 'losses': 0},
+        'b': {'games': 1, 'wins': 0, 'draws': 0, 'losses': 1},
+        'c': {'games': 1, 'wins': 0, 'draws': 1, 'losses': 0}}
@@ -0,0 +1,62 @@
+
+# Developer : Kira Ash Stephenson (Solaas Ashen Onslaught)
+# Description : Checks that the transposition table gives back what was stored in it, and that two positions sharing a
+#               bucket are kept by the replacement scheme: the deep entry keeps the deeper result of the current
+#               search, the other entry takes everything else, and any result replaces a deep entry of an old search.
+#
+#               Example : python -m pytest -q tests/test_TranspositionTable.py
+
+# Importing the module being checked.
+import TranspositionTable
+
+
+def small_table():
+    """Returns a table with only a few buckets and its bucket count, so keys are easy to put in the same bucket."""
+    table = TranspositionTable.TranspositionTable(0.0001)
+    return table, table.get_entry_count() // 2
+
+
+def test_entries_read_back_as_stored():
+    table, buckets = small_table()
+    assert table.get_entry_count() == 2 * (int(0.0001 * 1024 * 1024) // (2 * TranspositionTable.BYTES_PER_ENTRY))
+    assert table.probe(5) is None
+    table.store(5, 3, -42, TranspositionTable.LOWER_BOUND, 17)
+    assert table.probe(5) == (3, -42, TranspositionTable.LOWER_BOUND, 17)
+    assert table.probe(5 + buckets) is None
+    assert table.get_hit_rate() == 1 / 3
+
+    # A result without a move keeps the move the position already had.
+    table.store(5, 4, 8, TranspositionTable.EXACT)
+    assert table.probe(5) == (4, 8, TranspositionTable.EXACT, 17)
+
+    table.clear()
+    assert table.probe(5) is None
+    assert TranspositionTable.TranspositionTable(0).get_entry_count() == 2
+
+
+def test_the_deep_entry_keeps_the_deepest_result():
+    table, buckets = small_table()
+    deep, shallow, newer = 7, 7 + buckets, 7 + 2 * buckets
+    table.store(deep, 6, 1, TranspositionTable.EXACT, 1)
+
+    # Shallower results of the same search go to the always-replaced entry, one after another.
+    table.store(shallow, 2, 2, TranspositionTable.EXACT, 2)
+    assert table.probe(shallow) == (2, 2, TranspositionTable.EXACT, 2)
+    table.store(newer, 3, 3, TranspositionTable.EXACT, 3)
+    assert table.probe(newer) == (3, 3, TranspositionTable.EXACT, 3)
+    assert table.probe(shallow) is None
+    assert table.probe(deep) == (6, 1, TranspositionTable.EXACT, 1)
+
+    # A result at least as deep takes the deep entry.
+    table.store(shallow, 6, 4, TranspositionTable.UPPER_BOUND, 4)
+    assert table.probe(shallow) == (6, 4, TranspositionTable.UPPER_BOUND, 4)
+    assert table.probe(deep) is None
+
+
+def test_a_new_search_can_replace_old_deep_entries():
+    table, buckets = small_table()
+    table.store(3, 9, 1, TranspositionTable.EXACT, 1)
+    table.new_search()
+    table.store(3 + buckets, 1, 2, TranspositionTable.EXACT, 2)
+    assert table.probe(3 + buckets) == (1, 2, TranspositionTable.EXACT, 2)
+    assert table.probe(3) is None